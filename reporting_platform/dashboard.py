@@ -6,17 +6,24 @@
     Author: Joshua David Golafshan
 """
 
-import utils
+import sys
 import os.path
+from pathlib import Path
+
+PROJECT_LOCATION = Path(__file__).resolve().parents[1]
+if str(PROJECT_LOCATION) not in sys.path:
+    sys.path.insert(0, str(PROJECT_LOCATION))  # streamlit only puts this script's directory on the path
+
+import utils
+import data_service
+import instrumentation_panel
 import numpy as np
 import pandas as pd
 import streamlit as st
-from streamlit_extras import *
-from pathlib import Path
-import plotly.express as px
-from sqlalchemy import create_engine
 from datetime import datetime, timedelta
-from sqlalchemy.engine.base import Engine
+
+# plotly is imported where used: every cold start would otherwise pay for it before the first
+# widget renders. Database access goes through data_service, which caches across reruns.
 
 
 @st.cache_resource
@@ -28,13 +35,6 @@ def inject_css_files():
     return st.markdown(utils.load_css(css_path), unsafe_allow_html=True)
 
 
-@st.cache_resource
-def get_db_connection() -> Engine:
-    mysql_data = st.secrets["mysql"]
-    uri = mysql_data["uri"]
-    return create_engine(uri)
-
-
 def time_selector_logic(time_frame):
     if time_frame == "Custom Range":
         start_date = st.date_input("Start Date", datetime.now().date() - timedelta(days=30))
@@ -53,18 +53,66 @@ def time_selector_logic(time_frame):
     return start_date, end_date
 
 
-def transaction_history(date_range):
+def transaction_history(trades: pd.DataFrame) -> pd.DataFrame:
     return pd.DataFrame({
-        "Pair": np.random.choice(["BTC-ETH", "ETH-USDT", "BTC-USDT"], size=len(date_range)),
-        "Entry Date": date_range,
-        "Exit Date": date_range + pd.to_timedelta(np.random.randint(1, 5, size=len(date_range)), unit='D'),
-        "Return": np.round(np.random.uniform(-0.05, 0.10, size=len(date_range)), 4)
+        "Pair": trades["stock_symbol"],
+        "Entry Date": trades["entry_datetime"],
+        "Exit Date": trades["exit_datetime"],
+        "Return": np.round(trades["trade_return"] * 100, 4),
     })
 
 
-def return_histogram():
-    fake_returns = np.random.normal(loc=0.02, scale=0.05, size=100)
-    fig = px.histogram(fake_returns, nbins=8)
+def paged_trade_table(start, end, symbols):
+    """
+    Trade table one page at a time. The cursors of the pages already visited are kept in session
+    state as a stack, so Next pushes the page's next_cursor and Previous pops back to the last one.
+    """
+    col1, col2, col3 = st.columns([0.2, 0.2, 0.6])
+    order = col1.selectbox("Order", options=["Newest first", "Oldest first"])
+    page_size = col2.selectbox("Rows per page", options=[25, 50, 100], index=1)
+    symbols = col3.multiselect("Pairs", options=symbols)
+
+    # Any change of window, filter or order invalidates the cursors held.
+    key = (start, end, order, page_size, tuple(symbols))
+    if st.session_state.get("trade_page_key") != key:
+        st.session_state.trade_page_key = key
+        st.session_state.trade_page_cursors = [None]
+    cursors = st.session_state.trade_page_cursors
+
+    page, trades = data_service.trade_page(start, end, cursors[-1], page_size, tuple(symbols),
+                                           descending=order == "Newest first")
+    st.dataframe(
+        transaction_history(trades),
+        use_container_width=True,
+        height=300,
+        hide_index=True,
+        on_select="ignore",
+        column_config={
+            "Return": st.column_config.NumberColumn(
+                "Return (%)",
+                help="Strategy return as a percentage",
+                min_value=0.0,
+                max_value=100.0,
+                step=0.01,
+                format="%.2f%%",  # <-- Correct format for percent with 2 decimals
+            )
+        },
+    )
+
+    col1, col2, col3 = st.columns([0.1, 0.1, 0.8], vertical_alignment="center")
+    if col1.button("Previous", disabled=len(cursors) == 1):
+        cursors.pop()
+        st.rerun()
+    if col2.button("Next", disabled=page.next_cursor is None):
+        cursors.append(page.next_cursor)
+        st.rerun()
+    col3.caption(f"Page {len(cursors)}")
+
+
+def return_histogram(returns):
+    import plotly.express as px
+
+    fig = px.histogram(np.asarray(returns, dtype=float), nbins=8)
     fig.update_layout(
         showlegend=False,
         margin=dict(l=4, r=4, t=6, b=4),
@@ -89,7 +137,6 @@ def return_histogram():
 
 def main():
     inject_css_files()
-    db = get_db_connection()
 
     # Header
     st.set_page_config(page_title="Algo Trading Dashboard", layout="wide")
@@ -101,15 +148,23 @@ def main():
                                 options=["Last 7 days", "Last 30 days", "Last 90 days", "Custom Range"])
 
     tf_logic = time_selector_logic(time_frame)
-    date_range = pd.date_range(start=tf_logic[0], end=tf_logic[1])
+    if tf_logic is None:
+        return
+    trades = data_service.trade_history(*tf_logic)
+    current = data_service.summary(*tf_logic)
+    previous = data_service.summary(*data_service.previous_window(*tf_logic))
 
     # Metrics
-    col1, col2, col3 = st.columns([0.2, 0.2, 0.2], gap="small", vertical_alignment="center")
-    col1.metric("PnL", "1.70", "+1.2%", delta_color="normal", help="Profit/Loss Ratio")
-    col2.metric("W/L", "1.12", "-8%", delta_color="inverse", help="Winning vs Losing Trades")
-    col3.metric("Returns", "86%", "+4%", delta_color="normal", help="Cumulative return")
+    col1, col2, col3, col4 = st.columns([0.2, 0.2, 0.2, 0.2], gap="small", vertical_alignment="center")
+    col1.metric("PnL", f"{current['pnl']:,.2f}", f"{current['pnl'] - previous['pnl']:+,.2f}",
+                delta_color="normal", help="Realised PnL vs the previous period of the same length")
+    col2.metric("W/L", f"{current['win_loss']:.2f}", f"{current['win_loss'] - previous['win_loss']:+.2f}",
+                delta_color="normal", help="Winning vs Losing Trades")
+    col3.metric("Returns", f"{current['return']:.2%}", f"{current['return'] - previous['return']:+.2%}",
+                delta_color="normal", help="PnL over entry notional")
 
-    # col4.plotly_chart(fig, use_container_width=True)
+    if len(trades):
+        col4.plotly_chart(return_histogram(trades["trade_return"].dropna()), use_container_width=True)
 
     st.divider()
 
@@ -121,23 +176,11 @@ def main():
     </div>
     """, unsafe_allow_html=True)
 
-    st.dataframe(
-        transaction_history(date_range),
-        use_container_width=True,
-        height=300,
-        hide_index=True,
-        on_select="ignore",
-        column_config={
-            "Return": st.column_config.NumberColumn(
-                "Return (%)",
-                help="Strategy return as a percentage",
-                min_value=0.0,
-                max_value=100.0,
-                step=0.01,
-                format="%.2f%%",  # <-- Correct format for percent with 2 decimals
-            )
-        },
-    )
+    paged_trade_table(*tf_logic, sorted(trades["stock_symbol"].astype(str).unique()))
+
+    with st.expander("Latency"):
+        instrumentation_panel.render(st.secrets.get("instrumentation", {}).get(
+            "url", instrumentation_panel.DEFAULT_METRICS_URL))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Cached dashboard data: one incrementally refreshed trade history per server, TTL-cached windows.
+"""
+
+from datetime import date, datetime, time, timedelta
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+REFRESH_SECONDS = 30
+
+
+@st.cache_resource
+def get_database():
+    from src.core.database import TradingDatabase
+
+    return TradingDatabase(st.secrets["mysql"]["uri"])
+
+
+@st.cache_resource
+def history_cache():
+    """Shared by every session; holds the full closed-trade frame and its watermark."""
+    from src.core.history_cache import TradeHistoryCache
+
+    return TradeHistoryCache(get_database())
+
+
+@st.cache_data(ttl=REFRESH_SECONDS, show_spinner=False)
+def trade_history(start: date, end: date) -> pd.DataFrame:
+    """
+    Trades that closed between `start` and `end` inclusive.
+
+    Cached per (start, end) for REFRESH_SECONDS. On a miss the shared history first pulls positions
+    closed since its watermark, then the window is cut out of it with a binary search, so widget
+    interactions never re-query history already held.
+    """
+    cache = history_cache()
+    cache.refresh()
+    frame = cache.window(start, end + timedelta(days=1))
+    notional = (frame["entry_price"] * frame["quantity"]).abs()
+    return frame.assign(trade_return=frame["pnl"] / notional.where(notional > 0))
+
+
+@st.cache_data(ttl=REFRESH_SECONDS, show_spinner=False)
+def summary(start: date, end: date) -> dict:
+    """PnL, win/loss ratio and return on entry notional for the window."""
+    frame = trade_history(start, end)
+    pnl = frame["pnl"].to_numpy(dtype=np.float64)
+    wins, losses = int((pnl > 0).sum()), int((pnl < 0).sum())
+    notional = float((frame["entry_price"] * frame["quantity"]).abs().sum())
+    return {
+        "pnl": float(np.nansum(pnl)),
+        "trades": len(frame),
+        "win_loss": wins / losses if losses else float(wins),
+        "return": float(np.nansum(pnl)) / notional if notional else 0.0,
+    }
+
+
+def trade_page(start: date, end: date, cursor: tuple = None, page_size: int = 50, symbols: tuple = (),
+               descending: bool = True):
+    """
+    One page of the trade table straight from the database via its (exit_datetime, id) cursor.
+
+    Not cached: each page is an index seek of page_size + 1 rows, so it costs the same on page 1
+    as on page 1,000, and it always reflects trades closed since the last refresh.
+    """
+    start, end = datetime.combine(start, time()), datetime.combine(end + timedelta(days=1), time())
+    page = get_database().get_trade_page(cursor, page_size, start, end, list(symbols), descending)
+    frame = page.trades
+    notional = (frame["entry_price"] * frame["quantity"]).abs()
+    return page, frame.assign(trade_return=frame["pnl"] / notional.where(notional > 0))
+
+
+def previous_window(start: date, end: date) -> tuple[date, date]:
+    """The window of the same length immediately before [start, end], for metric deltas."""
+    length = end - start + timedelta(days=1)
+    return start - length, start - timedelta(days=1)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Streamlit panel showing latency histograms scraped from the trader's metrics endpoint.
+"""
+
+import urllib.request
+
+import pandas as pd
+import streamlit as st
+
+from src.utils.instrumentation import DEFAULT_PORT, parse_prometheus, bucket_quantile
+
+DEFAULT_METRICS_URL = f"http://127.0.0.1:{DEFAULT_PORT}/metrics"
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def scrape(url: str) -> str:
+    with urllib.request.urlopen(url, timeout=1.0) as response:
+        return response.read().decode()
+
+
+def latency_table(text: str) -> pd.DataFrame:
+    rows = []
+    for (name, labels), (bounds, cumulative, total) in sorted(parse_prometheus(text).items()):
+        count = cumulative[-1] if cumulative else 0
+        if not count:
+            continue
+        row = {"Metric": name.removesuffix("_seconds"), "Labels": ", ".join(f"{k}={v}" for k, v in labels),
+               "Count": int(count), "Mean (ms)": total / count * 1e3}
+        for q in (0.5, 0.9, 0.99):
+            row[f"p{q * 100:g} (ms)"] = bucket_quantile(q, bounds, cumulative) * 1e3
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def render(url: str = DEFAULT_METRICS_URL) -> None:
+    """Latency percentiles per instrumented stage; a note instead when the trader is not running."""
+    try:
+        text = scrape(url)
+    except OSError as e:
+        st.info(f"Metrics endpoint {url} unreachable ({e}).")
+        return
+
+    table = latency_table(text)
+    if table.empty:
+        st.info("No latencies recorded yet.")
+        return
+    st.dataframe(table, use_container_width=True, hide_index=True,
+                 column_config={c: st.column_config.NumberColumn(format="%.3f") for c in table.columns
+                                if c.endswith("(ms)")})
@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Rebuilds the daily_pnl rollup from existing position history.
+
+    Usage: python -m scripts.backfill_daily_pnl [--database-uri URI]
+"""
+
+import argparse
+
+from src.core.database import TradingDatabase
+from src.core.application_constants import DATABASE_URI
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the daily_pnl rollup table.")
+    parser.add_argument("--database-uri", default=DATABASE_URI)
+    args = parser.parse_args()
+
+    db = TradingDatabase(database_uri=args.database_uri)
+    buckets = db.backfill_daily_pnl()
+    db.dispose()
+
+    print(f"daily_pnl rebuilt with {buckets} (day, symbol) rows.")
+
+
+if __name__ == "__main__":
+    main()
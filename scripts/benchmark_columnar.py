@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Compares the ORM trade-history path (rows -> pandas) with the chunked columnar fetch.
+
+    Each case runs in its own interpreter so the reported peak RSS belongs to that case alone.
+
+    Usage: python -m scripts.benchmark_columnar --positions 500000
+"""
+
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+import psutil
+
+
+def peak_rss_mb() -> float:
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    except ImportError:
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+
+
+def run_case(case: str, database_uri: str) -> dict:
+    import pandas as pd
+    from src.core.database import TradingDatabase
+
+    db = TradingDatabase(database_uri=database_uri)
+    baseline = psutil.Process().memory_info().rss / (1024 * 1024)
+
+    start = time.perf_counter()
+    if case == "orm":
+        rows = db.get_trade_history()
+        frame = pd.DataFrame(rows, columns=list(rows[0]._fields) if rows else None)
+    else:
+        frame = db.get_trade_history(as_frame=True)
+    elapsed = time.perf_counter() - start
+
+    return {"case": case, "rows": len(frame), "seconds": elapsed,
+            "rows_per_sec": len(frame) / elapsed if elapsed else 0.0,
+            "baseline_rss_mb": baseline, "peak_rss_mb": peak_rss_mb()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ORM vs columnar trade history fetch.")
+    parser.add_argument("--positions", type=int, default=200_000)
+    parser.add_argument("--case", choices=["orm", "columnar"], help=argparse.SUPPRESS)
+    parser.add_argument("--database-uri", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(args.case, args.database_uri)))
+        return
+
+    from src.core.database import TradingDatabase
+    from scripts.benchmark_utils import seed_closed_positions
+
+    with tempfile.TemporaryDirectory() as tmp:
+        uri = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        db = TradingDatabase(database_uri=uri)
+        seed_closed_positions(db, args.positions)
+        db.dispose()
+
+        for case in ("orm", "columnar"):
+            out = subprocess.run(
+                [sys.executable, "-m", "scripts.benchmark_columnar", "--case", case,
+                 "--database-uri", uri],
+                capture_output=True, text=True, check=True,
+            )
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+            print(f"{r['case']:<9} rows={r['rows']:<8} {r['rows_per_sec']:>12,.0f} rows/s  "
+                  f"peak RSS {r['peak_rss_mb']:.0f} MB (+{r['peak_rss_mb'] - r['baseline_rss_mb']:.0f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Import-time regression check using `python -X importtime` in fresh interpreters.
+
+    Each module is imported in a new process with socket connections disabled, so any network call
+    at import fails the check, as does pulling in a package listed in DEFERRED for it. Times are
+    the best of --repeat runs; --budget-scale multiplies the per-module budgets (slow CI machines).
+
+    Usage: python -m scripts.benchmark_imports [--repeat 5] [--budget-scale 1.0] [--top 5] [module ...]
+"""
+
+import sys
+import json
+import argparse
+import subprocess
+
+# module -> (budget in ms, packages it must not import eagerly)
+DEFERRED = {
+    "src.core.application_constants": (15, {"dotenv", "configparser"}),
+    "src.core.bootstrap": (30, {"dotenv", "binance", "sqlalchemy", "pandas"}),
+    "src.trading.trading": (30, {"binance", "requests", "dotenv"}),
+    "src.utils.logging_config": (60, {"pythonjsonlogger", "smtplib"}),
+    "src.core.database": (600, {"pandas", "dotenv"}),
+    "src.core.journal": (700, {"pandas", "dotenv"}),
+    "src.core.kline_store": (200, {"pandas", "dotenv"}),
+    "src.trading.order_gateway": (600, {"pandas", "binance", "dotenv"}),
+    "src.trading.ingestion": (250, {"pandas", "binance", "dotenv"}),
+}
+
+PROBE_IMPORTS = {"json", "socket", "selectors", "time"}
+PROBE = """
+import json, socket, sys, time
+
+def _no_network(*args, **kwargs):
+    raise RuntimeError("network access at import time")
+
+socket.socket.connect = socket.socket.connect_ex = _no_network
+socket.create_connection = socket.getaddrinfo = _no_network
+started = time.perf_counter()
+error = None
+try:
+    import {module}
+except Exception as e:
+    error = f"{{type(e).__name__}}: {{e}}"
+print(json.dumps({{"ms": (time.perf_counter() - started) * 1e3, "error": error,
+                  "modules": sorted({{name.split(".")[0] for name in sys.modules}})}}))
+"""
+
+
+def probe(module: str) -> tuple[dict, list]:
+    """Returns the probe result and (cumulative us, package) for top-level imports under -X importtime."""
+    done = subprocess.run([sys.executable, "-X", "importtime", "-c", PROBE.format(module=module)],
+                          capture_output=True, text=True)
+    result = json.loads(done.stdout.strip().splitlines()[-1])
+
+    heaviest = {}
+    for line in done.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.startswith("  ") and not name.startswith("    "):  # direct imports of the probe
+            package = name.strip().split(".")[0]
+            if package in PROBE_IMPORTS:
+                continue
+            heaviest[package] = max(heaviest.get(package, 0), int(cumulative))
+    return result, sorted(((us, p) for p, us in heaviest.items()), reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time regression benchmark.")
+    parser.add_argument("modules", nargs="*", default=list(DEFERRED))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-scale", type=float, default=1.0)
+    parser.add_argument("--top", type=int, default=5, help="Heaviest top-level imports to list per module.")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'module':<34}{'best ms':>9}{'budget':>8}  heaviest imports (cumulative ms)")
+    for module in args.modules:
+        budget, deferred = DEFERRED.get(module, (float("inf"), set()))
+        budget *= args.budget_scale
+        runs = [probe(module) for _ in range(args.repeat)]
+        result, heaviest = min(runs, key=lambda run: run[0]["ms"])
+
+        listed = ", ".join(f"{p} {us / 1e3:.0f}" for us, p in heaviest[:args.top])
+        print(f"{module:<34}{result['ms']:>9.1f}{budget:>8.0f}  {listed}")
+
+        if result["error"]:
+            failures.append(f"{module}: import failed ({result['error']})")
+        if result["ms"] > budget:
+            failures.append(f"{module}: {result['ms']:.1f} ms exceeds the {budget:.0f} ms budget")
+        eager = deferred & set(result["modules"])
+        if eager:
+            failures.append(f"{module}: imports {', '.join(sorted(eager))} eagerly")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
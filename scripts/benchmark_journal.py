@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Persistence latency on the trading path: synchronous ORM commits against the write-behind journal.
+
+    Each event is one signal followed by the order it triggers, as the live loop would record them.
+    Runs against DATABASE_URI unless --database is given.
+
+    Usage: python -m scripts.benchmark_journal [--events 2000] [--database sqlite:///bench.db] [--no-fsync]
+"""
+
+import time
+import argparse
+import datetime
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from src.core.application_constants import DATABASE_URI
+from src.core.database import TradingDatabase
+from src.core.database_models import Signal, Order
+from src.core.journal import TradeJournal
+from src.utils.enums import SignalType, OrderType, OrderSide, StatusType
+
+
+def event(i: int):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    signal = Signal(stock_symbol=f"SYM{i % 50}", signal_type=SignalType.BUY, confidence=1.0, signal_datetime=now)
+    order = Order(stock_symbol=signal.stock_symbol, order_type=OrderType.MARKET, side=OrderSide.BUY,
+                  quantity=1.0, price=100.0, status=StatusType.PENDING, submission_datetime=now)
+    return signal, order
+
+
+def synchronous(db: TradingDatabase, events: int) -> np.ndarray:
+    latencies = np.empty(events)
+    with db.get_session() as session:
+        for i in range(events):
+            started = time.perf_counter()
+            signal, order = event(i)
+            session.add(signal)
+            session.flush()
+            order.signal_id = signal.id
+            session.add(order)
+            session.commit()
+            latencies[i] = time.perf_counter() - started
+    return latencies
+
+
+def journaled(db: TradingDatabase, events: int, directory: Path, fsync: bool) -> tuple[np.ndarray, float]:
+    latencies = np.empty(events)
+    with TradeJournal(db, directory, fsync=fsync) as journal:
+        for i in range(events):
+            started = time.perf_counter()
+            signal, order = event(i)
+            order.signal_id = journal.add(signal)
+            journal.add(order)
+            latencies[i] = time.perf_counter() - started
+        drain_started = time.perf_counter()
+        journal.flush()
+        drained = time.perf_counter() - drain_started
+    return latencies, drained
+
+
+def report(label: str, latencies: np.ndarray) -> None:
+    p50, p99, worst = np.percentile(latencies, [50, 99, 100]) * 1e3
+    print(f"  {label:<26}{p50:>9.3f}{p99:>9.3f}{worst:>9.3f}{len(latencies) / latencies.sum():>12,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Trading-path persistence latency benchmark.")
+    parser.add_argument("--events", type=int, default=2_000)
+    parser.add_argument("--database", default=DATABASE_URI)
+    parser.add_argument("--no-fsync", action="store_true", help="Skip the per-append fsync of the journal.")
+    args = parser.parse_args()
+
+    db = TradingDatabase(args.database)
+    db._generate_tables()
+    print(f"{args.events:,} signal + order events, latency per event in ms:")
+    print(f"  {'':<26}{'p50':>9}{'p99':>9}{'max':>9}{'events/s':>12}")
+    report("synchronous ORM commit", synchronous(db, args.events))
+    with tempfile.TemporaryDirectory() as scratch:
+        latencies, drained = journaled(db, args.events, Path(scratch), not args.no_fsync)
+    report("journal append", latencies)
+    print(f"  journal drained to the database {drained:.3f}s after the last append")
+    db.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Per-call logging latency under load, direct handlers against the queued mode.
+
+    Worker threads log as fast as they can while the caller's latency per logger.info is sampled.
+    Stream output goes to /dev/null, so the numbers reflect formatting and file I/O only.
+
+    Usage: python -m scripts.benchmark_logging [--calls 20000] [--threads 4] [--queue-size 10000]
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import tempfile
+import threading
+
+import numpy as np
+
+from src.utils.enums import LogOverflowPolicy
+from src.utils.logging_config import init_logging, stop_logging, BoundedQueueHandler, JSON_LOGGING_AVAILABLE
+
+
+def measure(calls: int, threads: int) -> np.ndarray:
+    logger = logging.getLogger("benchmark")
+    latencies = np.empty(calls)
+    per_thread = calls // threads
+    start = threading.Barrier(threads)
+
+    def work(k: int) -> None:
+        start.wait()
+        for i in range(k * per_thread, (k + 1) * per_thread):
+            t0 = time.perf_counter()
+            logger.info("tick %d pair %s z=%.3f", i, "BTCUSDT_ETHUSDT", 1.234, extra={"pair_id": i % 50})
+            latencies[i] = time.perf_counter() - t0
+
+    workers = [threading.Thread(target=work, args=(k,)) for k in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return latencies[:per_thread * threads]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Logging latency benchmark.")
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--queue-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    modes = [("direct, text", {}), ("queued, text", {"queued": True}),
+             ("direct, orjson", {"use_json": True, "json_backend": "orjson"}),
+             ("queued, orjson", {"use_json": True, "json_backend": "orjson", "queued": True})]
+    if JSON_LOGGING_AVAILABLE:
+        modes.insert(2, ("direct, python-json-logger", {"use_json": True}))
+
+    devnull = open(os.devnull, "w")
+    stderr, sys.stderr = sys.stderr, devnull  # StreamHandler binds sys.stderr when it is created
+    rows = []
+    try:
+        with tempfile.TemporaryDirectory() as scratch:
+            for label, options in modes:
+                init_logging(os.path.join(scratch, label.replace(", ", "_")), queue_size=args.queue_size,
+                             overflow=LogOverflowPolicy.DROP_NEW, **options)
+                logging.getLogger().setLevel(logging.INFO)
+                latencies = measure(args.calls, args.threads)
+                handler = logging.root.handlers[0]
+                dropped = handler.dropped if isinstance(handler, BoundedQueueHandler) else 0
+                drain = time.perf_counter()
+                stop_logging()
+                drained = time.perf_counter() - drain if options.get("queued") else 0.0
+                rows.append((label, *np.percentile(latencies, [50, 99, 99.9]) * 1e6, dropped, drained))
+    finally:
+        sys.stderr = stderr
+        logging.root.handlers.clear()
+
+    print(f"{args.calls:,} logger.info calls from {args.threads} threads, latency per call in us:")
+    print(f"  {'':<28}{'p50':>9}{'p99':>9}{'p99.9':>9}{'dropped':>9}{'drain s':>9}")
+    for label, p50, p99, p999, dropped, drained in rows:
+        print(f"  {label:<28}{p50:>9.1f}{p99:>9.1f}{p999:>9.1f}{dropped:>9}{drained:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
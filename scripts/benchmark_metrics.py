@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Compares the per-KPI TradingDatabase calls against the single aggregate get_metrics query,
+                 and the tuple-list cumulative returns against the set-based DataFrame variant.
+
+    Usage: python -m scripts.benchmark_metrics --positions 200000
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from src.core.database import TradingDatabase
+from src.utils.enums import QueryMode
+from scripts.benchmark_utils import seed_closed_positions, count_round_trips
+
+
+def run_per_kpi(db: TradingDatabase, duration=None):
+    db.get_pnl(duration)
+    db.get_win_loss_ratio(duration)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--positions", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--query-mode", choices=[m.value for m in QueryMode], default=QueryMode.JOINED.value)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = TradingDatabase(database_uri=f"sqlite:///{Path(tmp) / 'bench.db'}",
+                             query_mode=QueryMode(args.query_mode))
+        seed_closed_positions(db, args.positions)
+
+        cases = (
+            ("per-KPI calls", lambda: run_per_kpi(db)),
+            ("get_metrics", db.get_metrics),
+            ("get_metrics+cumm", lambda: db.get_metrics(include_returns=True)),
+            ("cumm (list)", db.get_cumm_returns),
+            ("cumm (frame)", db.get_cumm_returns_frame),
+        )
+        for label, fn in cases:
+            best = None
+            for _ in range(args.repeat):
+                with count_round_trips(db.engine) as stats:
+                    fn()
+                best = stats if best is None or stats["seconds"] < best["seconds"] else best
+            print(f"{label:<18} statements={best['statements']:<3} best={best['seconds'] * 1000:.1f} ms")
+
+        db.dispose()
+
+
+if __name__ == "__main__":
+    main()
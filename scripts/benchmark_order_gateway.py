@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Latency, throughput and failure-handling benchmark of the order gateway against the mock exchange.
+
+    Usage: python -m scripts.benchmark_order_gateway [--pairs 100] [--latency-ms 20] [--order-limit 50]
+               [--order-window 1.0] [--reject-rate 0.05] [--partial-rate 0.05]
+"""
+
+import time
+import asyncio
+import logging
+import argparse
+import statistics
+from collections import Counter
+
+from src.trading.order_gateway import OrderGateway, MockExchange, RateLimiter, LegOrder
+from src.utils.enums import OrderSide
+
+
+def make_exchange(args, reject_rate=0.0, partial_rate=0.0, limited=True) -> MockExchange:
+    prices = {f"SYM{i}A": 100.0 + i for i in range(args.pairs)} | {f"SYM{i}B": 50.0 + i for i in range(args.pairs)}
+    return MockExchange(prices, latency=args.latency_ms / 1e3, jitter=args.latency_ms / 4e3,
+                        reject_rate=reject_rate, partial_rate=partial_rate,
+                        order_limit=(args.order_limit, args.order_window) if limited else (10 ** 9, 1.0), seed=1)
+
+
+def legs(i: int) -> tuple:
+    return LegOrder(f"SYM{i}A", OrderSide.BUY, 1.0), LegOrder(f"SYM{i}B", OrderSide.SELL, 2.0)
+
+
+async def leg_gaps(args) -> None:
+    gateway = await OrderGateway.connect(make_exchange(args, limited=False),
+                                         limiter=RateLimiter(order_limits=((10 ** 9, 1.0),)))
+    sequential, concurrent = [], []
+    for i in range(min(args.pairs, 50)):
+        a, b = legs(i)
+        fill_a = await gateway.submit(a)
+        fill_b = await gateway.submit(b)
+        sequential.append(abs(fill_b.acked_at - fill_a.acked_at))
+        concurrent.append((await gateway.submit_pair(a, b)).leg_gap)
+
+    print(f"leg gap (one-legged exposure), mean over {len(concurrent)} pairs:")
+    print(f"  sequential create_order calls {statistics.mean(sequential) * 1e3:8.2f} ms")
+    print(f"  concurrent submit_pair        {statistics.mean(concurrent) * 1e3:8.2f} ms")
+
+
+async def throughput(args, limiter: RateLimiter, label: str) -> None:
+    gateway = await OrderGateway.connect(make_exchange(args), limiter=limiter)
+    start = time.perf_counter()
+    executions = await asyncio.gather(*(gateway.submit_pair(*legs(i)) for i in range(args.pairs)))
+    elapsed = time.perf_counter() - start
+
+    rejected_by_limit = sum(1 for e in executions for leg in e.legs if leg.error and "-1015" in leg.error)
+    print(f"  {label:<22}{args.pairs / elapsed:>10,.1f} pairs/s{elapsed:>9.2f} s"
+          f"{rejected_by_limit:>8} legs rejected by exchange rate limit")
+
+
+async def failures(args) -> None:
+    gateway = await OrderGateway.connect(make_exchange(args, args.reject_rate, args.partial_rate),
+                                         limiter=RateLimiter(order_limits=((args.order_limit, args.order_window),)))
+    executions = await asyncio.gather(*(gateway.submit_pair(*legs(i)) for i in range(args.pairs)))
+    counts = Counter(e.status.value for e in executions)
+    unwinds = sum(len(e.unwinds) for e in executions)
+    print(f"  outcomes {dict(counts)}, {unwinds} unwind orders")
+
+
+async def main_async(args) -> None:
+    await leg_gaps(args)
+    print(f"throughput, {args.pairs} pairs at once, exchange limit {args.order_limit} orders / {args.order_window}s:")
+    await throughput(args, RateLimiter(order_limits=((10 ** 9, 1.0),)), "no client limiter")
+    await throughput(args, RateLimiter(order_limits=((args.order_limit, args.order_window),)), "client limiter")
+    print(f"failure handling, reject rate {args.reject_rate}, partial-fill rate {args.partial_rate}:")
+    await failures(args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Order gateway benchmark on the mock exchange.")
+    parser.add_argument("--pairs", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--order-limit", type=int, default=50)
+    parser.add_argument("--order-window", type=float, default=1.0, help="Seconds; Binance uses 10.")
+    parser.add_argument("--reject-rate", type=float, default=0.05)
+    parser.add_argument("--partial-rate", type=float, default=0.05)
+    logging.basicConfig(level=logging.ERROR)  # expected rejections and unwinds would otherwise flood the output
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
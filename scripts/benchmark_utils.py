@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Shared helpers for the offline benchmark scripts (SQLite seeding, round-trip counting).
+"""
+
+import time
+import random
+import datetime
+from contextlib import contextmanager
+
+from sqlalchemy import event, insert
+
+from src.core.database_models import Order, Position
+from src.utils.enums import OrderType, OrderSide, StatusType, PositionType
+
+START_DATE = datetime.datetime(2024, 7, 1)
+SYMBOLS = ["BTC/ETH", "ETH/SOL", "BTC/SOL", "BNB/ETH"]
+
+
+def seed_closed_positions(db, num_positions: int, batch_size: int = 10_000, seed: int = 7) -> None:
+    """Fill an empty database with `num_positions` closed round-trip trades (two filled orders each)."""
+    rng = random.Random(seed)
+    db._generate_tables()
+
+    current_time = START_DATE
+    orders, positions = [], []
+    with db.engine.begin() as conn:
+        for i in range(num_positions):
+            symbol = rng.choice(SYMBOLS)
+            quantity = round(rng.uniform(0.5, 2.5), 3)
+            entry_price = round(15 + rng.uniform(-1.5, 1.5), 3)
+            exit_price = round(15 + rng.uniform(-1.5, 1.5), 3)
+            entry_time = current_time
+            exit_time = current_time + datetime.timedelta(minutes=rng.randint(15, 600))
+
+            entry_id, exit_id = 2 * i + 1, 2 * i + 2
+            orders.append(dict(id=entry_id, stock_symbol=symbol, order_type=OrderType.MARKET,
+                               side=OrderSide.BUY, quantity=quantity, price=entry_price,
+                               status=StatusType.FILLED, submission_datetime=entry_time,
+                               filled_datetime=entry_time))
+            orders.append(dict(id=exit_id, stock_symbol=symbol, order_type=OrderType.MARKET,
+                               side=OrderSide.SELL, quantity=quantity, price=exit_price,
+                               status=StatusType.FILLED, submission_datetime=exit_time,
+                               filled_datetime=exit_time))
+            positions.append(dict(id=i + 1, stock_symbol=symbol, entry_order_id=entry_id,
+                                  exit_order_id=exit_id, quantity=quantity, entry_price=entry_price,
+                                  exit_price=exit_price, entry_datetime=entry_time,
+                                  exit_datetime=exit_time, status=PositionType.CLOSED))
+            current_time += datetime.timedelta(minutes=15)
+
+            if len(positions) >= batch_size:
+                conn.execute(insert(Order), orders)
+                conn.execute(insert(Position), positions)
+                orders, positions = [], []
+
+        if positions:
+            conn.execute(insert(Order), orders)
+            conn.execute(insert(Position), positions)
+
+
+@contextmanager
+def count_round_trips(engine):
+    """Counts statements sent to the database while the block runs; yields a dict updated in place."""
+    stats = {"statements": 0, "seconds": 0.0}
+
+    def _on_execute(*_):
+        stats["statements"] += 1
+
+    event.listen(engine, "before_cursor_execute", _on_execute)
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats["seconds"] = time.perf_counter() - start
+        event.remove(engine, "before_cursor_execute", _on_execute)
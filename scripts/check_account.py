@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Checks database and Binance connectivity for the configured (paper or live) account.
+
+    Usage: python -m scripts.check_account [--asset USDT]
+"""
+
+import argparse
+
+from src.core.bootstrap import bootstrap
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Database and Binance connectivity check.")
+    parser.add_argument("--asset", default="USDT")
+    args = parser.parse_args()
+
+    app = bootstrap(queued_logging=False)
+    try:
+        results = app.check_connectivity(args.asset)
+        print(f"database reachable: {results['database']}")
+        print(f"{args.asset} balance: {results['binance']}")
+    finally:
+        app.shutdown()
+
+
+if __name__ == "__main__":
+    main()
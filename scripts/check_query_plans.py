@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Asserts that every TradingDatabase analytics query is planned through an index.
+
+    Runs against a seeded SQLite file by default, or an existing database with --database-uri.
+    Exits non-zero if any statement's EXPLAIN output does not mention the expected index.
+
+    Usage: python -m scripts.check_query_plans [--database-uri URI]
+"""
+
+import sys
+import argparse
+import tempfile
+from pathlib import Path
+from datetime import datetime
+
+from src.core.database import TradingDatabase
+from src.utils.enums import QueryMode
+from scripts.benchmark_utils import seed_closed_positions
+
+EXPECTED_INDEX = "ix_positions_status_exit_datetime"
+QUERIES = ["get_trade_history", "get_pnl", "get_win_loss_ratio", "get_cumm_returns", "get_metrics"]
+ROLLUP_QUERIES = {"get_pnl", "get_cumm_returns"}
+
+
+def uses_expected_index(mode: QueryMode, name: str, line: str) -> bool:
+    if mode is QueryMode.ROLLUP and name in ROLLUP_QUERIES:
+        # SQLite reports the primary key as an autoindex, MySQL as key=PRIMARY.
+        return "daily_pnl" in line and ("USING INDEX" in line or "key=PRIMARY" in line)
+    return EXPECTED_INDEX in line
+
+
+def check(database_uri: str, duration: int) -> bool:
+    ok = True
+    for mode in QueryMode:
+        db = TradingDatabase(database_uri=database_uri, query_mode=mode)
+        for name in QUERIES:
+            for statement, plan in db.explain(getattr(db, name), duration):
+                used = any(uses_expected_index(mode, name, line) for line in plan)
+                ok &= used
+                print(f"[{'OK' if used else 'MISSING'}] {mode.value:<12} {name}")
+                if not used:
+                    print("\n".join(f"    {line}" for line in plan))
+        # A page behind a cursor must seek into the index (SQLite: exit_datetime<?, MySQL: type=range).
+        for statement, plan in db.explain(db.get_trade_page, (datetime.now(), 0)):
+            used = any(EXPECTED_INDEX in line and ("exit_datetime<" in line or "type=range" in line) for line in plan)
+            ok &= used
+            print(f"[{'OK' if used else 'MISSING'}] {mode.value:<12} get_trade_page")
+            if not used:
+                print("\n".join(f"    {line}" for line in plan))
+        db.dispose()
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EXPLAIN the TradingDatabase queries and check index usage.")
+    parser.add_argument("--database-uri", default=None)
+    parser.add_argument("--positions", type=int, default=5_000)
+    parser.add_argument("--duration", type=int, default=30)
+    args = parser.parse_args()
+
+    if args.database_uri:
+        sys.exit(0 if check(args.database_uri, args.duration) else 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        uri = f"sqlite:///{Path(tmp) / 'plans.db'}"
+        seeded = TradingDatabase(database_uri=uri)
+        seed_closed_positions(seeded, args.positions)
+        seeded.dispose()
+        ok = check(uri, args.duration)
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
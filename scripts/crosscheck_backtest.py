@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Cross-checks the vectorized backtester against a reference backtrader run and times both.
+
+    Usage: python -m scripts.crosscheck_backtest [--pairs 10] [--steps 5000] [--slippage-bps 2] [--stop-z 4]
+"""
+
+import sys
+import time
+import argparse
+
+from src.research.backtest import BacktestConfig, VectorBacktest
+from src.research.backtrader_reference import run_backtrader, cross_check
+from src.research.synthetic_market import SyntheticMarket, MarketConfig
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vectorized vs backtrader backtest cross-check.")
+    parser.add_argument("--pairs", type=int, default=10)
+    parser.add_argument("--steps", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--window", type=int, default=96)
+    parser.add_argument("--entry-z", type=float, default=2.0)
+    parser.add_argument("--exit-z", type=float, default=0.5)
+    parser.add_argument("--stop-z", type=float, default=None)
+    parser.add_argument("--slippage-bps", type=float, default=0.0)
+    args = parser.parse_args()
+
+    paths = SyntheticMarket(MarketConfig(num_pairs=args.pairs, num_steps=args.steps, seed=args.seed)).generate()
+    config = BacktestConfig(window=args.window, entry_z=args.entry_z, exit_z=args.exit_z,
+                            stop_z=args.stop_z, slippage_bps=args.slippage_bps)
+    backtest = VectorBacktest.from_market(paths, config)
+
+    start = time.perf_counter()
+    result = backtest.run()
+    vectorized_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bt_fills, bt_pnl = run_backtrader(backtest.pairs, backtest.timestamps, backtest.prices, backtest.spread, config)
+    backtrader_seconds = time.perf_counter() - start
+
+    check = cross_check(result, bt_fills, bt_pnl)
+    bars = args.pairs * args.steps
+    print(f"{'engine':<12}{'seconds':>10}{'bars/s':>14}{'fills':>8}{'pnl':>16}")
+    print(f"{'vectorized':<12}{vectorized_seconds:>10.3f}{bars / vectorized_seconds:>14,.0f}"
+          f"{check.fills_vectorized:>8}{check.pnl_vectorized:>16.6f}")
+    print(f"{'backtrader':<12}{backtrader_seconds:>10.3f}{bars / backtrader_seconds:>14,.0f}"
+          f"{check.fills_backtrader:>8}{check.pnl_backtrader:>16.6f}")
+    print(f"speedup {backtrader_seconds / vectorized_seconds:,.0f}x, size mismatches {check.size_mismatches}, "
+          f"max relative price error {check.max_price_error:.2e}")
+
+    print("MATCH" if check.ok else "MISMATCH")
+    sys.exit(0 if check.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Exports signal/order/position history to SAVE_LOCATION/exports for offline research.
+
+    Re-running continues from the last exported id of each table; pass --restart to start over.
+
+    Usage: python -m scripts.export_history --format parquet --tables signals orders positions
+"""
+
+import argparse
+
+from src.core.database import BaseDatabase
+from src.core.export import TableExporter
+from src.core.database import DEFAULT_CHUNK_SIZE
+from src.core.application_constants import DATABASE_URI, SAVE_LOCATION
+from src.utils.enums import ExportFormat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming, resumable table export.")
+    parser.add_argument("--database-uri", default=DATABASE_URI)
+    parser.add_argument("--tables", nargs="+", default=["signals", "orders", "positions"])
+    parser.add_argument("--format", choices=[f.value for f in ExportFormat], default=ExportFormat.PARQUET.value)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--save-location", default=SAVE_LOCATION)
+    parser.add_argument("--restart", action="store_true", help="Discard previous output and checkpoints.")
+    args = parser.parse_args()
+
+    db = BaseDatabase(database_uri=args.database_uri)
+    exporter = TableExporter(db, save_location=args.save_location,
+                             export_format=ExportFormat(args.format), chunk_size=args.chunk_size)
+
+    for table, rows in exporter.export(args.tables, restart=args.restart).items():
+        print(f"{table}: {rows} rows exported this run.")
+
+    db.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Imports Binance kline CSV dumps (data.binance.vision layout, no header) into the local kline store.
+
+    Usage: python -m scripts.import_klines --symbol BTCUSDT --interval 1m BTCUSDT-1m-2024-*.csv
+"""
+
+import glob
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from src.core.kline_store import KlineStore, KLINE_COLUMNS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline kline import.")
+    parser.add_argument("--symbol", required=True)
+    parser.add_argument("--interval", required=True)
+    parser.add_argument("files", nargs="+", help="CSV files or glob patterns, imported in sorted order.")
+    args = parser.parse_args()
+
+    store = KlineStore()
+    files = sorted({f for pattern in args.files for f in glob.glob(pattern)})
+    added = 0
+    for path in files:
+        frame = pd.read_csv(path, header=None, usecols=range(len(KLINE_COLUMNS)), names=list(KLINE_COLUMNS))
+        frame = frame[pd.to_numeric(frame["open_time"], errors="coerce").notna()]  # skip a header row if present
+        bars = {name: frame[name].to_numpy(dtype=np.float64).astype(dtype) for name, dtype in KLINE_COLUMNS.items()}
+        if bars["open_time"].size and bars["open_time"][0] > 10 ** 14:  # newer dumps use microseconds
+            for name in ("open_time", "close_time"):
+                bars[name] //= 1000
+        added += store.append(args.symbol, args.interval, bars)
+
+    print(f"Imported {added:,} bars from {len(files)} file(s); {args.symbol} {args.interval} now has "
+          f"{store.count(args.symbol, args.interval):,} bars.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Adds the model-declared indexes to an existing trading database and drops superseded ones.
+
+    Usage: python -m scripts.migrate_indexes [--database-uri URI]
+"""
+
+import argparse
+
+from src.core.database import BaseDatabase
+from src.core.application_constants import DATABASE_URI
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create missing indexes declared in database_models and drop superseded ones.")
+    parser.add_argument("--database-uri", default=DATABASE_URI)
+    args = parser.parse_args()
+
+    db = BaseDatabase(database_uri=args.database_uri)
+    created, dropped = db.migrate_indexes()
+    db.dispose()
+
+    print(f"Created {len(created)} index(es): {', '.join(created)}" if created else "All indexes already exist.")
+    if dropped:
+        print(f"Dropped {len(dropped)} superseded index(es): {', '.join(dropped)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Offline load test of the ingestion service, replaying recorded (or synthetic) stream messages.
+
+    Without --replay a synthetic market is rendered into Binance kline and bookTicker messages first.
+
+    Usage: python -m scripts.replay_ingestion [--replay messages.jsonl] [--pairs 50] [--steps 2000]
+               [--rate 20000 50000 0] [--price-feed kline|book] [--store DIR]
+"""
+
+import asyncio
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import orjson
+
+from src.core.kline_store import KlineStore
+from src.research.synthetic_market import SyntheticMarket, MarketConfig
+from src.strategy.spread_engine import SpreadEngine
+from src.trading.ingestion import IngestionService, ReplaySource
+
+
+def write_synthetic_messages(paths, path: Path, interval: str) -> int:
+    """One closed kline and one bookTicker per leg per step, in time order."""
+    open_times = paths.timestamps.astype("datetime64[ms]").astype(np.int64)
+    step_ms = int(open_times[1] - open_times[0]) if len(open_times) > 1 else 60_000
+    legs = [(f"{p}A", paths.mid_a[:, j], paths.bid_a[:, j], paths.ask_a[:, j]) for j, p in enumerate(paths.pairs)]
+    legs += [(f"{p}B", paths.mid_b[:, j], paths.bid_b[:, j], paths.ask_b[:, j]) for j, p in enumerate(paths.pairs)]
+
+    written = 0
+    with open(path, "wb") as handle:
+        for t, open_time in enumerate(open_times.tolist()):
+            for symbol, mid, bid, ask in legs:
+                close = f"{mid[t]:.8f}"
+                kline = {"e": "kline", "E": open_time + step_ms, "s": symbol, "k": {
+                    "t": open_time, "T": open_time + step_ms - 1, "s": symbol, "i": interval, "o": close,
+                    "c": close, "h": close, "l": close, "v": "1.0", "n": 1, "x": True, "q": close,
+                    "V": "0.5", "Q": "0.0"}}
+                ticker = {"u": t, "s": symbol, "b": f"{bid[t]:.8f}", "B": "1.0", "a": f"{ask[t]:.8f}", "A": "1.0"}
+                handle.write(orjson.dumps({"stream": f"{symbol.lower()}@kline_{interval}", "data": kline}) + b"\n")
+                handle.write(orjson.dumps({"stream": f"{symbol.lower()}@bookTicker", "data": ticker}) + b"\n")
+                written += 2
+    return written
+
+
+async def run_once(replay: Path, pairs: dict, rate, price_feed: str, store_root: Path):
+    engine = SpreadEngine(list(pairs), hedge_ratios=np.ones(len(pairs)))
+    service = IngestionService(ReplaySource(replay, rate=rate), pairs, engine=engine,
+                               store=KlineStore(store_root), price_feed=price_feed)
+    return await service.run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay load test for market data ingestion.")
+    parser.add_argument("--replay", help="Recorded JSON-lines messages; synthetic when omitted.")
+    parser.add_argument("--pairs", type=int, default=50)
+    parser.add_argument("--steps", type=int, default=2_000)
+    parser.add_argument("--interval", default="15m")
+    parser.add_argument("--rate", type=float, nargs="+", default=[20_000, 0], help="Messages/s; 0 is unpaced.")
+    parser.add_argument("--price-feed", choices=("kline", "book"), default="kline")
+    parser.add_argument("--store", help="Kline store root; a temporary directory by default.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        scratch = Path(scratch)
+        if args.replay:
+            replay = Path(args.replay)
+            pairs = {}
+            symbols = sorted({orjson.loads(line).get("data", {}).get("s") for line in open(replay, "rb")} - {None})
+            for a, b in zip(symbols[::2], symbols[1::2]):
+                pairs[f"{a}_{b}"] = (a, b)
+        else:
+            paths = SyntheticMarket(MarketConfig(num_pairs=args.pairs, num_steps=args.steps)).generate()
+            replay = scratch / "messages.jsonl"
+            count = write_synthetic_messages(paths, replay, args.interval)
+            print(f"Rendered {count:,} synthetic messages.")
+            pairs = {p: (f"{p}A", f"{p}B") for p in paths.pairs}
+
+        print(f"{'rate':>10}{'msgs/s':>12}{'batches':>9}{'max batch':>11}{'max queue':>11}"
+              f"{'p50 ms':>9}{'p99 ms':>9}{'updates':>10}{'signals':>9}{'bars':>9}")
+        for k, rate in enumerate(args.rate):
+            store_root = Path(args.store) / f"run{k}" if args.store else scratch / f"store{k}"
+            stats = asyncio.run(run_once(replay, pairs, rate or None, args.price_feed, store_root))
+            latency = stats.latency_percentiles()
+            print(f"{rate or 'max':>10}{stats.messages_per_second:>12,.0f}{stats.batches:>9}{stats.largest_batch:>11}"
+                  f"{stats.max_queue_depth:>11}{latency[50] * 1e3:>9.2f}{latency[99] * 1e3:>9.2f}"
+                  f"{stats.engine_updates:>10,}{stats.signals:>9,}{stats.bars_stored:>9,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Runs (or resumes) a walk-forward parameter sweep over an .npz written by scripts.generate_market.
+
+    Usage: python -m scripts.run_sweep --npz market.npz --name q3 --block-bars 2880 \
+               [--window 48 96 192] [--entry-z 1.5 2 2.5] [--exit-z 0 0.5] [--stop-z none 4] [--workers 8]
+"""
+
+import time
+import argparse
+
+import numpy as np
+
+from src.research.parameter_sweep import WalkForwardSweep
+
+
+def optional_float(value: str):
+    return None if value.lower() == "none" else float(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel walk-forward parameter sweep.")
+    parser.add_argument("--npz", required=True)
+    parser.add_argument("--name", required=True, help="Sweep name; rerun with the same name to resume.")
+    parser.add_argument("--block-bars", type=int, required=True, help="Bars per walk-forward block.")
+    parser.add_argument("--train-blocks", type=int, default=4)
+    parser.add_argument("--window", type=int, nargs="+", default=[96])
+    parser.add_argument("--entry-z", type=float, nargs="+", default=[2.0])
+    parser.add_argument("--exit-z", type=float, nargs="+", default=[0.5])
+    parser.add_argument("--stop-z", type=optional_float, nargs="+", default=[None])
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    data = np.load(args.npz)
+    grid = {"window": args.window, "entry_z": args.entry_z, "exit_z": args.exit_z, "stop_z": args.stop_z}
+    sweep = WalkForwardSweep(args.name, [str(p) for p in data["pairs"]], data["timestamps"],
+                             data["mid_a"] / data["mid_b"], data["log_spread"], grid,
+                             block_bars=args.block_bars, train_blocks=args.train_blocks, workers=args.workers)
+
+    start = time.perf_counter()
+    sweep.run()
+    paths = sweep.save_results()
+    print(f"{len(sweep.configs)} cells x {len(sweep.pairs)} pairs in {time.perf_counter() - start:.1f}s.")
+
+    wf = sweep.walk_forward()
+    print(f"Walk-forward: {wf['fold'].nunique()} folds, out-of-sample PnL {wf['test_pnl'].sum():.4f} "
+          f"over {int(wf['test_trades'].sum())} trades.")
+    for path in paths:
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
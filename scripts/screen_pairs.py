@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Screens a price matrix for cointegrated pairs and prints the ranked result.
+
+    Input is either a wide CSV (one column per symbol, one row per bar) or an .npz written by
+    scripts.generate_market, whose two legs per pair become separate symbols.
+
+    Usage: python -m scripts.screen_pairs --npz market.npz [--workers 8] [--top 20]
+"""
+
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from src.research.pair_screening import PairScreener
+
+
+def load_prices(args) -> tuple[np.ndarray, list[str]]:
+    if args.npz:
+        data = np.load(args.npz)
+        pairs = [str(p) for p in data["pairs"]]
+        prices = np.hstack([data["mid_a"], data["mid_b"]])
+        return prices, [f"{p}A" for p in pairs] + [f"{p}B" for p in pairs]
+
+    frame = pd.read_csv(args.csv, index_col=0).ffill().dropna(axis=1)
+    return frame.to_numpy(dtype=np.float64), [str(c) for c in frame.columns]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel cointegration pair screening.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--npz")
+    source.add_argument("--csv")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--min-correlation", type=float, default=0.8)
+    parser.add_argument("--max-candidates", type=int, default=None)
+    parser.add_argument("--max-p-value", type=float, default=0.05)
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    prices, symbols = load_prices(args)
+    screener = PairScreener(prices, symbols, min_correlation=args.min_correlation,
+                            max_candidates=args.max_candidates, workers=args.workers)
+
+    start = time.perf_counter()
+    ranked = screener.screen(max_p_value=args.max_p_value)
+    print(f"{len(ranked)} cointegrated pairs among {len(symbols)} symbols in {time.perf_counter() - start:.1f}s.")
+
+    for c in ranked[:args.top]:
+        print(f"{c.symbol_a:>10} / {c.symbol_b:<10} p={c.p_value:.4f} beta={c.hedge_ratio:.3f} "
+              f"half-life={c.half_life:.1f} corr={c.correlation:.3f}")
+
+
+if __name__ == "__main__":
+    main()
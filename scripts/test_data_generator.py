@@ -4,19 +4,21 @@
 """
     Test Data Generator for Crypto Pair Trading Strategy
     Simulates 1 year of pair trading using mean reversion on BTC/ETH
+
+    Usage: python -m scripts.test_data_generator [--bulk] [--intervals N] [--batch-size N]
 """
 
+import time
 import random
+import argparse
 import datetime
 
-from src.core.database import Database
+from src.core.database import TradingDatabase
+from src.core.bulk_loader import BulkLoader, DEFAULT_BATCH_SIZE
 from src.core.database_models import Signal, Order, Position
+from src.core.application_constants import DATABASE_URI
 from src.utils.enums import SignalType, OrderType, OrderSide, StatusType, PositionType
 
-# Initialize DB and session
-db = Database(echo=False)
-session = db.get_session()
-
 # Simulation config
 START_DATE = datetime.datetime(2024, 7, 1)
 INTERVAL_MINUTES = 15
@@ -32,13 +34,12 @@ def generate_price(mean=BASE_PRICE):
     return round(mean + random.uniform(-1.5, 1.5), 3)
 
 
-def simulate():
+def generate_events(num_intervals=NUM_INTERVALS):
+    """Yields (signal_type, price, confidence, quantity, timestamp) for every interval that crosses a threshold."""
     current_time = START_DATE
-    created = 0
 
-    for _ in range(NUM_INTERVALS):
+    for _ in range(num_intervals):
         price = generate_price()
-        signal_type = None
 
         if price > BASE_PRICE + 1:
             signal_type = SignalType.SELL
@@ -48,11 +49,23 @@ def simulate():
             current_time += datetime.timedelta(minutes=INTERVAL_MINUTES)
             continue
 
+        yield (signal_type, price, round(random.uniform(0.7, 0.95), 3),
+               round(random.uniform(0.5, 2.5), 3), current_time)
+        current_time += datetime.timedelta(minutes=INTERVAL_MINUTES)
+
+
+def simulate(db, num_intervals=NUM_INTERVALS):
+    """ORM path: one flush per signal/order so autoincrement ids are known; commits every 500 records."""
+    global open_position
+    session = db.get_session()
+    created = 0
+
+    for signal_type, price, confidence, quantity, current_time in generate_events(num_intervals):
         # 1. Create Signal
         signal = Signal(
             stock_symbol=PAIR,
             signal_type=signal_type,
-            confidence=round(random.uniform(0.7, 0.95), 3),
+            confidence=confidence,
             signal_datetime=current_time,
         )
         session.add(signal)
@@ -64,7 +77,7 @@ def simulate():
             stock_symbol=PAIR,
             order_type=OrderType.MARKET,
             side=OrderSide.BUY if signal_type == SignalType.BUY else OrderSide.SELL,
-            quantity=round(random.uniform(0.5, 2.5), 3),
+            quantity=quantity,
             price=price,
             status=StatusType.FILLED,
             submission_datetime=current_time,
@@ -74,8 +87,6 @@ def simulate():
         session.flush()  # get order.id
 
         # 3. Create or close Position
-        global open_position
-
         if signal_type == SignalType.BUY and open_position is None:
             open_position = Position(
                 stock_symbol=PAIR,
@@ -95,7 +106,6 @@ def simulate():
             session.merge(open_position)
             open_position = None
 
-        current_time += datetime.timedelta(minutes=INTERVAL_MINUTES)
         created += 1
 
         if created % 500 == 0:
@@ -103,8 +113,81 @@ def simulate():
             print(f"Inserted {created} records...")
 
     session.commit()
-    print("✅ Finished simulating test data.")
+    session.close()
+    return created
+
+
+def simulate_bulk(db, num_intervals=NUM_INTERVALS, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Bulk path: ids are pre-allocated and rows go out in executemany batches of `batch_size`.
+
+    A position is only written once it closes (or at the end, still open), so no row is ever updated.
+    Core inserts bypass the ORM rollup hook, so daily_pnl is rebuilt once at the end.
+    """
+    loader = BulkLoader(db, batch_size=batch_size)
+    position = None
+    created = 0
+
+    for signal_type, price, confidence, quantity, current_time in generate_events(num_intervals):
+        filled_at = current_time + datetime.timedelta(seconds=2)
+        signal_id = loader.add_signal(stock_symbol=PAIR, signal_type=signal_type, confidence=confidence,
+                                      signal_datetime=current_time)
+        order_id = loader.add_order(
+            signal_id=signal_id,
+            stock_symbol=PAIR,
+            order_type=OrderType.MARKET,
+            side=OrderSide.BUY if signal_type == SignalType.BUY else OrderSide.SELL,
+            quantity=quantity,
+            price=price,
+            status=StatusType.FILLED,
+            submission_datetime=current_time,
+            filled_datetime=filled_at,
+        )
+
+        if signal_type == SignalType.BUY and position is None:
+            position = dict(stock_symbol=PAIR, entry_order_id=order_id, quantity=quantity, entry_price=price,
+                            entry_datetime=filled_at, exit_order_id=None, exit_price=None, exit_datetime=None,
+                            status=PositionType.OPEN)
+
+        elif signal_type == SignalType.SELL and position:
+            position.update(exit_order_id=order_id, exit_price=price, exit_datetime=filled_at,
+                            status=PositionType.CLOSED)
+            loader.add_position(**position)
+            position = None
+
+        created += 1
+
+    if position:
+        loader.add_position(**position)
+
+    loader.flush()
+    db.backfill_daily_pnl()
+    print(f"Bulk loaded {loader.rows_written} rows at {loader.rows_per_second:,.0f} rows/s.")
+    return created
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic trading history.")
+    parser.add_argument("--database-uri", default=DATABASE_URI)
+    parser.add_argument("--intervals", type=int, default=NUM_INTERVALS)
+    parser.add_argument("--bulk", action="store_true", help="Use batched Core inserts instead of the ORM.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    db = TradingDatabase(database_uri=args.database_uri, echo=False)
+    db._generate_tables()
+
+    start = time.perf_counter()
+    if args.bulk:
+        created = simulate_bulk(db, args.intervals, args.batch_size)
+    else:
+        created = simulate(db, args.intervals)
+    elapsed = time.perf_counter() - start
+
+    db.dispose()
+    print(f"✅ Finished simulating test data: {created} signals in {elapsed:.1f}s "
+          f"({created / elapsed if elapsed else 0:,.0f} signals/s).")
 
 
 if __name__ == "__main__":
-    simulate()
+    main()
@@ -4,58 +4,104 @@
 """
     Date: 07/11/2025
     Author: Joshua David Golafshan
+    Description: Application settings, read lazily from .env and config.ini on first use.
+
+    Importing this module does no I/O. `settings` loads .env and parses config.ini the first time a
+    value is read; the module-level names (SAVE_LOCATION, DATABASE_URI, ...) still work and resolve
+    through it, but importing one by name reads the config at that point, so hot-path modules read
+    `settings.<name>` inside the functions that need it instead.
 """
+
 import os
+import threading
 from pathlib import Path
-from dotenv import load_dotenv
-from configparser import ConfigParser
+from functools import cached_property
 
-# Load .env file
-load_dotenv()
+# === Core Paths ===
+SCRIPT_DIR = Path(__file__).resolve()
+PROJECT_LOCATION = SCRIPT_DIR.parents[2]
+CONFIG_PATH = PROJECT_LOCATION / "config.ini"
 
-# Load config.ini
-config = ConfigParser()
-config.read(Path(__file__).resolve().parents[2] / "config.ini")
+# === Webscraping Contestants ===
+NA_VALUE = "N/A"
 
 
-# === Helper to get from config.ini or fallback to .env ===
-def get_config_var(key, section="application_settings", default=None, required=False):
-    val = os.getenv(key)  # .env has priority
-    if not val and config.has_option(section, key):
-        val = config.get(section, key)
-    if required and not val:
-        raise EnvironmentError(f"Missing required configuration: {key}")
-    return val or default
+class Settings:
+    """Configuration values, each resolved once: .env/environment first, then config.ini."""
 
+    def __init__(self, config_path: Path = CONFIG_PATH):
+        self.config_path = config_path
+        self._lock = threading.Lock()
 
-# === Core Paths ===
-SCRIPT_DIR = Path(__file__).resolve()
-PROJECT_LOCATION = SCRIPT_DIR.parents[2]
+    @cached_property
+    def config(self):
+        from dotenv import load_dotenv
+        from configparser import ConfigParser
 
-raw_save_location = get_config_var("SAVE_LOCATION", default="DEFAULT")
-LOGGING_LEVEL = get_config_var("LOGGING_LEVEL", default="INFO")
-DELIMITER_GLOBAL = get_config_var("DELIMITER_GLOBAL", default=",")
-PAPER_TRADE = config.getboolean("application_settings", "PAPER_TRADE")
+        with self._lock:
+            load_dotenv()
+            config = ConfigParser()
+            config.read(self.config_path)
+        return config
 
+    # === Helper to get from config.ini or fallback to .env ===
+    def get(self, key, section="application_settings", default=None, required=False):
+        config = self.config  # loads .env into os.environ on first use
+        val = os.getenv(key)  # .env has priority
+        if not val and config.has_option(section, key):
+            val = config.get(section, key)
+        if required and not val:
+            raise EnvironmentError(f"Missing required configuration: {key}")
+        return val or default
 
-if raw_save_location.strip().upper() == "DEFAULT":
-    SAVE_LOCATION = PROJECT_LOCATION / "data_repository"
-else:
-    SAVE_LOCATION = Path(raw_save_location).expanduser().resolve()
+    @cached_property
+    def save_location(self) -> Path:
+        raw_save_location = self.get("SAVE_LOCATION", default="DEFAULT")
+        if raw_save_location.strip().upper() == "DEFAULT":
+            return PROJECT_LOCATION / "data_repository"
+        return Path(raw_save_location).expanduser().resolve()
 
-# === Webscraping Contestants ===
-NA_VALUE = "N/A"
+    @cached_property
+    def paper_trade(self) -> bool:
+        return self.config.getboolean("application_settings", "PAPER_TRADE")
 
-# === .ENV VARIABLES ===
+    @cached_property
+    def binance_credentials(self) -> tuple:
+        """(api key, api secret) for the paper or live account, per PAPER_TRADE."""
+        prefix = "BINANCE_PAPER" if self.paper_trade else "BINANCE_LIVE"
+        return self.get(f"{prefix}_API_KEY"), self.get(f"{prefix}_API_SECRET")
 
-EMAIL_ADDRESS = get_config_var("EMAIL_ADDRESS")
-EMAIL_TO_ADDRESS = get_config_var("EMAIL_TO_ADDRESS")
-EMAIL_SECRET = get_config_var("EMAIL_SECRET")
 
-LIVE_BINANCE_API_KEY = get_config_var("BINANCE_LIVE_API_KEY")
-LIVE_BINANCE_API_SECRET = get_config_var("BINANCE_LIVE_API_SECRET")
+settings = Settings()
 
-PAPER_BINANCE_API_KEY = get_config_var("BINANCE_PAPER_API_KEY")
-PAPER_BINANCE_API_SECRET = get_config_var("BINANCE_PAPER_API_SECRET")
 
-DATABASE_URI = get_config_var("DATABASE_URI")
+def get_config_var(key, section="application_settings", default=None, required=False):
+    return settings.get(key, section, default, required)
+
+
+# Module attribute -> how to resolve it; read through __getattr__ so nothing is loaded at import.
+_LAZY = {
+    "config": lambda: settings.config,
+    "raw_save_location": lambda: settings.get("SAVE_LOCATION", default="DEFAULT"),
+    "SAVE_LOCATION": lambda: settings.save_location,
+    "LOGGING_LEVEL": lambda: settings.get("LOGGING_LEVEL", default="INFO"),
+    "DELIMITER_GLOBAL": lambda: settings.get("DELIMITER_GLOBAL", default=","),
+    "PAPER_TRADE": lambda: settings.paper_trade,
+
+    # === .ENV VARIABLES ===
+    "EMAIL_ADDRESS": lambda: settings.get("EMAIL_ADDRESS"),
+    "EMAIL_TO_ADDRESS": lambda: settings.get("EMAIL_TO_ADDRESS"),
+    "EMAIL_SECRET": lambda: settings.get("EMAIL_SECRET"),
+    "LIVE_BINANCE_API_KEY": lambda: settings.get("BINANCE_LIVE_API_KEY"),
+    "LIVE_BINANCE_API_SECRET": lambda: settings.get("BINANCE_LIVE_API_SECRET"),
+    "PAPER_BINANCE_API_KEY": lambda: settings.get("BINANCE_PAPER_API_KEY"),
+    "PAPER_BINANCE_API_SECRET": lambda: settings.get("BINANCE_PAPER_API_SECRET"),
+    "DATABASE_URI": lambda: settings.get("DATABASE_URI"),
+}
+
+
+def __getattr__(name):
+    resolve = _LAZY.get(name)
+    if resolve is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return resolve()
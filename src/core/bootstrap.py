@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Explicit application start-up: logging, instrumentation and lazily created clients.
+"""
+
+import logging
+
+from src.core.application_constants import settings, Settings
+
+logger = logging.getLogger(__name__)
+
+
+class Application:
+    """
+    Process-wide handles, created on first use. Nothing here touches the network until a client is
+    used; check_connectivity() is the one place start-up is allowed to call out.
+    """
+
+    def __init__(self, app_settings: Settings = settings, metrics_server=None):
+        self.settings = app_settings
+        self.metrics_server = metrics_server
+        self._db = None
+        self._binance = None
+
+    @property
+    def db(self):
+        if self._db is None:
+            from src.core.database import TradingDatabase
+
+            self._db = TradingDatabase(self.settings.get("DATABASE_URI"))
+        return self._db
+
+    @property
+    def binance(self):
+        if self._binance is None:
+            from src.trading.trading import BinanceBase
+
+            self._binance = BinanceBase.from_settings()
+        return self._binance
+
+    def check_connectivity(self, asset: str = "USDT") -> dict:
+        """Pings the database and reads one balance from Binance; returns what each check saw."""
+        checks = {"database": lambda: self.db.is_alive(), "binance": lambda: self.binance.get_asset_balance(asset)}
+        results = {}
+        for name, check in checks.items():
+            try:
+                results[name] = check()
+            except Exception as e:
+                logger.error(f"{name} connectivity check failed: {type(e).__name__}: {e}")
+                results[name] = None
+        return results
+
+    def shutdown(self) -> None:
+        from src.utils.logging_config import stop_logging
+
+        if self.metrics_server is not None:
+            self.metrics_server.shutdown()
+        if self._db is not None:
+            self._db.dispose()
+        stop_logging()
+
+
+def bootstrap(init_log: bool = True, queued_logging: bool = True, instrument: bool = False,
+              metrics_port: int = None) -> Application:
+    """
+    Starts logging (queued by default), optionally times TradingDatabase and BinanceBase calls and
+    serves /metrics on `metrics_port`. Imports for the optional parts happen only when requested.
+    """
+    if init_log:
+        from src.utils.logging_config import init_logging
+
+        init_logging(settings.save_location / "logs", queued=queued_logging)
+
+    if instrument:
+        from src.core.database import BaseDatabase, TradingDatabase
+        from src.trading.trading import BinanceBase
+        from src.utils.instrumentation import instrument_methods
+
+        instrument_methods(BaseDatabase, ["fetch_columnar"])
+        instrument_methods(TradingDatabase)
+        instrument_methods(BinanceBase, ["generate_order", "get_asset_balance"])
+
+    server = None
+    if metrics_port is not None:
+        from src.utils.instrumentation import start_http_server
+
+        server = start_http_server(metrics_port)
+    return Application(settings, server)
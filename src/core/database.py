@@ -8,21 +8,64 @@
 """
 
 import logging
-from sqlalchemy import text, inspect, MetaData, func
-from sqlalchemy import create_engine
+import numpy as np
+from functools import cached_property
+from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from sqlalchemy import text, inspect, event, MetaData, func, case, and_, or_
+from sqlalchemy import create_engine, Enum as SQLEnum, Float, Integer, DateTime, Date
 from src.core.database_models import Base
-from src.core.application_constants import DATABASE_URI
+from src.core.application_constants import settings
 from sqlalchemy.orm import sessionmaker, Session as SessionType, aliased
-from src.core.database_models import Order, Position
+from src.core.database_models import Order, Position, DailyPnl
+from src.core.rollups import register_daily_pnl_rollup, backfill_daily_pnl
+from src.utils.enums import QueryMode
+
+if TYPE_CHECKING:
+    import pandas as pd  # imported where used; workers that never build frames skip it
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CHUNK_SIZE = 50_000
+
+# Indexes older releases created that a wider model index now covers; migrate_indexes drops them.
+SUPERSEDED_INDEXES = {
+    "positions": ("ix_positions_symbol_status",),  # -> ix_positions_symbol_status_exit_datetime
+}
+
+
+def _column_to_array(values: tuple, sa_type) -> np.ndarray:
+    """Converts one fetched column chunk into a typed NumPy array (NULLs become NaN/NaT)."""
+    if isinstance(sa_type, SQLEnum):
+        return np.array([v.value if v is not None and hasattr(v, "value") else v for v in values], dtype=object)
+    if isinstance(sa_type, Float):
+        return np.array(values, dtype=np.float64)
+    if isinstance(sa_type, Integer):
+        try:
+            return np.array(values, dtype=np.int64)
+        except TypeError:
+            return np.array(values, dtype=np.float64)
+    if isinstance(sa_type, (DateTime, Date)):
+        # pandas' C datetime parser is ~10x faster than np.array on datetime objects.
+        import pandas as pd
+
+        return pd.DatetimeIndex(values).to_numpy(dtype="datetime64[ns]")
+    return np.array(values, dtype=object)
+
+
+def _connect_args(database_uri: str) -> dict:
+    """SSL is only understood by the MySQL driver; other backends (e.g. SQLite for benchmarks) get none."""
+    if database_uri and database_uri.startswith("mysql"):
+        return {"ssl": {"ssl_mode": "VERIFY_IDENTITY"}}
+    return {}
+
 
 class BaseDatabase:
-    def __init__(self, database_uri: str = DATABASE_URI, echo: bool = False):
+    def __init__(self, database_uri: str = None, echo: bool = False):
+        database_uri = database_uri or settings.get("DATABASE_URI")
         self.engine = create_engine(
             database_uri,
-            connect_args={"ssl": {"ssl_mode": "VERIFY_IDENTITY"}},
+            connect_args=_connect_args(database_uri),
             pool_pre_ping=True,
             echo=echo,
         )
@@ -55,6 +98,99 @@ class BaseDatabase:
         self.get_session().close()
         self.engine.dispose()
 
+    def fetch_columnar(self, statement, chunk_size: int = DEFAULT_CHUNK_SIZE, as_frame: bool = False,
+                       categorical: tuple[str, ...] = ()):
+        """
+        Streams a SELECT into one NumPy array per column, `chunk_size` rows at a time.
+
+        Rows never become ORM objects: each cursor chunk is transposed straight into typed arrays, so
+        peak memory is the column arrays plus a single chunk of DB-API tuples. With `as_frame=True` a
+        DataFrame is returned instead, with Enum columns (and any named in `categorical`) as categoricals.
+        """
+        column_types = {c.name: c.type for c in statement.selected_columns}
+        chunks = {name: [] for name in column_types}
+
+        with self.engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, max_row_buffer=chunk_size).execute(statement)
+            keys = list(result.keys())
+            for partition in result.partitions(chunk_size):
+                for name, values in zip(keys, zip(*partition)):
+                    chunks[name].append(_column_to_array(values, column_types[name]))
+
+        columns = {}
+        for name in keys:
+            parts = chunks.pop(name)
+            columns[name] = np.concatenate(parts) if parts else _column_to_array((), column_types[name])
+
+        if not as_frame:
+            return columns
+
+        import pandas as pd
+
+        frame = pd.DataFrame(columns, copy=False)
+        for name in keys:
+            sa_type = column_types[name]
+            if isinstance(sa_type, SQLEnum) and sa_type.enum_class is not None:
+                frame[name] = pd.Categorical(frame[name], categories=[e.value for e in sa_type.enum_class])
+            elif name in categorical:
+                frame[name] = frame[name].astype("category")
+        return frame
+
+    def migrate_indexes(self) -> tuple[list[str], list[str]]:
+        """
+        Brings an existing database's indexes in line with the models: creates any declared index
+        that is missing and drops the ones in SUPERSEDED_INDEXES, which a wider index now covers
+        and would otherwise only add write cost. Returns (created, dropped) index names.
+        """
+        inspector = inspect(self.engine)
+        existing_tables = set(inspector.get_table_names())
+        created, dropped = [], []
+        quote = self.engine.dialect.identifier_preparer.quote
+
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name in existing:
+                    continue
+                logger.info(f"Creating index {index.name} on {table.name}.")
+                index.create(self.engine)
+                created.append(index.name)
+
+            for name in SUPERSEDED_INDEXES.get(table.name, ()):
+                if name not in existing:
+                    continue
+                logger.info(f"Dropping superseded index {name} on {table.name}.")
+                on_table = f" ON {quote(table.name)}" if self.engine.dialect.name in ("mysql", "mariadb") else ""
+                with self.engine.begin() as conn:
+                    conn.execute(text(f"DROP INDEX {quote(name)}{on_table}"))
+                dropped.append(name)
+
+        return created, dropped
+
+    def explain(self, fn, *args, **kwargs) -> list[tuple[str, list[str]]]:
+        """Runs `fn` and returns (statement, query plan lines) for every statement it sent to the database."""
+        captured = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            captured.append((statement, parameters))
+
+        event.listen(self.engine, "before_cursor_execute", _capture)
+        try:
+            fn(*args, **kwargs)
+        finally:
+            event.remove(self.engine, "before_cursor_execute", _capture)
+
+        prefix = "EXPLAIN QUERY PLAN" if self.engine.dialect.name == "sqlite" else "EXPLAIN"
+        plans = []
+        with self.engine.connect() as conn:
+            for statement, parameters in captured:
+                rows = conn.exec_driver_sql(f"{prefix} {statement}", parameters).mappings().all()
+                plans.append((statement, [" | ".join(f"{k}={v}" for k, v in row.items() if v is not None)
+                                          for row in rows]))
+        return plans
+
     def is_alive(self) -> bool:
         """Pings the database"""
         try:
@@ -79,59 +215,190 @@ class BaseDatabase:
 from datetime import datetime, timedelta
 
 
+@dataclass(frozen=True)
+class TradingMetrics:
+    """KPIs for closed trades over a time window, as returned by `TradingDatabase.get_metrics`."""
+    total_pnl: float = 0.0
+    wins: int = 0
+    losses: int = 0
+    win_ratio: float = 0.0
+    trade_count: int = 0
+    avg_duration_seconds: float = 0.0
+    cumm_returns: list[tuple[datetime, float]] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class TradePage:
+    """One keyset page of get_trade_history; `next_cursor` is None on the last page."""
+    trades: "pd.DataFrame"
+    cursor: tuple = None
+    next_cursor: tuple = None
+
+
 class TradingDatabase(BaseDatabase):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, database_uri: str = None, echo: bool = False,
+                 query_mode: QueryMode = QueryMode.JOINED):
+        super().__init__(database_uri=database_uri, echo=echo)
+        self.query_mode = query_mode
+        register_daily_pnl_rollup(self._Session)
+
+    @cached_property
+    def window_functions(self) -> bool:
+        """
+        Whether the server runs SUM() OVER (...), decided once from the dialect and server version:
+        MySQL 8.0+, MariaDB 10.2+, SQLite 3.25+; other backends are assumed to.
+        """
+        dialect = self.engine.dialect
+        if dialect.name == "sqlite":
+            return dialect.dbapi.sqlite_version_info >= (3, 25)
+        if dialect.name in ("mysql", "mariadb"):
+            with self.engine.connect():
+                version = dialect.server_version_info or ()  # populated by the first connection
+            return version >= ((10, 2) if getattr(dialect, "is_mariadb", False) else (8, 0))
+        return True
+
+    def _trade_columns(self):
+        """
+        Returns (entry_price, exit_price, exit_time, order_aliases) for the configured query mode.
+
+        JOINED reads prices from the entry/exit order rows; DENORMALIZED (and ROLLUP, for queries the
+        rollup cannot answer) reads the copies stored on the position itself, so no join is needed.
+        """
+        if self.query_mode in (QueryMode.DENORMALIZED, QueryMode.ROLLUP):
+            return Position.entry_price, Position.exit_price, Position.exit_datetime, None
 
-    def get_trade_history(self, duration: int = None):
-        """Returns a list of trade history records."""
-        session = self.get_session()
         EntryOrder = aliased(Order)
         ExitOrder = aliased(Order)
-
-        query = (
-            session.query(
-                Position.stock_symbol,
-                Position.entry_datetime,
-                Position.exit_datetime,
-                Position.quantity,
-                ((ExitOrder.price - EntryOrder.price) * Position.quantity).label("pnl"),
-                (func.extract('epoch', Position.exit_datetime) - func.extract('epoch', Position.entry_datetime))
-                .label("duration_seconds")
+        return EntryOrder.price, ExitOrder.price, ExitOrder.filled_datetime, (EntryOrder, ExitOrder)
+
+    def _seconds_between(self, start, end):
+        """end - start in seconds. MySQL has no EXTRACT(epoch ...), so it gets TIMESTAMPDIFF instead."""
+        if self.engine.dialect.name in ("mysql", "mariadb"):
+            return func.timestampdiff(text("SECOND"), start, end)
+        return func.extract('epoch', end) - func.extract('epoch', start)
+
+    def _closed_positions(self, session: SessionType, duration: int, columns, order_aliases):
+        """Base query over closed positions in the last `duration` days (all history when None)."""
+        query = session.query(*columns).select_from(Position)
+
+        if order_aliases is not None:
+            EntryOrder, ExitOrder = order_aliases
+            query = (
+                query
+                .join(EntryOrder, Position.entry_order_id == EntryOrder.id)
+                .join(ExitOrder, Position.exit_order_id == ExitOrder.id)
             )
-            .select_from(Position)
-            .join(EntryOrder, Position.entry_order_id == EntryOrder.id)
-            .join(ExitOrder, Position.exit_order_id == ExitOrder.id)
-            .filter(Position.status == "CLOSED")
-        )
+
+        query = query.filter(Position.status == "CLOSED")
 
         if duration is not None:
             since = datetime.utcnow() - timedelta(days=duration)
             query = query.filter(Position.exit_datetime >= since)
 
+        return query
+
+    def get_trade_history(self, duration: int = None, as_frame: bool = False, after: tuple = None,
+                          start: datetime = None, end: datetime = None, symbols: list[str] = None,
+                          descending: bool = False, limit: int = None):
+        """
+        Returns a list of trade history records, or a typed DataFrame when `as_frame` is set.
+
+        Filters and ordering run in SQL: `start` <= exit_datetime < `end`, `symbols` restricts
+        stock_symbol, and with `after`, `limit` or `descending` rows come ordered by
+        (exit_datetime, id). `after=(exit_datetime, id)` is a keyset cursor: only rows past it in
+        that order are returned, so fetching the next `limit` rows reads only those rows from the
+        index, however deep the page.
+        """
+        session = self.get_session()
+        entry_price, exit_price, _, order_aliases = self._trade_columns()
+
+        query = self._closed_positions(session, duration, (
+            Position.id,
+            Position.stock_symbol,
+            Position.entry_datetime,
+            Position.exit_datetime,
+            Position.quantity,
+            entry_price.label("entry_price"),
+            exit_price.label("exit_price"),
+            ((exit_price - entry_price) * Position.quantity).label("pnl"),
+            self._seconds_between(Position.entry_datetime, Position.exit_datetime).label("duration_seconds")
+        ), order_aliases)
+
+        if start is not None:
+            query = query.filter(Position.exit_datetime >= start)
+        if end is not None:
+            query = query.filter(Position.exit_datetime < end)
+        if symbols:
+            query = query.filter(Position.stock_symbol.in_(symbols))
+
+        if after is not None:
+            exit_after, id_after = after
+            # The plain bound lets the index seek straight to the cursor; the OR alone would not.
+            if descending:
+                query = query.filter(Position.exit_datetime <= exit_after,
+                                     or_(Position.exit_datetime < exit_after,
+                                         and_(Position.exit_datetime == exit_after, Position.id < id_after)))
+            else:
+                query = query.filter(Position.exit_datetime >= exit_after,
+                                     or_(Position.exit_datetime > exit_after,
+                                         and_(Position.exit_datetime == exit_after, Position.id > id_after)))
+        if after is not None or limit is not None or descending:
+            if descending:
+                query = query.order_by(Position.exit_datetime.desc(), Position.id.desc())
+            else:
+                query = query.order_by(Position.exit_datetime, Position.id)
+        if limit is not None:
+            query = query.limit(limit)
+
+        if as_frame:
+            session.close()
+            return self.fetch_columnar(query.statement, as_frame=True, categorical=("stock_symbol",))
+
         trades = query.all()
         session.close()
         return trades
 
+    def get_trade_page(self, cursor: tuple = None, page_size: int = 100, start: datetime = None,
+                       end: datetime = None, symbols: list[str] = None, descending: bool = True) -> TradePage:
+        """
+        One page of trade history and the cursor for the next; newest first by default.
+
+        Fetches page_size + 1 rows to learn whether another page exists without a COUNT(*).
+        """
+        frame = self.get_trade_history(as_frame=True, after=cursor, start=start, end=end, symbols=symbols,
+                                       descending=descending, limit=page_size + 1)
+        has_next = len(frame) > page_size
+        frame = frame.iloc[:page_size]
+        next_cursor = None
+        if has_next:
+            last = frame.iloc[-1]
+            next_cursor = (last["exit_datetime"].to_pydatetime(), int(last["id"]))
+        return TradePage(frame, cursor, next_cursor)
+
+    def _daily_pnl(self, session: SessionType, duration: int, columns):
+        """Base query over the daily_pnl rollup for the last `duration` days (all history when None)."""
+        query = session.query(*columns).select_from(DailyPnl)
+
+        if duration is not None:
+            since = (datetime.utcnow() - timedelta(days=duration)).date()
+            query = query.filter(DailyPnl.day >= since)
+
+        return query
+
     def get_pnl(self, duration: int = None):
         """Returns total net PnL across all closed positions."""
         session = self.get_session()
-        EntryOrder = aliased(Order)
-        ExitOrder = aliased(Order)
 
-        pnl_expr = (ExitOrder.price - EntryOrder.price) * Position.quantity
+        if self.query_mode is QueryMode.ROLLUP:
+            total_pnl = self._daily_pnl(session, duration, (func.sum(DailyPnl.pnl),)).scalar()
+            session.close()
+            return total_pnl or 0.0
 
-        query = (
-            session.query(func.sum(pnl_expr))
-            .select_from(Position)
-            .join(EntryOrder, Position.entry_order_id == EntryOrder.id)
-            .join(ExitOrder, Position.exit_order_id == ExitOrder.id)
-            .filter(Position.status == "CLOSED")
-        )
+        entry_price, exit_price, _, order_aliases = self._trade_columns()
 
-        if duration is not None:
-            since = datetime.utcnow() - timedelta(days=duration)
-            query = query.filter(Position.exit_datetime >= since)
+        pnl_expr = (exit_price - entry_price) * Position.quantity
+
+        query = self._closed_positions(session, duration, (func.sum(pnl_expr),), order_aliases)
 
         total_pnl = query.scalar()
         session.close()
@@ -140,22 +407,11 @@ class TradingDatabase(BaseDatabase):
     def get_win_loss_ratio(self, duration: int = None):
         """Returns (win_count, loss_count, win_ratio) across closed trades."""
         session = self.get_session()
-        EntryOrder = aliased(Order)
-        ExitOrder = aliased(Order)
+        entry_price, exit_price, _, order_aliases = self._trade_columns()
 
-        pnl_expr = (ExitOrder.price - EntryOrder.price) * Position.quantity
-
-        base_query = (
-            session.query(func.count())
-            .select_from(Position)
-            .join(EntryOrder, Position.entry_order_id == EntryOrder.id)
-            .join(ExitOrder, Position.exit_order_id == ExitOrder.id)
-            .filter(Position.status == "CLOSED")
-        )
+        pnl_expr = (exit_price - entry_price) * Position.quantity
 
-        if duration is not None:
-            since =  datetime.utcnow() - timedelta(days=duration)
-            base_query = base_query.filter(Position.exit_datetime >= since)
+        base_query = self._closed_positions(session, duration, (func.count(),), order_aliases)
 
         wins = base_query.filter(pnl_expr > 0).scalar()
         losses = base_query.filter(pnl_expr < 0).scalar()
@@ -167,28 +423,38 @@ class TradingDatabase(BaseDatabase):
         return {"wins": wins, "losses": losses, "win_ratio": round(win_ratio, 3)}
 
     def get_cumm_returns(self, duration: int = None):
-        """Returns cumulative return data points as a list of (datetime, cumulative_pnl)."""
-        session = self.get_session()
-        EntryOrder = aliased(Order)
-        ExitOrder = aliased(Order)
+        """
+        Returns cumulative return data points as a list of (datetime, cumulative_pnl).
 
-        pnl_expr = (ExitOrder.price - EntryOrder.price) * Position.quantity
+        In ROLLUP mode there is one point per day (a `date`), so the cost depends on the window
+        length rather than the number of trades in it.
+        """
+        session = self.get_session()
 
-        query = (
-            session.query(
-                ExitOrder.filled_datetime.label("exit_time"),
-                pnl_expr.label("pnl")
+        if self.query_mode is QueryMode.ROLLUP:
+            days = (
+                self._daily_pnl(session, duration, (DailyPnl.day, func.sum(DailyPnl.pnl).label("pnl")))
+                .group_by(DailyPnl.day)
+                .order_by(DailyPnl.day.asc())
+                .all()
             )
-            .select_from(Position)
-            .join(EntryOrder, Position.entry_order_id == EntryOrder.id)
-            .join(ExitOrder, Position.exit_order_id == ExitOrder.id)
-            .filter(Position.status == "CLOSED")
-            .order_by(ExitOrder.filled_datetime.asc())
-        )
+            session.close()
 
-        if duration is not None:
-            since = datetime.utcnow() - timedelta(days=duration)
-            query = query.filter(Position.exit_datetime >= since)
+            cum_returns = []
+            total = 0.0
+            for d in days:
+                total += d.pnl or 0.0
+                cum_returns.append((d.day, round(total, 2)))
+            return cum_returns
+
+        entry_price, exit_price, exit_time, order_aliases = self._trade_columns()
+
+        pnl_expr = (exit_price - entry_price) * Position.quantity
+
+        query = self._closed_positions(session, duration, (
+            exit_time.label("exit_time"),
+            pnl_expr.label("pnl")
+        ), order_aliases).order_by(exit_time.asc(), Position.id.asc())
 
         trades = query.all()
         session.close()
@@ -202,3 +468,128 @@ class TradingDatabase(BaseDatabase):
             cum_returns.append((t.exit_time, round(total, 2)))
 
         return cum_returns
+
+    def get_cumm_returns_frame(self, duration: int = None) -> "pd.DataFrame":
+        """
+        Returns cumulative returns as a DataFrame with `exit_time`, `pnl` and `cumulative_pnl` columns.
+
+        The running total is computed in SQL with SUM() OVER (ORDER BY exit time); backends without
+        window functions fall back to a NumPy cumsum over the fetched pnl column.
+        """
+        session = self.get_session()
+
+        if self.query_mode is QueryMode.ROLLUP:
+            day_pnl = func.sum(DailyPnl.pnl)
+            columns = (DailyPnl.day.label("exit_time"), day_pnl.label("pnl"))
+            query = self._daily_pnl(session, duration, columns).group_by(DailyPnl.day)
+            order_by = (DailyPnl.day,)
+            running = func.sum(day_pnl).over(order_by=order_by)
+        else:
+            entry_price, exit_price, exit_time, order_aliases = self._trade_columns()
+            pnl_expr = (exit_price - entry_price) * Position.quantity
+            columns = (exit_time.label("exit_time"), pnl_expr.label("pnl"))
+            query = self._closed_positions(session, duration, columns, order_aliases)
+            order_by = (exit_time, Position.id)
+            running = func.sum(pnl_expr).over(order_by=order_by)
+
+        try:
+            if self.window_functions:
+                frame = self.fetch_columnar(query.add_columns(running.label("cumulative_pnl"))
+                                            .order_by(*order_by).statement, as_frame=True)
+            else:
+                frame = self.fetch_columnar(query.order_by(*order_by).statement, as_frame=True)
+                frame["cumulative_pnl"] = np.cumsum(frame["pnl"].fillna(0.0).to_numpy(dtype=np.float64))
+        finally:
+            session.close()
+
+        frame["cumulative_pnl"] = frame["cumulative_pnl"].astype(np.float64).round(2)
+        return frame
+
+    def get_metrics(self, duration: int = None, include_returns: bool = False) -> TradingMetrics:
+        """
+        Returns PnL, win/loss, trade count and average duration from one aggregate query.
+
+        The KPIs are conditional aggregates (SUM(CASE ...)) over a single scan of the closed
+        positions, so the database returns one row however many trades there are. The cumulative
+        series is a row per trade (or per day in ROLLUP mode), so it is fetched with a second
+        query only when `include_returns` is set.
+        """
+        session = self.get_session()
+        entry_price, exit_price, _, order_aliases = self._trade_columns()
+
+        pnl_expr = (exit_price - entry_price) * Position.quantity
+        duration_expr = self._seconds_between(Position.entry_datetime, Position.exit_datetime)
+
+        row = self._closed_positions(session, duration, (
+            func.sum(pnl_expr).label("total_pnl"),
+            func.sum(case((pnl_expr > 0, 1), else_=0)).label("wins"),
+            func.sum(case((pnl_expr < 0, 1), else_=0)).label("losses"),
+            func.count().label("trade_count"),
+            func.avg(duration_expr).label("avg_duration"),
+        ), order_aliases).one()
+        session.close()
+
+        if not row.trade_count:
+            return TradingMetrics()
+
+        wins, losses = int(row.wins or 0), int(row.losses or 0)
+        total = wins + losses
+
+        return TradingMetrics(
+            total_pnl=row.total_pnl or 0.0,
+            wins=wins,
+            losses=losses,
+            win_ratio=round(wins / total if total > 0 else 0, 3),
+            trade_count=int(row.trade_count),
+            avg_duration_seconds=float(row.avg_duration or 0.0),
+            cumm_returns=self.get_cumm_returns(duration) if include_returns else [],
+        )
+
+    def backfill_daily_pnl(self) -> int:
+        """Rebuilds the daily_pnl rollup from position history. Returns the number of (day, symbol) rows."""
+        return backfill_daily_pnl(self.engine)
+
+    def check_denormalized_consistency(self) -> list:
+        """
+        Returns positions whose denormalized entry/exit price and datetime disagree with their order rows.
+
+        DENORMALIZED query mode is only as correct as these copies; run this after backfills or
+        manual edits before switching a reporting instance over.
+        """
+        session = self.get_session()
+        EntryOrder = aliased(Order)
+        ExitOrder = aliased(Order)
+
+        has_exit = Position.exit_order_id.isnot(None)
+
+        query = (
+            session.query(
+                Position.id,
+                Position.stock_symbol,
+                Position.entry_price,
+                EntryOrder.price.label("entry_order_price"),
+                Position.exit_price,
+                ExitOrder.price.label("exit_order_price"),
+                Position.entry_datetime,
+                EntryOrder.filled_datetime.label("entry_order_datetime"),
+                Position.exit_datetime,
+                ExitOrder.filled_datetime.label("exit_order_datetime"),
+            )
+            .select_from(Position)
+            .join(EntryOrder, Position.entry_order_id == EntryOrder.id)
+            .outerjoin(ExitOrder, Position.exit_order_id == ExitOrder.id)
+            .filter(or_(
+                Position.entry_price.is_distinct_from(EntryOrder.price),
+                Position.entry_datetime.is_distinct_from(EntryOrder.filled_datetime),
+                and_(has_exit, Position.exit_price.is_distinct_from(ExitOrder.price)),
+                and_(has_exit, Position.exit_datetime.is_distinct_from(ExitOrder.filled_datetime)),
+            ))
+            .order_by(Position.id.asc())
+        )
+
+        mismatches = query.all()
+        session.close()
+
+        if mismatches:
+            logger.warning(f"{len(mismatches)} positions disagree with their order rows.")
+        return mismatches
@@ -8,9 +8,9 @@
 """
 
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Float, DateTime
+from sqlalchemy import Float, DateTime, Date
 from sqlalchemy.orm import declarative_base
-from sqlalchemy import Column, Integer, String, func, ForeignKey
+from sqlalchemy import Column, Integer, String, func, ForeignKey, Index
 from src.utils.enums import SignalType, OrderType, OrderSide, StatusType, PositionType
 
 # TODO Executions (Partial Fills), Accounts, Strats (use those 2 handle metrics)
@@ -28,6 +28,10 @@ class Signal(Base):
     confidence = Column(Float)
     signal_datetime = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_signals_symbol_datetime", "stock_symbol", "signal_datetime"),
+    )
+
     def __repr__(self):
         return (
             f"<Signal(id={self.id}, symbol='{self.stock_symbol}', "
@@ -51,6 +55,12 @@ class Order(Base):
     submission_datetime = Column(DateTime(timezone=True), server_default=func.now())
     filled_datetime = Column(DateTime(timezone=True), nullable=True)
 
+    __table_args__ = (
+        Index("ix_orders_filled_datetime", "filled_datetime"),
+        Index("ix_orders_symbol_status", "stock_symbol", "status"),
+        Index("ix_orders_signal_id", "signal_id"),
+    )
+
     def __repr__(self):
         return (
             f"<Order(id={self.id}, symbol='{self.stock_symbol}', side={self.side}, "
@@ -76,8 +86,87 @@ class Position(Base):
 
     status = Column(SQLEnum(PositionType, name="positiontype"), nullable=False, default=StatusType.PENDING)
 
+    __table_args__ = (
+        # Trailing price/quantity columns make this covering for DENORMALIZED PnL queries.
+        Index("ix_positions_status_exit_datetime", "status", "exit_datetime", "entry_price", "exit_price",
+              "quantity"),
+        # exit_datetime last so symbol-filtered trade history pages are an index range scan.
+        Index("ix_positions_symbol_status_exit_datetime", "stock_symbol", "status", "exit_datetime"),
+    )
+
     def __repr__(self):
         return (
             f"<Position(id={self.id}, symbol='{self.stock_symbol}', "
             f"qty={self.quantity}, status={self.status})>"
         )
+
+
+class PairPosition(Base):
+    """One pair trade; its legs are rows of position_legs. Leg quantities are signed (+ long, - short)."""
+    __tablename__ = 'pair_positions'
+
+    id = Column(Integer, primary_key=True)
+    pair = Column(String(32), nullable=False)
+    signal_id = Column(Integer, ForeignKey("signals.id"), nullable=True)
+
+    hedge_ratio = Column(Float, nullable=False)
+    realised_pnl = Column(Float, nullable=True)
+
+    entry_datetime = Column(DateTime(timezone=True), nullable=True)
+    exit_datetime = Column(DateTime(timezone=True), nullable=True)
+
+    status = Column(SQLEnum(PositionType, name="positiontype"), nullable=False, default=PositionType.OPEN)
+
+    __table_args__ = (
+        Index("ix_pair_positions_status_exit_datetime", "status", "exit_datetime"),
+        Index("ix_pair_positions_pair_status", "pair", "status"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<PairPosition(id={self.id}, pair='{self.pair}', "
+            f"hedge_ratio={self.hedge_ratio}, status={self.status})>"
+        )
+
+
+class PositionLeg(Base):
+    __tablename__ = 'position_legs'
+
+    id = Column(Integer, primary_key=True)
+    pair_position_id = Column(Integer, ForeignKey("pair_positions.id"), nullable=False)
+    leg = Column(Integer, nullable=False)  # 0 for the A leg, 1 for the B leg
+    stock_symbol = Column(String(20), nullable=False)  # exchange symbols such as 1000SHIBUSDT exceed 10
+
+    entry_order_id = Column(Integer, ForeignKey("orders.id"), nullable=True)
+    exit_order_id = Column(Integer, ForeignKey("orders.id"), nullable=True)
+
+    quantity = Column(Float, nullable=False)
+    entry_price = Column(Float, nullable=True)
+    exit_price = Column(Float, nullable=True)
+
+    __table_args__ = (
+        Index("ix_position_legs_pair_position_id_leg", "pair_position_id", "leg"),
+        Index("ix_position_legs_symbol", "stock_symbol"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<PositionLeg(id={self.id}, pair_position_id={self.pair_position_id}, leg={self.leg}, "
+            f"symbol='{self.stock_symbol}', qty={self.quantity})>"
+        )
+
+
+class DailyPnl(Base):
+    """Realised PnL per (day, symbol), maintained as positions close. See src/core/rollups.py."""
+    __tablename__ = 'daily_pnl'
+
+    day = Column(Date, primary_key=True)
+    stock_symbol = Column(String(10), primary_key=True)
+    pnl = Column(Float, nullable=False, default=0.0)
+    trade_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return (
+            f"<DailyPnl(day={self.day}, symbol='{self.stock_symbol}', "
+            f"pnl={self.pnl}, trades={self.trade_count})>"
+        )
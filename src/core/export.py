@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Streaming, resumable export of database tables to Parquet or CSV.
+"""
+
+import os
+import json
+import logging
+from pathlib import Path
+
+import pandas as pd
+from sqlalchemy import select, Integer, Float, DateTime, Date
+
+from src.core.database import BaseDatabase, DEFAULT_CHUNK_SIZE, _column_to_array
+from src.core.database_models import Base
+from src.core.application_constants import settings
+from src.utils.enums import ExportFormat
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILENAME = "_checkpoint.json"
+
+
+def _arrow_schema(table):
+    """Fixed Parquet schema per table, so part files agree even when a chunk's column is all NULL."""
+    fields = []
+    for column in table.columns:
+        if isinstance(column.type, Integer):
+            arrow_type = pa.int64()
+        elif isinstance(column.type, Float):
+            arrow_type = pa.float64()
+        elif isinstance(column.type, (DateTime, Date)):
+            arrow_type = pa.timestamp("ns")
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column.name, arrow_type, nullable=column.nullable or column.primary_key))
+    return pa.schema(fields)
+
+
+class TableExporter:
+    """
+    Exports tables in primary-key order, one chunk at a time, through a server-side cursor.
+
+    Progress is checkpointed after every chunk as the last exported id, so an interrupted export
+    picks up where it stopped and memory use is bounded by `chunk_size` regardless of table size.
+    Parquet output is one file per chunk; CSV output is a single appended file per table.
+    """
+
+    def __init__(self, db: BaseDatabase, save_location: Path = None,
+                 export_format: ExportFormat = ExportFormat.PARQUET, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if export_format is ExportFormat.PARQUET and not PARQUET_AVAILABLE:
+            raise ImportError("Parquet export needs pyarrow (see requirements.txt); install it or pass "
+                              "export_format=ExportFormat.CSV.")
+
+        self.db = db
+        self.export_format = export_format
+        self.chunk_size = chunk_size
+        self.export_dir = Path(save_location or settings.save_location) / "exports"
+
+    def _read_checkpoint(self, table_dir: Path) -> dict:
+        path = table_dir / CHECKPOINT_FILENAME
+        if not path.exists():
+            return {"last_id": None, "rows": 0, "csv_bytes": 0, "format": self.export_format.value}
+
+        checkpoint = json.loads(path.read_text())
+        if checkpoint["format"] != self.export_format.value:
+            raise ValueError(f"{table_dir} holds a {checkpoint['format']} export; restart it to change format.")
+        return checkpoint
+
+    @staticmethod
+    def _write_checkpoint(table_dir: Path, checkpoint: dict) -> None:
+        tmp = table_dir / f"{CHECKPOINT_FILENAME}.tmp"
+        tmp.write_text(json.dumps(checkpoint))
+        os.replace(tmp, table_dir / CHECKPOINT_FILENAME)
+
+    def _discard_uncommitted(self, table_dir: Path, checkpoint: dict) -> None:
+        """Drop output written after the last checkpoint (a crash between write and checkpoint)."""
+        if self.export_format is ExportFormat.CSV:
+            csv_path = table_dir / f"{table_dir.name}.csv"
+            if csv_path.exists() and csv_path.stat().st_size > checkpoint["csv_bytes"]:
+                with open(csv_path, "r+b") as f:
+                    f.truncate(checkpoint["csv_bytes"])
+            return
+
+        for part in table_dir.glob("part-*.parquet"):
+            first_id = int(part.stem.split("-")[1])
+            if checkpoint["last_id"] is None or first_id > checkpoint["last_id"]:
+                part.unlink()
+
+    def _write_chunk(self, table, table_dir: Path, frame: pd.DataFrame, first_id: int, checkpoint: dict) -> None:
+        if self.export_format is ExportFormat.PARQUET:
+            path = table_dir / f"part-{first_id:012d}.parquet"
+            pq.write_table(pa.Table.from_pandas(frame, schema=_arrow_schema(table), preserve_index=False), path)
+            return
+
+        csv_path = table_dir / f"{table_dir.name}.csv"
+        with open(csv_path, "a", newline="", encoding="utf-8") as f:
+            frame.to_csv(f, sep=settings.get("DELIMITER_GLOBAL", default=","), index=False, header=checkpoint["csv_bytes"] == 0)
+            f.flush()
+            os.fsync(f.fileno())
+        checkpoint["csv_bytes"] = csv_path.stat().st_size
+
+    def export_table(self, table_name: str, restart: bool = False) -> int:
+        """Exports one table and returns the number of rows written in this run."""
+        table = Base.metadata.tables[table_name]
+        if len(table.primary_key.columns) != 1:
+            raise ValueError(f"{table_name} has no single-column primary key to resume from.")
+        pk = table.primary_key.columns.values()[0]
+
+        table_dir = self.export_dir / table_name
+        table_dir.mkdir(parents=True, exist_ok=True)
+        if restart:
+            for path in table_dir.iterdir():
+                path.unlink()
+
+        checkpoint = self._read_checkpoint(table_dir)
+        self._discard_uncommitted(table_dir, checkpoint)
+
+        statement = select(table).order_by(pk.asc())
+        if checkpoint["last_id"] is not None:
+            statement = statement.where(pk > checkpoint["last_id"])
+            logger.info(f"Resuming {table_name} export after id {checkpoint['last_id']}.")
+
+        column_types = {c.name: c.type for c in table.columns}
+        written = 0
+
+        with self.db.engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=self.chunk_size).execute(statement)
+            keys = list(result.keys())
+            for partition in result.partitions():
+                frame = pd.DataFrame({name: _column_to_array(values, column_types[name])
+                                      for name, values in zip(keys, zip(*partition))}, copy=False)
+
+                self._write_chunk(table, table_dir, frame, int(frame[pk.name].iloc[0]), checkpoint)
+                checkpoint["last_id"] = int(frame[pk.name].iloc[-1])
+                checkpoint["rows"] += len(frame)
+                self._write_checkpoint(table_dir, checkpoint)
+
+                written += len(frame)
+                logger.info(f"Exported {checkpoint['rows']} rows from {table_name} "
+                            f"(last id {checkpoint['last_id']}).")
+
+        return written
+
+    def export(self, table_names: list[str], restart: bool = False) -> dict[str, int]:
+        """Exports each table in turn; returns rows written per table."""
+        return {name: self.export_table(name, restart=restart) for name in table_names}
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: In-memory closed-trade history that refreshes incrementally from an (exit_datetime, id) watermark.
+"""
+
+import time
+import logging
+import threading
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from src.core.database import TradingDatabase
+
+logger = logging.getLogger(__name__)
+
+
+class TradeHistoryCache:
+    """
+    Closed trades as one DataFrame sorted by (exit_datetime, id), kept current by pulling only the
+    positions closed after the last row held.
+
+    The first refresh loads the full history; every later one asks get_trade_history for rows after
+    the (exit_datetime, id) watermark and appends them, so its cost depends on how many trades
+    closed in between rather than on history size. Windows are binary searches on exit_datetime.
+    Positions must not close with an exit_datetime earlier than ones already seen, which holds
+    when exit_datetime is stamped at close time.
+    """
+
+    def __init__(self, db: TradingDatabase):
+        self.db = db
+        self.frame = None
+        self.watermark = None
+        self.refreshed_at = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> int:
+        """Merges newly closed positions into the frame; returns how many were added."""
+        with self._lock:
+            started = time.perf_counter()
+            new = self.db.get_trade_history(as_frame=True, after=self.watermark)
+            new = new[new["exit_datetime"].notna()]
+            if self.frame is None:
+                new = new.sort_values(["exit_datetime", "id"], kind="stable")
+                self.frame = new.reset_index(drop=True)
+            elif len(new):
+                # Categoricals with different categories would concat to object; union them instead.
+                symbols = union_categoricals([self.frame["stock_symbol"], new["stock_symbol"]])
+                frame = pd.concat([self.frame.drop(columns="stock_symbol"), new.drop(columns="stock_symbol")],
+                                  ignore_index=True)
+                frame.insert(self.frame.columns.get_loc("stock_symbol"), "stock_symbol", symbols)
+                self.frame = frame
+
+            if len(self.frame):
+                last = self.frame.iloc[-1]
+                self.watermark = (last["exit_datetime"].to_pydatetime(), int(last["id"]))
+            self.refreshed_at = time.time()
+            logger.debug(f"Trade history refresh: {len(new)} new rows in {time.perf_counter() - started:.4f}s.")
+            return len(new)
+
+    def window(self, start=None, end=None) -> pd.DataFrame:
+        """Trades with start <= exit_datetime < end (either bound may be None)."""
+        frame = self.frame
+        if frame is None:
+            raise RuntimeError("refresh() has not been called.")
+        exits = frame["exit_datetime"].to_numpy()
+        lo = 0 if start is None else np.searchsorted(exits, np.datetime64(pd.Timestamp(start)), side="left")
+        hi = len(frame) if end is None else np.searchsorted(exits, np.datetime64(pd.Timestamp(end)), side="left")
+        return frame.iloc[lo:hi]
@@ -0,0 +1,483 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Write-behind trade journal: fsync'd local log first, batched database writes in the background.
+"""
+
+import os
+import json
+import time
+import queue
+import logging
+import datetime
+import threading
+from enum import Enum
+from pathlib import Path
+from collections import deque
+
+import numpy as np
+import orjson
+from sqlalchemy import select, insert, update, bindparam, func, inspect as sa_inspect
+from sqlalchemy import Enum as SQLEnum, DateTime, Date
+from sqlalchemy.exc import OperationalError, InterfaceError
+
+from src.core.application_constants import settings
+from src.core.database import BaseDatabase
+from src.core.database_models import Signal, Order, Position, PairPosition, PositionLeg
+from src.core.rollups import apply_closed_position
+from src.utils.instrumentation import DB_WRITE
+from src.utils.enums import PositionType
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_DIRNAME = "journal"  # under settings.save_location
+CHECKPOINT_FILENAME = "checkpoint.json"
+DEAD_LETTER_FILENAME = "dead-letter.log"
+MODELS = (Signal, Order, Position, PairPosition, PositionLeg)  # FK order: parents first
+TABLES = {model.__tablename__: model for model in MODELS}
+
+
+class JournalFull(Exception):
+    """The flush queue stayed full for longer than the journal's max_block; the entry was not journaled."""
+
+
+def _encode(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _decode(model, values: dict) -> dict:
+    """Restores enums and datetimes from their journal form using the model's column types."""
+    columns = model.__table__.columns
+    decoded = {}
+    for name, value in values.items():
+        column_type = columns[name].type
+        if value is not None:
+            if isinstance(column_type, SQLEnum):
+                value = column_type.enum_class(value)
+            elif isinstance(column_type, DateTime):
+                value = datetime.datetime.fromisoformat(value)
+            elif isinstance(column_type, Date):
+                value = datetime.date.fromisoformat(value)
+        decoded[name] = value
+    return decoded
+
+
+class TradeJournal:
+    """
+    Durable, non-blocking persistence for signals, orders, positions and pair positions with their legs.
+
+    Every record is appended to a local log segment and fsync'd before the call returns, so once
+    record_*() or add() has returned the event survives a crash. Nothing on that path talks to the
+    database. A background thread drains a bounded queue of logged entries and writes them in
+    batches, one transaction per batch with an executemany per table, and then advances a
+    checkpoint of the last sequence number stored.
+
+    The log, not the queue, is the source of truth. When the queue is full (the database is slow
+    or down) and `max_block` is 0, the entry is still logged but not enqueued. The flusher catches
+    up by reading the log from its checkpoint and switches back to the queue once it is level.
+    With `max_block` set, an append instead waits that long for room and then raises JournalFull
+    without logging anything, so a caller can retry without journaling the event twice. Startup
+    replays anything a crash or a failed close left unflushed. Replay is idempotent: inserts skip
+    ids already present, and a position close is added to daily_pnl only if the row was not
+    already CLOSED.
+
+    A batch that keeps failing is retried with backoff. After `max_attempts` failures, its first
+    entry is tried alone. If it still fails while the database answers, it is moved to
+    dead-letter.log and skipped, so a single bad entry cannot hold up everything logged after it.
+
+    Ids are allocated here, as in BulkLoader, so callers can link orders to signals immediately;
+    only one journal may write to a database at a time.
+    """
+
+    def __init__(self, db: BaseDatabase, directory: Path = None, batch_size: int = 500,
+                 flush_interval: float = 0.05, queue_size: int = 10_000, max_block: float = 0.0,
+                 fsync: bool = True, segment_bytes: int = 64 * 1024 * 1024, max_attempts: int = 5):
+        self.db = db
+        self.directory = Path(directory) if directory else settings.save_location / JOURNAL_DIRNAME
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_block = max_block
+        self.fsync = fsync
+        self.segment_bytes = segment_bytes
+        self.max_attempts = max_attempts
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._handle = None
+        self._next_seq = 1
+        self._next_ids = {}
+        self._flushed_seq = 0
+        self._spilled = False
+
+        self.appended = 0
+        self.flushed = 0
+        self.batches = 0
+        self.spills = 0
+        self.dead_lettered = 0
+        self.append_latencies = deque(maxlen=100_000)
+
+    # --- log segments -------------------------------------------------------------------------
+
+    def _segments(self) -> list[Path]:
+        return sorted(self.directory.glob("journal-*.log"))
+
+    def _read_checkpoint(self) -> int:
+        path = self.directory / CHECKPOINT_FILENAME
+        return json.loads(path.read_text())["seq"] if path.exists() else 0
+
+    def _write_checkpoint(self, seq: int) -> None:
+        tmp = self.directory / (CHECKPOINT_FILENAME + ".tmp")
+        tmp.write_text(json.dumps({"seq": seq}))
+        os.replace(tmp, self.directory / CHECKPOINT_FILENAME)
+
+    def _iter_log(self, after_seq: int):
+        """Yields logged entries with seq > after_seq in order, skipping a torn final line."""
+        segments = self._segments()
+        for k, segment in enumerate(segments):
+            if k + 1 < len(segments) and int(segments[k + 1].stem.split("-")[1]) <= after_seq + 1:
+                continue  # every entry in this segment precedes after_seq
+            with open(segment, "rb") as handle:
+                for line in handle:
+                    try:
+                        entry = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        logger.warning(f"Skipping a torn journal line in {segment.name}.")
+                        continue
+                    if entry["seq"] > after_seq:
+                        yield entry
+
+    def _open_segment(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+        self._handle = open(self.directory / f"journal-{self._next_seq:012d}.log", "ab")
+        if self._handle.tell():
+            self._handle.write(b"\n")  # never glue a new entry onto a torn line left by a crash
+
+    def _prune_segments(self) -> None:
+        """Deletes segments whose entries are all at or below the checkpoint."""
+        segments = self._segments()
+        for segment, following in zip(segments, segments[1:]):
+            if int(following.stem.split("-")[1]) - 1 <= self._flushed_seq:
+                segment.unlink()
+
+    # --- lifecycle ----------------------------------------------------------------------------
+
+    def start(self) -> "TradeJournal":
+        """Recovers state from the log and database, then starts the background flusher."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._flushed_seq = self._read_checkpoint()
+
+        last_seq, logged_ids = self._flushed_seq, {model: 0 for model in MODELS}
+        pending = 0
+        for entry in self._iter_log(self._flushed_seq):
+            last_seq = entry["seq"]
+            model = TABLES[entry["table"]]
+            logged_ids[model] = max(logged_ids[model], entry["id"])
+            pending += 1
+
+        with self.db.engine.connect() as conn:
+            for model in MODELS:
+                stored = conn.execute(select(func.max(model.id))).scalar() or 0
+                self._next_ids[model] = max(stored, logged_ids[model]) + 1
+
+        self._next_seq = last_seq + 1
+        self._spilled = pending > 0  # the flusher starts by replaying the log
+        if pending:
+            logger.info(f"Journal recovery: {pending} entries after seq {self._flushed_seq} to replay.")
+
+        self._open_segment()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="trade-journal", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self, timeout: float = 30.0) -> int:
+        """
+        Flushes what it can within `timeout`, stops the flusher and closes the log.
+
+        Returns the number of entries still unflushed. They stay in the log and are replayed by the
+        next start().
+        """
+        deadline = time.monotonic() + timeout
+        self.flush(timeout)
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(max(deadline - time.monotonic(), 0.0))
+            if self._thread.is_alive():
+                logger.error("Journal flusher did not stop within the close timeout.")
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+        if self.lag:
+            logger.warning(f"Journal closed with {self.lag} entries unflushed after seq {self._flushed_seq}; "
+                           f"they will be replayed on the next start.")
+        return self.lag
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def flush(self, timeout: float = None) -> bool:
+        """Waits until every appended entry is in the database; False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._flushed_seq < self._next_seq - 1:
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    @property
+    def lag(self) -> int:
+        """Entries logged but not yet in the database."""
+        return self._next_seq - 1 - self._flushed_seq
+
+    # --- append path --------------------------------------------------------------------------
+
+    def _wait_for_room(self) -> bool:
+        """Polls for a free queue slot for up to max_block seconds (the lock keeps other producers out)."""
+        deadline = time.monotonic() + self.max_block
+        while self._queue.full():
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+    def _append(self, op: str, model, row_id: int, values: dict) -> None:
+        started = time.perf_counter()
+        with self._lock:
+            if self.max_block and not self._spilled and not self._wait_for_room():
+                raise JournalFull(f"Flush queue full for {self.max_block}s; the entry was not journaled.")
+            entry = {"seq": self._next_seq, "op": op, "table": model.__tablename__, "id": row_id,
+                     "values": {k: _encode(v) for k, v in values.items()}}
+            self._next_seq += 1
+            self._handle.write(orjson.dumps(entry) + b"\n")
+            self._handle.flush()
+            if self.fsync:
+                os.fsync(self._handle.fileno())
+            if self._handle.tell() >= self.segment_bytes:
+                self._open_segment()
+
+            if not self._spilled:
+                try:
+                    self._queue.put_nowait(entry)
+                except queue.Full:
+                    self._spilled = True
+                    self.spills += 1
+                    logger.warning("Journal flush queue full; the flusher will read the log until it catches up.")
+            self.appended += 1
+        self.append_latencies.append(time.perf_counter() - started)
+
+    def _insert(self, model, values: dict) -> int:
+        with self._lock:
+            row_id = values.get("id") or self._next_ids[model]
+            self._next_ids[model] = max(self._next_ids[model], row_id + 1)
+        values = {k: v for k, v in values.items() if k != "id"}
+        self._append("insert", model, row_id, values)
+        return row_id
+
+    def record_signal(self, **values) -> int:
+        return self._insert(Signal, values)
+
+    def record_order(self, **values) -> int:
+        return self._insert(Order, values)
+
+    def record_position(self, **values) -> int:
+        return self._insert(Position, values)
+
+    def update_order(self, order_id: int, **values) -> None:
+        self._append("update", Order, order_id, values)
+
+    def update_position(self, position_id: int, **values) -> None:
+        self._append("update", Position, position_id, values)
+
+    def add(self, instance) -> int:
+        """Journals a transient instance of any model in MODELS, assigning and setting its id."""
+        model = type(instance)
+        values = {c.key: getattr(instance, c.key) for c in sa_inspect(model).column_attrs
+                  if getattr(instance, c.key) is not None}
+        instance.id = self._insert(model, values)
+        return instance.id
+
+    def add_all(self, instances) -> list[int]:
+        """add() for each instance in order."""
+        return [self.add(instance) for instance in instances]
+
+    # --- flusher ------------------------------------------------------------------------------
+
+    def _run(self) -> None:
+        replay = None
+        backoff = self.flush_interval
+        failures = 0
+        while not self._stop.is_set() or self._flushed_seq < self._next_seq - 1:
+            if self._stop.is_set() and self._queue.empty() and not self._spilled:
+                break
+            batch = []
+            try:
+                if self._spilled:
+                    replay = replay or self._iter_log(self._flushed_seq)
+                    batch = [entry for _, entry in zip(range(self.batch_size), replay)]
+                    if not batch:
+                        replay = None
+                        self._catch_up()
+                        continue
+                else:
+                    batch = self._take_batch()
+                    if not batch:
+                        continue
+
+                self._write_batch(batch)
+                backoff, failures = self.flush_interval, 0
+            except Exception:
+                failures += 1
+                replay = None
+                with self._lock:
+                    self._spilled = True  # entries taken off the queue are re-read from the log
+                    self._drain_queue()
+                if self._stop.is_set() and failures >= min(self.max_attempts, 3):
+                    logger.exception(f"Journal flush failed while closing; leaving {self.lag} entries in the log.")
+                    return
+                if failures >= self.max_attempts and batch and self._dead_letter(batch):
+                    backoff, failures = self.flush_interval, 0
+                    continue
+                logger.exception(f"Journal flush failed ({failures} in a row); retrying in {backoff:.2f}s.")
+                time.sleep(backoff)  # not _stop.wait: once stopped that returns at once and the loop would spin
+                backoff = min(backoff * 2, 5.0)
+
+    def _dead_letter(self, batch: list) -> bool:
+        """
+        Writes the first unflushed entry of a failing batch on its own. If that fails too with
+        something other than a connection/operational error while the database is reachable, the
+        entry itself is bad: it is appended to dead-letter.log and the checkpoint moves past it.
+        Returns False when the failure looks transient, so nothing is skipped.
+        """
+        pending = [entry for entry in batch if entry["seq"] > self._flushed_seq]
+        if not pending:
+            return False
+        entry = pending[0]
+        try:
+            self._write_batch([entry])
+            return True
+        except (OperationalError, InterfaceError):
+            return False
+        except Exception as error:
+            try:
+                with self.db.engine.connect() as conn:
+                    conn.execute(select(1))
+            except Exception:
+                return False
+            with open(self.directory / DEAD_LETTER_FILENAME, "ab") as handle:
+                handle.write(orjson.dumps({**entry, "error": str(error)}) + b"\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+        self._flushed_seq = entry["seq"]
+        self._write_checkpoint(self._flushed_seq)
+        self.dead_lettered += 1
+        logger.error(f"Journal entry {entry['seq']} ({entry['op']} {entry['table']} id={entry['id']}) failed "
+                     f"{self.max_attempts} times while the database was reachable; moved to {DEAD_LETTER_FILENAME}.")
+        return True
+
+    def _take_batch(self) -> list:
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _drain_queue(self) -> None:
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def _catch_up(self) -> None:
+        """Leaves replay mode once the log has been read up to the last appended entry."""
+        with self._lock:
+            if self._flushed_seq >= self._next_seq - 1:
+                self._drain_queue()
+                self._spilled = False
+                logger.info(f"Journal caught up at seq {self._flushed_seq}.")
+
+    def _write_batch(self, batch: list) -> None:
+        batch = [entry for entry in batch if entry["seq"] > self._flushed_seq]
+        if not batch:
+            return
+
+        with DB_WRITE.time(), self.db.engine.begin() as conn:
+            for model in MODELS:
+                rows = [{"id": e["id"], **_decode(model, e["values"])} for e in batch
+                        if e["op"] == "insert" and e["table"] == model.__tablename__]
+                if not rows:
+                    continue
+                existing = set(conn.execute(select(model.id).where(model.id.in_([r["id"] for r in rows]))).scalars())
+                rows = [r for r in rows if r["id"] not in existing]
+                if rows:
+                    conn.execute(insert(model), rows)
+                if model is Position:
+                    for row in rows:
+                        if row.get("status") is PositionType.CLOSED:
+                            apply_closed_position(conn, Position(**row))
+
+            self._apply_updates(conn, [e for e in batch if e["op"] == "update"])
+
+        self._flushed_seq = batch[-1]["seq"]
+        self._write_checkpoint(self._flushed_seq)
+        self.flushed += len(batch)
+        self.batches += 1
+        if self.batches % 100 == 0:
+            self._prune_segments()
+
+    def _apply_updates(self, conn, updates: list) -> None:
+        """Runs updates in log order, one executemany per consecutive run with the same table and columns."""
+        run = []
+        for entry in updates + [None]:
+            if run and (entry is None or (entry["table"], sorted(entry["values"])) !=
+                        (run[0]["table"], sorted(run[0]["values"]))):
+                self._update_run(conn, run)
+                run = []
+            if entry is not None:
+                run.append(entry)
+
+    def _update_run(self, conn, run: list) -> None:
+        model = TABLES[run[0]["table"]]
+        closing = []
+        ids = [e["id"] for e in run if model is Position and e["values"].get("status") == PositionType.CLOSED.value]
+        if ids:
+            closing = list(conn.execute(select(Position.id).where(
+                Position.id.in_(ids), Position.status != PositionType.CLOSED)).scalars())
+
+        names = sorted(run[0]["values"])
+        statement = (update(model.__table__)
+                     .where(model.__table__.c.id == bindparam("_id"))
+                     .values({name: bindparam(f"_v_{name}") for name in names}))
+        conn.execute(statement, [{"_id": e["id"], **{f"_v_{k}": v for k, v in _decode(model, e["values"]).items()}}
+                                 for e in run])
+
+        if closing:
+            for position in conn.execute(select(Position).where(Position.id.in_(closing))).all():
+                apply_closed_position(conn, position)
+
+    def latency_percentiles(self, q=(50, 99, 99.9)) -> dict:
+        """Append latency percentiles in seconds (log write + fsync + enqueue)."""
+        if not self.append_latencies:
+            return {p: float("nan") for p in q}
+        return dict(zip(q, np.percentile(np.asarray(self.append_latencies), q).tolist()))
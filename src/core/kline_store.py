@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Append-only, memory-mapped columnar store for OHLCV klines per symbol and interval.
+"""
+
+import os
+import re
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.core.application_constants import settings
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+KLINE_DIRNAME = "klines"  # under settings.save_location
+META_FILENAME = "meta.json"
+
+# Binance kline fields kept on disk, one raw little-endian file per column. Times are epoch milliseconds.
+KLINE_COLUMNS = {
+    "open_time": "<i8",
+    "open": "<f8",
+    "high": "<f8",
+    "low": "<f8",
+    "close": "<f8",
+    "volume": "<f8",
+    "close_time": "<i8",
+    "quote_volume": "<f8",
+    "trades": "<i8",
+    "taker_buy_base_volume": "<f8",
+    "taker_buy_quote_volume": "<f8",
+}
+
+INTERVALS = ("1m", "3m", "5m", "15m", "30m", "1h", "2h", "4h", "6h", "8h", "12h", "1d", "3d", "1w", "1M")
+
+_SYMBOL_PATTERN = re.compile(r"^[A-Z0-9]{2,20}$")
+
+
+def from_binance_klines(rows: list) -> dict:
+    """Converts Client.get_klines / kline stream rows (lists of strings and ints) into column arrays."""
+    if not rows:
+        return {name: np.empty(0, dtype=dtype) for name, dtype in KLINE_COLUMNS.items()}
+    table = np.asarray([row[:len(KLINE_COLUMNS)] for row in rows], dtype=object)
+    return {name: table[:, i].astype(np.float64).astype(dtype) for i, (name, dtype) in enumerate(KLINE_COLUMNS.items())}
+
+
+class KlineView:
+    """Zero-copy column views over a contiguous range of stored bars."""
+
+    def __init__(self, columns: dict):
+        self.columns = columns
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return len(self.columns["open_time"])
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """open_time as datetime64[ms], a view over the same memory."""
+        return self.columns["open_time"].view("datetime64[ms]")
+
+    def to_frame(self) -> "pd.DataFrame":
+        """Copies the range into a DataFrame indexed by open time."""
+        import pandas as pd
+
+        frame = pd.DataFrame({name: np.asarray(col) for name, col in self.columns.items() if name != "open_time"},
+                             index=pd.DatetimeIndex(self.timestamps, name="open_time"))
+        return frame
+
+
+class KlineStore:
+    """
+    Stores klines under `root/<interval>/<symbol>/` as one append-only binary file per column plus a
+    meta.json holding the committed row count.
+
+    Reads memory-map the column files, so slices are NumPy views with no copy or parse step, and
+    open_time is sorted, so a time range resolves with two binary searches. An append writes and
+    fsyncs the column files before bumping the row count, and any torn tail left by a crash beyond
+    the committed count is truncated on the next append. Nothing here touches the network.
+    """
+
+    def __init__(self, root: Path = None):
+        self.root = Path(root) if root else settings.save_location / KLINE_DIRNAME
+        self._maps = {}
+
+    def _directory(self, symbol: str, interval: str) -> Path:
+        if interval not in INTERVALS:
+            raise ValueError(f"Unknown kline interval '{interval}'; expected one of {INTERVALS}.")
+        if not _SYMBOL_PATTERN.match(symbol):
+            raise ValueError(f"Invalid symbol '{symbol}'.")
+        return self.root / interval / symbol
+
+    def _rows(self, directory: Path) -> int:
+        meta = directory / META_FILENAME
+        return json.loads(meta.read_text())["rows"] if meta.exists() else 0
+
+    def _commit(self, directory: Path, rows: int) -> None:
+        tmp = directory / (META_FILENAME + ".tmp")
+        tmp.write_text(json.dumps({"rows": rows, "columns": KLINE_COLUMNS}))
+        os.replace(tmp, directory / META_FILENAME)
+
+    def intervals(self) -> list[str]:
+        return [i for i in INTERVALS if (self.root / i).is_dir()]
+
+    def symbols(self, interval: str) -> list[str]:
+        directory = self.root / interval
+        return sorted(d.name for d in directory.iterdir() if (d / META_FILENAME).exists()) if directory.is_dir() else []
+
+    def count(self, symbol: str, interval: str) -> int:
+        return self._rows(self._directory(symbol, interval))
+
+    def last_open_time(self, symbol: str, interval: str):
+        """open_time (ms) of the newest stored bar, or None; where an incremental fetch resumes."""
+        view = self._columns(symbol, interval)
+        return int(view["open_time"][-1]) if len(view["open_time"]) else None
+
+    def _columns(self, symbol: str, interval: str) -> dict:
+        """Memory-maps every column up to the committed row count, reusing maps while the count is unchanged."""
+        directory = self._directory(symbol, interval)
+        rows = self._rows(directory)
+        cached = self._maps.get((symbol, interval))
+        if cached is not None and cached[0] == rows:
+            return cached[1]
+
+        if rows == 0:
+            columns = {name: np.empty(0, dtype=dtype) for name, dtype in KLINE_COLUMNS.items()}
+        else:
+            columns = {name: np.memmap(directory / f"{name}.bin", dtype=dtype, mode="r", shape=(rows,))
+                       for name, dtype in KLINE_COLUMNS.items()}
+        self._maps[(symbol, interval)] = (rows, columns)
+        return columns
+
+    def read(self, symbol: str, interval: str, start=None, end=None) -> KlineView:
+        """
+        Bars with start <= open_time < end as zero-copy views. Bounds are epoch milliseconds,
+        datetime-likes or None for open-ended.
+        """
+        columns = self._columns(symbol, interval)
+        open_time = columns["open_time"]
+        lo = 0 if start is None else int(np.searchsorted(open_time, _to_millis(start), side="left"))
+        hi = len(open_time) if end is None else int(np.searchsorted(open_time, _to_millis(end), side="left"))
+        return KlineView({name: col[lo:hi] for name, col in columns.items()})
+
+    def append(self, symbol: str, interval: str, bars) -> int:
+        """
+        Appends bars (a dict of column arrays or a DataFrame with KLINE_COLUMNS) in open_time order.
+
+        Bars older than the newest stored bar are skipped, and a bar with the same open_time as the
+        newest one replaces it, since Binance keeps re-sending the candle that is still open. Missing
+        optional columns are stored as zeros. Returns the number of rows added.
+        """
+        open_time = np.asarray(bars["open_time"], dtype=np.int64)
+        if len(open_time) == 0:
+            return 0
+        if np.any(np.diff(open_time) <= 0):
+            raise ValueError("Bars must be strictly increasing in open_time.")
+
+        directory = self._directory(symbol, interval)
+        directory.mkdir(parents=True, exist_ok=True)
+        rows = self._rows(directory)
+        last = self.last_open_time(symbol, interval)
+
+        start = 0
+        if last is not None:
+            start = int(np.searchsorted(open_time, last, side="left"))
+            if start < len(open_time) and open_time[start] == last:
+                self._replace_last(directory, rows, bars, start)
+                start += 1
+        if start >= len(open_time):
+            return 0
+
+        # Windows cannot truncate a file while it is mapped: drop our maps first (the next read
+        # rebuilds them) and only truncate when a crash actually left a tail past the commit.
+        self._maps.pop((symbol, interval), None)
+        new_rows = len(open_time) - start
+        for name, dtype in KLINE_COLUMNS.items():
+            values = bars[name] if name in bars else np.zeros(len(open_time))
+            data = np.ascontiguousarray(np.asarray(values)[start:], dtype=dtype)
+            path = directory / f"{name}.bin"
+            committed = rows * np.dtype(dtype).itemsize
+            with open(path, "ab") as handle:
+                if path.stat().st_size > committed:
+                    handle.truncate(committed)  # drop an uncommitted tail
+                handle.seek(0, os.SEEK_END)
+                handle.write(data.tobytes())
+                handle.flush()
+                os.fsync(handle.fileno())
+
+        self._commit(directory, rows + new_rows)
+        return new_rows
+
+    def _replace_last(self, directory: Path, rows: int, bars, index: int) -> None:
+        for name, dtype in KLINE_COLUMNS.items():
+            value = np.asarray(bars[name])[index] if name in bars else 0
+            itemsize = np.dtype(dtype).itemsize
+            with open(directory / f"{name}.bin", "r+b") as handle:
+                handle.seek((rows - 1) * itemsize)
+                handle.write(np.asarray([value], dtype=dtype).tobytes())
+                handle.flush()
+                os.fsync(handle.fileno())
+        self._maps.pop((directory.name, directory.parent.name), None)
+
+    def panel(self, symbols: list[str], interval: str, field: str = "close", start=None, end=None) -> tuple:
+        """
+        Aligns one field across symbols on the union of their bar times, forward-filling gaps.
+
+        Returns (timestamps, matrix) with matrix shaped (bars, symbols), the layout PairScreener and
+        VectorBacktest take. Leading rows before every symbol has a bar are dropped. Unlike read(),
+        this copies.
+        """
+        views = [self.read(s, interval, start, end) for s in symbols]
+        times = np.unique(np.concatenate([np.asarray(v["open_time"]) for v in views]))
+
+        matrix = np.full((len(times), len(symbols)), np.nan)
+        for j, view in enumerate(views):
+            matrix[np.searchsorted(times, view["open_time"]), j] = view[field]
+
+        import pandas as pd
+
+        filled = pd.DataFrame(matrix).ffill().to_numpy()
+        complete = np.flatnonzero(~np.isnan(filled).any(axis=1))
+        first = complete[0] if complete.size else len(times)
+        return times[first:].view("datetime64[ms]"), filled[first:]
+
+
+def _to_millis(value) -> int:
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    import pandas as pd
+
+    return int(pd.Timestamp(value).value // 1_000_000)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Incremental maintenance of the daily_pnl rollup table.
+"""
+
+import logging
+from sqlalchemy import event, func, insert, delete, inspect as sa_inspect
+from sqlalchemy.orm import Session as SessionType
+from src.core.database_models import DailyPnl, Position
+from src.utils.enums import PositionType
+
+logger = logging.getLogger(__name__)
+
+
+def _is_closed(status) -> bool:
+    return status in (PositionType.CLOSED, PositionType.CLOSED.value)
+
+
+def _just_closed(session: SessionType, position: Position) -> bool:
+    """True when this flush is the one that moves the position into CLOSED."""
+    if not _is_closed(position.status):
+        return False
+    if position in session.new:
+        return True
+    history = sa_inspect(position).attrs.status.history
+    return history.has_changes() and not any(_is_closed(s) for s in history.deleted)
+
+
+def apply_closed_position(connection, position: Position) -> None:
+    """Adds one closed position's realised PnL to its (day, symbol) bucket."""
+    if position.exit_datetime is None or position.exit_price is None or position.entry_price is None:
+        logger.warning(f"Position {position.id} closed without exit data; daily_pnl not updated.")
+        return
+
+    day = position.exit_datetime.date()
+    pnl = (position.exit_price - position.entry_price) * position.quantity
+
+    connection.execute(_upsert(connection.dialect.name, day, position.stock_symbol, pnl))
+
+
+def _upsert(dialect: str, day, stock_symbol: str, pnl: float):
+    """
+    One INSERT ... ON DUPLICATE KEY / ON CONFLICT statement adding to the (day, symbol) bucket.
+
+    An UPDATE followed by an INSERT when no row matched races: two positions closing at once for
+    a new bucket would both insert, and the second would fail on the primary key.
+    """
+    values = dict(day=day, stock_symbol=stock_symbol, pnl=pnl, trade_count=1)
+    if dialect in ("mysql", "mariadb"):
+        from sqlalchemy.dialects.mysql import insert as dialect_insert
+
+        statement = dialect_insert(DailyPnl).values(**values)
+        return statement.on_duplicate_key_update(pnl=DailyPnl.pnl + statement.inserted.pnl,
+                                                 trade_count=DailyPnl.trade_count + 1)
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+        statement = dialect_insert(DailyPnl).values(**values)
+        return statement.on_conflict_do_update(
+            index_elements=[DailyPnl.day, DailyPnl.stock_symbol],
+            set_=dict(pnl=DailyPnl.pnl + statement.excluded.pnl, trade_count=DailyPnl.trade_count + 1),
+        )
+    raise NotImplementedError(f"No daily_pnl upsert for the {dialect} dialect.")
+
+
+def _before_flush(session: SessionType, flush_context, instances) -> None:
+    closed = [obj for obj in (*session.new, *session.dirty)
+              if isinstance(obj, Position) and _just_closed(session, obj)]
+    if not closed:
+        return
+
+    connection = session.connection()
+    for position in closed:
+        apply_closed_position(connection, position)
+
+
+def register_daily_pnl_rollup(session_factory) -> None:
+    """Keep daily_pnl in step with every position closed through sessions from `session_factory`."""
+    if not event.contains(session_factory, "before_flush", _before_flush):
+        event.listen(session_factory, "before_flush", _before_flush)
+
+
+def backfill_daily_pnl(engine) -> int:
+    """Rebuilds daily_pnl from every closed position in one INSERT ... SELECT. Returns the bucket count."""
+    DailyPnl.__table__.create(engine, checkfirst=True)
+
+    day_expr = func.date(Position.exit_datetime)
+    pnl_expr = (Position.exit_price - Position.entry_price) * Position.quantity
+
+    source = (
+        Position.__table__.select()
+        .with_only_columns(
+            day_expr.label("day"),
+            Position.stock_symbol,
+            func.coalesce(func.sum(pnl_expr), 0.0).label("pnl"),
+            func.count().label("trade_count"),
+        )
+        .where(Position.status == PositionType.CLOSED, Position.exit_datetime.isnot(None))
+        .group_by(day_expr, Position.stock_symbol)
+    )
+
+    with engine.begin() as conn:
+        conn.execute(delete(DailyPnl))
+        conn.execute(insert(DailyPnl).from_select(["day", "stock_symbol", "pnl", "trade_count"], source))
+        buckets = conn.execute(func.count().select().select_from(DailyPnl)).scalar()
+
+    logger.info(f"Backfilled daily_pnl with {buckets} (day, symbol) buckets.")
+    return buckets
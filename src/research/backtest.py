@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Vectorized z-score pairs backtester over many pairs and long bar histories.
+"""
+
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from src.core.database import TradingMetrics
+from src.core.database_models import Signal, Order, Position
+from src.strategy.spread_engine import signal_confidence
+from src.utils.enums import SignalType, OrderType, OrderSide, StatusType, PositionType
+
+logger = logging.getLogger(__name__)
+
+
+def ffill(events: np.ndarray) -> np.ndarray:
+    """Forward-fills non-NaN values down axis 0; leading NaNs become 0."""
+    steps = np.arange(events.shape[0])[:, None]
+    idx = np.where(np.isnan(events), 0, steps)
+    np.maximum.accumulate(idx, axis=0, out=idx)
+    filled = np.take_along_axis(events, idx, axis=0)
+    return np.nan_to_num(filled, nan=0.0)
+
+
+def rolling_zscore(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling z-score down axis 0 via cumulative sums; the first `window - 1` rows are NaN."""
+    padded = np.vstack([np.zeros((1, values.shape[1])), values])
+    c1 = np.cumsum(padded, axis=0)
+    c2 = np.cumsum(padded ** 2, axis=0)
+
+    mean = (c1[window:] - c1[:-window]) / window
+    var = np.maximum((c2[window:] - c2[:-window]) / window - mean ** 2, 0.0)
+
+    z = np.full(values.shape, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z[window - 1:] = (values[window - 1:] - mean) / np.sqrt(var)
+    return z
+
+
+def position_state(z: np.ndarray, entry_z: float, exit_z: float, stop_z: float = None) -> np.ndarray:
+    """
+    Target spread position per bar from the z-score rules: +1 when z < -entry_z, -1 when
+    z > entry_z, 0 once |z| < exit_z or |z| > stop_z, otherwise the previous state (a forward-fill).
+    """
+    events = np.full(z.shape, np.nan)
+    with np.errstate(invalid="ignore"):
+        events[z < -entry_z] = 1.0
+        events[z > entry_z] = -1.0
+        events[np.abs(z) < exit_z] = 0.0
+        if stop_z is not None:
+            events[np.abs(z) > stop_z] = 0.0
+    return ffill(events)
+
+
+def match_round_trips(state: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pairs every entry in a (steps, pairs) state matrix with its exit.
+
+    Returns (pair_index, entry_step, exit_step) sorted by pair then entry step; exit_step is -1
+    while a position is still open at the last step. A direct flip from +1 to -1 is an exit and an
+    entry on the same step.
+    """
+    previous = np.vstack([np.zeros((1, state.shape[1])), state[:-1]])
+    changed = state != previous
+    entries = changed & (state != 0)
+    exits = changed & (previous != 0)
+
+    # nonzero on the transpose sorts by pair then step, so the k-th exit of a pair closes its k-th entry.
+    en_pair, en_step = np.nonzero(entries.T)
+    ex_pair, ex_step = np.nonzero(exits.T)
+
+    en_count = np.bincount(en_pair, minlength=state.shape[1])
+    ex_count = np.bincount(ex_pair, minlength=state.shape[1])
+    en_offset = np.concatenate([[0], np.cumsum(en_count)[:-1]])
+    ex_offset = np.concatenate([[0], np.cumsum(ex_count)[:-1]])
+
+    rank = np.arange(len(en_pair)) - en_offset[en_pair]
+    closed = rank < ex_count[en_pair]
+    exit_step = np.full(len(en_pair), -1)
+    exit_step[closed] = ex_step[ex_offset[en_pair[closed]] + rank[closed]]
+    return en_pair, en_step, exit_step
+
+
+@dataclass(frozen=True)
+class BacktestConfig:
+    window: int = 96
+    entry_z: float = 2.0
+    exit_z: float = 0.5
+    stop_z: float = None  # flatten when |z| exceeds this; None disables the stop
+    quantity: float = 1.0  # units of the traded instrument per position
+    slippage_bps: float = 0.0  # paid on every fill: buys fill above the price, sells below
+    fill_delay: int = 1  # bars from signal to fill; 1 fills at the next bar, as a backtrader market order
+
+
+@dataclass
+class BacktestResult:
+    """One element per position, in pair then entry order (the order positions are written in)."""
+    pairs: list[str]
+    timestamps: np.ndarray
+    pair_index: np.ndarray
+    entry_step: np.ndarray  # fill steps; the signal fired fill_delay bars earlier
+    exit_step: np.ndarray  # -1 while open at the end of the data
+    quantity: np.ndarray  # signed: negative for short spread positions
+    entry_price: np.ndarray
+    exit_price: np.ndarray  # NaN while open
+    entry_z: np.ndarray
+    exit_z: np.ndarray
+    fill_delay: int
+
+    @property
+    def closed(self) -> np.ndarray:
+        return self.exit_step >= 0
+
+    @property
+    def pnl(self) -> np.ndarray:
+        """Realised PnL per position, (exit_price - entry_price) * quantity as TradingDatabase computes it."""
+        return (self.exit_price - self.entry_price) * self.quantity
+
+    def fills(self) -> pd.DataFrame:
+        """Net fills per (pair, step): a same-bar exit and re-entry collapse into one order, as a broker would fill them."""
+        closed = self.closed
+        frame = pd.DataFrame({
+            "pair": np.concatenate([self.pair_index, self.pair_index[closed]]),
+            "step": np.concatenate([self.entry_step, self.exit_step[closed]]),
+            "size": np.concatenate([self.quantity, -self.quantity[closed]]),
+            "price": np.concatenate([self.entry_price, self.exit_price[closed]]),
+        })
+        fills = frame.groupby(["pair", "step"], sort=True).agg(size=("size", "sum"), price=("price", "first"))
+        return fills.reset_index()
+
+    def metrics(self) -> TradingMetrics:
+        """The same KPIs TradingDatabase.get_metrics returns once these positions are loaded."""
+        closed = np.flatnonzero(self.closed)
+        if closed.size == 0:
+            return TradingMetrics()
+
+        pnl = self.pnl[closed]
+        exit_time = self.timestamps[self.exit_step[closed]]
+        entry_time = self.timestamps[self.entry_step[closed]]
+        order = np.lexsort((closed, exit_time))  # exit time, then position id
+
+        wins, losses = int((pnl > 0).sum()), int((pnl < 0).sum())
+        total = wins + losses
+        cumm = np.round(np.cumsum(pnl[order]), 2)
+
+        return TradingMetrics(
+            total_pnl=float(pnl.sum()),
+            wins=wins,
+            losses=losses,
+            win_ratio=round(wins / total if total > 0 else 0, 3),
+            trade_count=int(closed.size),
+            avg_duration_seconds=float((exit_time - entry_time).astype("timedelta64[ns]").astype(np.int64).mean() / 1e9),
+            cumm_returns=list(zip(pd.DatetimeIndex(exit_time[order]).to_pydatetime(), cumm.tolist())),
+        )
+
+    def to_database(self, loader) -> int:
+        """
+        Writes one signal + filled market order per entry and per exit, and one position per entry,
+        through a BulkLoader. Signals and order submissions are stamped at the signal bar, fills at
+        the fill bar. Returns the number of rows written.
+        """
+        n = len(self.pair_index)
+        if n == 0:
+            return 0
+
+        pairs = np.array(self.pairs, dtype=object)
+        closed = self.closed
+        long = self.quantity > 0
+
+        written = 0
+        order_ids = {}
+        for side, mask, steps, is_buy, price, z in (
+            ("entry", np.ones(n, dtype=bool), self.entry_step, long, self.entry_price, self.entry_z),
+            ("exit", closed, self.exit_step[closed], ~long[closed], self.exit_price[closed], self.exit_z[closed]),
+        ):
+            filled = self.timestamps[steps]
+            signalled = self.timestamps[steps - self.fill_delay]
+            signal_ids = loader.reserve_ids(Signal, len(steps))
+            order_ids[side] = loader.reserve_ids(Order, len(steps))
+            symbols = pairs[self.pair_index[mask]]
+
+            loader.add_columns(Signal, {
+                "id": signal_ids,
+                "stock_symbol": symbols,
+                "signal_type": np.where(is_buy, SignalType.BUY, SignalType.SELL),
+                "confidence": np.round(signal_confidence(z), 3),
+                "signal_datetime": signalled,
+            })
+            loader.add_columns(Order, {
+                "id": order_ids[side],
+                "signal_id": signal_ids,
+                "stock_symbol": symbols,
+                "order_type": [OrderType.MARKET] * len(steps),
+                "side": np.where(is_buy, OrderSide.BUY, OrderSide.SELL),
+                "quantity": np.abs(self.quantity[mask]),
+                "price": price,
+                "status": [StatusType.FILLED] * len(steps),
+                "submission_datetime": signalled,
+                "filled_datetime": filled,
+            })
+            written += 2 * len(steps)
+
+        exit_order_ids = np.full(n, -1, dtype=np.int64)
+        exit_order_ids[closed] = order_ids["exit"]
+        exit_time = np.full(n, np.datetime64("NaT"), dtype="datetime64[ns]")
+        exit_time[closed] = self.timestamps[self.exit_step[closed]]
+
+        loader.add_columns(Position, {
+            "id": loader.reserve_ids(Position, n),
+            "stock_symbol": pairs[self.pair_index],
+            "entry_order_id": order_ids["entry"],
+            "exit_order_id": [int(i) if i >= 0 else None for i in exit_order_ids],
+            "quantity": self.quantity,
+            "entry_price": self.entry_price,
+            "exit_price": self.exit_price,
+            "entry_datetime": self.timestamps[self.entry_step],
+            "exit_datetime": exit_time,
+            "status": np.where(closed, PositionType.CLOSED, PositionType.OPEN),
+        })
+        loader.flush()
+        return written + n
+
+
+class VectorBacktest:
+    """
+    Backtests the z-score pairs rules over a (steps, pairs) grid in a handful of array passes.
+
+    `spread` drives the signals and `prices` is the traded instrument (for a pair, the A/B ratio as
+    recorded on Signal/Order/Position rows). The position state machine is a forward-fill, fills
+    are the state shifted by `fill_delay` bars, and round trips are matched with cumulative counts,
+    so nothing loops per bar or per pair.
+    """
+
+    def __init__(self, pairs: list[str], timestamps: np.ndarray, prices: np.ndarray, spread: np.ndarray,
+                 config: BacktestConfig = BacktestConfig()):
+        if prices.shape != spread.shape or prices.shape != (len(timestamps), len(pairs)):
+            raise ValueError(f"prices {prices.shape} and spread {spread.shape} must both be "
+                             f"(len(timestamps), len(pairs)) = ({len(timestamps)}, {len(pairs)}).")
+        if config.fill_delay < 0:
+            raise ValueError("fill_delay cannot be negative.")
+
+        self.pairs = list(pairs)
+        self.timestamps = np.asarray(timestamps, dtype="datetime64[ns]")
+        self.prices = prices
+        self.spread = spread
+        self.config = config
+
+    @classmethod
+    def from_legs(cls, pairs: list[str], timestamps: np.ndarray, price_a: np.ndarray, price_b: np.ndarray,
+                  hedge_ratios, intercepts=None, config: BacktestConfig = BacktestConfig()) -> "VectorBacktest":
+        """Spread log A - hedge_ratio * log B - intercept (as SpreadEngine computes it), trading the A/B ratio."""
+        intercepts = np.zeros(len(pairs)) if intercepts is None else np.asarray(intercepts)
+        spread = np.log(price_a) - np.asarray(hedge_ratios) * np.log(price_b) - intercepts
+        return cls(pairs, timestamps, price_a / price_b, spread, config)
+
+    @classmethod
+    def from_market(cls, paths, config: BacktestConfig = BacktestConfig()) -> "VectorBacktest":
+        """Backtests synthetic MarketPaths on their true spread, trading the mid ratio."""
+        return cls(paths.pairs, paths.timestamps, paths.ratio, paths.log_spread, config)
+
+    def run(self) -> BacktestResult:
+        cfg = self.config
+        z = rolling_zscore(self.spread, cfg.window)
+        state = position_state(z, cfg.entry_z, cfg.exit_z, cfg.stop_z)
+
+        # Position actually held at each bar: the signal state fill_delay bars earlier.
+        held = np.zeros_like(state)
+        held[cfg.fill_delay:] = state[:len(state) - cfg.fill_delay]
+        pair, entry_step, exit_step = match_round_trips(held)
+
+        closed = exit_step >= 0
+        direction = held[entry_step, pair]
+        slip = cfg.slippage_bps * 1e-4
+
+        entry_price = self.prices[entry_step, pair] * (1 + slip * direction)
+        exit_price = np.full(len(pair), np.nan)
+        exit_price[closed] = self.prices[exit_step[closed], pair[closed]] * (1 - slip * direction[closed])
+
+        exit_z = np.full(len(pair), np.nan)
+        exit_z[closed] = z[exit_step[closed] - cfg.fill_delay, pair[closed]]
+
+        logger.info(f"Backtested {len(self.pairs)} pairs over {len(self.timestamps):,} bars: "
+                    f"{len(pair):,} positions, {int(closed.sum()):,} closed.")
+        return BacktestResult(
+            pairs=self.pairs,
+            timestamps=self.timestamps,
+            pair_index=pair,
+            entry_step=entry_step,
+            exit_step=exit_step,
+            quantity=direction * cfg.quantity,
+            entry_price=entry_price,
+            exit_price=exit_price,
+            entry_z=z[entry_step - cfg.fill_delay, pair],
+            exit_z=exit_z,
+            fill_delay=cfg.fill_delay,
+        )
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Reference backtrader run of the z-score pairs rules, used to cross-check VectorBacktest.
+"""
+
+import math
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from src.research.backtest import BacktestConfig, BacktestResult
+
+logger = logging.getLogger(__name__)
+
+# Synthetic high/low band around the traded price so backtrader's slippage is never capped by the bar range.
+_BAR_RANGE = 0.05
+
+
+@dataclass(frozen=True)
+class CrossCheck:
+    fills_vectorized: int
+    fills_backtrader: int
+    size_mismatches: int
+    max_price_error: float
+    pnl_vectorized: float
+    pnl_backtrader: float
+
+    @property
+    def ok(self) -> bool:
+        return (self.fills_vectorized == self.fills_backtrader and self.size_mismatches == 0
+                and self.max_price_error < 1e-9 and math.isclose(self.pnl_vectorized, self.pnl_backtrader,
+                                                                 rel_tol=1e-9, abs_tol=1e-6))
+
+
+def run_backtrader(pairs: list[str], timestamps: np.ndarray, prices: np.ndarray, spread: np.ndarray,
+                   config: BacktestConfig = BacktestConfig()) -> tuple[pd.DataFrame, float]:
+    """
+    Runs the same rules bar by bar in backtrader, one data feed per pair carrying the traded price
+    and an extra `spread` line. Returns (fills, realised PnL of closed trades); fills has the
+    columns pair, step, size, price like BacktestResult.fills().
+    """
+    import backtrader as bt
+
+    if config.fill_delay != 1:
+        raise ValueError("backtrader market orders fill on the next bar; only fill_delay=1 can be cross-checked.")
+
+    class SpreadData(bt.feeds.PandasData):
+        lines = ("spread",)
+        params = (("spread", -1),)
+
+    class ZScorePairs(bt.Strategy):
+        params = (("cfg", config),)
+
+        def __init__(self):
+            cfg = self.p.cfg
+            self.fills = []
+            self.realised = 0.0
+            self.z = [
+                (d.spread - bt.ind.SMA(d.spread, period=cfg.window)) / bt.ind.StdDev(d.spread, period=cfg.window)
+                for d in self.datas
+            ]
+
+        def notify_order(self, order):
+            if order.status == order.Completed:
+                self.fills.append((self.datas.index(order.data), len(order.data) - 1,
+                                   order.executed.size, order.executed.price))
+
+        def notify_trade(self, trade):
+            if trade.isclosed:
+                self.realised += trade.pnl
+
+        def next(self):
+            cfg = self.p.cfg
+            for d, z in zip(self.datas, self.z):
+                z = z[0]
+                if math.isnan(z):
+                    continue
+                current = int(np.sign(self.getposition(d).size))
+                target = current
+                if z < -cfg.entry_z:
+                    target = 1
+                if z > cfg.entry_z:
+                    target = -1
+                if abs(z) < cfg.exit_z:
+                    target = 0
+                if cfg.stop_z is not None and abs(z) > cfg.stop_z:
+                    target = 0
+                if target != current:
+                    self.order_target_size(data=d, target=target * cfg.quantity)
+
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.broker.setcash(1e15)
+    if config.slippage_bps:
+        cerebro.broker.set_slippage_perc(config.slippage_bps * 1e-4, slip_open=True, slip_match=True)
+
+    index = pd.DatetimeIndex(timestamps)
+    for p, name in enumerate(pairs):
+        price = prices[:, p]
+        frame = pd.DataFrame({"open": price, "high": price * (1 + _BAR_RANGE), "low": price * (1 - _BAR_RANGE),
+                              "close": price, "volume": 0.0, "openinterest": 0.0, "spread": spread[:, p]},
+                             index=index)
+        cerebro.adddata(SpreadData(dataname=frame), name=name)
+
+    cerebro.addstrategy(ZScorePairs)
+    strategy = cerebro.run()[0]
+
+    fills = pd.DataFrame(strategy.fills, columns=["pair", "step", "size", "price"])
+    fills = fills.sort_values(["pair", "step"], kind="stable").reset_index(drop=True)
+    return fills, strategy.realised
+
+
+def cross_check(result: BacktestResult, bt_fills: pd.DataFrame, bt_pnl: float) -> CrossCheck:
+    """Compares net fills (pair, bar, size, price) and realised PnL between the two engines."""
+    ours = result.fills()
+    ours = ours[ours["size"] != 0]  # a flip netting to zero would not reach the broker
+    merged = ours.merge(bt_fills, on=["pair", "step"], how="outer", suffixes=("_vec", "_bt"), indicator=True)
+    both = merged[merged["_merge"] == "both"]
+
+    size_mismatches = int((merged["_merge"] != "both").sum() +
+                          (~np.isclose(both["size_vec"], both["size_bt"])).sum())
+    price_error = np.abs(both["price_vec"] / both["price_bt"] - 1.0)
+
+    return CrossCheck(
+        fills_vectorized=len(ours),
+        fills_backtrader=len(bt_fills),
+        size_mismatches=size_mismatches,
+        max_price_error=float(price_error.max()) if len(price_error) else 0.0,
+        pnl_vectorized=float(np.nansum(result.pnl)),
+        pnl_backtrader=float(bt_pnl),
+    )
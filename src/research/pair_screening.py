@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Parallel Engle-Granger cointegration screening over a shared price matrix.
+"""
+
+import os
+import logging
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAX_TASK_SIZE = 256
+TASK_MEMORY_BUDGET = 64 * 1024 * 1024  # bytes of residual/regressor columns per task
+
+# Per-worker view of the shared log-price matrix, set by _attach_shared_prices.
+_shared = {}
+
+
+@dataclass(frozen=True)
+class PairCandidate:
+    symbol_a: str
+    symbol_b: str
+    correlation: float
+    hedge_ratio: float  # log A = intercept + hedge_ratio * log B + residual
+    intercept: float
+    adf_stat: float
+    p_value: float
+    half_life: float  # in bars; inf when the residual does not mean-revert
+
+
+def _attach_shared_prices(name: str, shape: tuple, dtype: str) -> None:
+    shm = shared_memory.SharedMemory(name=name)
+    _shared["shm"] = shm  # keep the mapping alive for the worker's lifetime
+    _shared["prices"] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def engle_granger(y: np.ndarray, x: np.ndarray, maxlag: int = 1, autolag=None) -> tuple:
+    """Returns (hedge_ratio, intercept, adf_stat, p_value, half_life) for y ~ x, as statsmodels' coint."""
+    from statsmodels.tsa.stattools import adfuller
+    from statsmodels.tsa.adfvalues import mackinnonp
+
+    x_mean, y_mean = x.mean(), y.mean()
+    x_dev = x - x_mean
+    hedge_ratio = float(np.dot(x_dev, y - y_mean) / np.dot(x_dev, x_dev))
+    intercept = float(y_mean - hedge_ratio * x_mean)
+    resid = y - intercept - hedge_ratio * x
+
+    adf_stat = float(adfuller(resid, maxlag=maxlag, autolag=autolag, regression="n")[0])
+    p_value = float(mackinnonp(adf_stat, regression="c", N=2))
+
+    # Half-life from the AR(1) fit  d(resid) = lam * resid[t-1] + e.
+    lagged, delta = resid[:-1], np.diff(resid)
+    lam = float(np.dot(lagged, delta) / np.dot(lagged, lagged))
+    half_life = -np.log(2) / lam if lam < 0 else np.inf
+
+    return hedge_ratio, intercept, adf_stat, p_value, half_life
+
+
+def _mackinnon_p_values(adf_stats: np.ndarray, n_series: int = 2) -> np.ndarray:
+    """Vectorized statsmodels.tsa.adfvalues.mackinnonp for the constant-term case."""
+    from scipy.stats import norm
+    from statsmodels.tsa import adfvalues
+
+    k = n_series - 1
+    small = np.polyval(adfvalues.tau_c_smallp[k][::-1], adf_stats)
+    large = np.polyval(adfvalues.tau_c_largep[k][::-1], adf_stats)
+    p_values = norm.cdf(np.where(adf_stats <= adfvalues.tau_star_c[k], small, large))
+    p_values[adf_stats > adfvalues.tau_max_c[k]] = 1.0
+    p_values[adf_stats < adfvalues.tau_min_c[k]] = 0.0
+    return p_values
+
+
+def _batched_engle_granger(y: np.ndarray, x: np.ndarray, maxlag: int) -> tuple:
+    """
+    Engle-Granger for many pairs at once: columns of y (T, m) regressed on columns of x (T, m).
+
+    The ADF regression on each residual uses a fixed lag order, which is exactly what
+    statsmodels' adfuller(..., autolag=None, regression="n") fits, but solved as one stack of
+    small normal-equation systems instead of m separate OLS fits.
+    """
+    def dot(a, b):
+        return np.einsum("tm,tm->m", a, b)
+
+    x_dev = x - x.mean(axis=0)
+    y_dev = y - y.mean(axis=0)
+    hedge_ratio = dot(x_dev, y_dev) / dot(x_dev, x_dev)
+    intercept = y.mean(axis=0) - hedge_ratio * x.mean(axis=0)
+    resid = y - intercept - hedge_ratio * x
+
+    delta = np.diff(resid, axis=0)
+    nobs = delta.shape[0] - maxlag
+    regressors = [resid[maxlag:-1]] + [delta[maxlag - k:-k] for k in range(1, maxlag + 1)]
+    target = delta[maxlag:]
+
+    n_reg = len(regressors)
+    xtx = np.empty((y.shape[1], n_reg, n_reg))
+    for a in range(n_reg):
+        for b in range(a + 1):
+            xtx[:, a, b] = xtx[:, b, a] = dot(regressors[a], regressors[b])
+    xty = np.stack([dot(r, target) for r in regressors], axis=1)
+
+    coef = np.linalg.solve(xtx, xty[..., None])[..., 0]
+    ssr = dot(target, target) - np.einsum("mk,mk->m", coef, xty)
+    sigma2 = ssr / (nobs - n_reg)
+    std_err = np.sqrt(sigma2 * np.linalg.inv(xtx)[:, 0, 0])
+    adf_stat = coef[:, 0] / std_err
+    p_value = _mackinnon_p_values(adf_stat)
+
+    lam = dot(resid[:-1], delta) / dot(resid[:-1], resid[:-1])
+    with np.errstate(divide="ignore"):
+        half_life = np.where(lam < 0, -np.log(2) / lam, np.inf)
+
+    return hedge_ratio, intercept, adf_stat, p_value, half_life
+
+
+def _test_pairs(pairs: np.ndarray, maxlag: int, autolag) -> list[tuple]:
+    prices = _shared["prices"]
+    if len(pairs) == 0:
+        return []
+    if autolag is not None:
+        return [(int(i), int(j), *engle_granger(prices[:, i], prices[:, j], maxlag, autolag)) for i, j in pairs]
+
+    columns = _batched_engle_granger(prices[:, pairs[:, 0]], prices[:, pairs[:, 1]], maxlag)
+    return [(int(i), int(j), *map(float, values)) for (i, j), *values in zip(pairs, *columns)]
+
+
+class PairScreener:
+    """
+    Ranks cointegrated pairs among N symbols.
+
+    A vectorized correlation matrix of log prices cuts the O(N^2) pair set down to candidates;
+    those are tested with Engle-Granger regressions, batched per task and spread over a process
+    pool. The price matrix is placed in shared memory once, so tasks carry only index pairs rather
+    than pickled price series. Passing `autolag` (e.g. "aic") switches to per-pair statsmodels fits.
+    """
+
+    def __init__(self, prices: np.ndarray, symbols: list[str], min_correlation: float = 0.8,
+                 max_candidates: int = None, workers: int = None, maxlag: int = 1, autolag=None):
+        if prices.shape[1] != len(symbols):
+            raise ValueError(f"Price matrix has {prices.shape[1]} columns but {len(symbols)} symbols were given.")
+        if np.any(~np.isfinite(prices)) or np.any(prices <= 0):
+            raise ValueError("Prices must be positive and finite; forward-fill or drop gaps before screening.")
+
+        self.log_prices = np.ascontiguousarray(np.log(prices), dtype=np.float64)
+        self.symbols = list(symbols)
+        self.min_correlation = min_correlation
+        self.max_candidates = max_candidates
+        self.workers = workers or os.cpu_count() or 1
+        self.maxlag = maxlag
+        self.autolag = autolag
+
+    def candidates(self) -> tuple[np.ndarray, np.ndarray]:
+        """Upper-triangle (i, j) index pairs with |corr| >= min_correlation, strongest first."""
+        corr = np.corrcoef(self.log_prices, rowvar=False)
+        i, j = np.triu_indices_from(corr, k=1)
+        strength = np.abs(corr[i, j])
+        keep = np.flatnonzero(strength >= self.min_correlation)
+        keep = keep[np.argsort(-strength[keep], kind="stable")]
+        if self.max_candidates is not None:
+            keep = keep[:self.max_candidates]
+        return np.column_stack([i[keep], j[keep]]), corr[i[keep], j[keep]]
+
+    def _task_size(self) -> int:
+        """Pairs per task, capped so each batch's working columns stay within TASK_MEMORY_BUDGET."""
+        bytes_per_pair = self.log_prices.shape[0] * (self.maxlag + 4) * self.log_prices.itemsize
+        return int(max(1, min(MAX_TASK_SIZE, TASK_MEMORY_BUDGET // bytes_per_pair)))
+
+    def _run(self, pairs: np.ndarray) -> list[tuple]:
+        task_size = self._task_size()
+        tasks = [pairs[k:k + task_size] for k in range(0, len(pairs), task_size)]
+
+        if self.workers <= 1 or len(tasks) <= 1:
+            _shared["prices"] = self.log_prices
+            try:
+                return [row for task in tasks for row in _test_pairs(task, self.maxlag, self.autolag)]
+            finally:
+                _shared.clear()
+
+        shm = shared_memory.SharedMemory(create=True, size=self.log_prices.nbytes)
+        try:
+            np.ndarray(self.log_prices.shape, dtype=self.log_prices.dtype, buffer=shm.buf)[:] = self.log_prices
+
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_attach_shared_prices,
+                                     initargs=(shm.name, self.log_prices.shape, self.log_prices.dtype.str)) as pool:
+                results = []
+                for chunk in pool.map(_test_pairs, tasks, [self.maxlag] * len(tasks), [self.autolag] * len(tasks)):
+                    results.extend(chunk)
+            return results
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def screen(self, max_p_value: float = 0.05) -> list[PairCandidate]:
+        """Returns cointegrated pairs with p-value <= max_p_value, ranked by p-value then half-life."""
+        pairs, correlations = self.candidates()
+        logger.info(f"Testing {len(pairs)} of {len(self.symbols) * (len(self.symbols) - 1) // 2} pairs "
+                    f"on {self.workers} worker(s).")
+
+        corr_lookup = {(int(i), int(j)): float(c) for (i, j), c in zip(pairs, correlations)}
+        ranked = [
+            PairCandidate(self.symbols[i], self.symbols[j], corr_lookup[(i, j)], beta, alpha, stat, p, hl)
+            for i, j, beta, alpha, stat, p, hl in self._run(pairs)
+            if p <= max_p_value
+        ]
+        ranked.sort(key=lambda c: (c.p_value, c.half_life))
+        return ranked
@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Parallel, resumable walk-forward parameter sweep over the vectorized backtester.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import itertools
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from src.core.application_constants import settings
+from src.research.backtest import BacktestConfig, VectorBacktest
+
+try:
+    import pyarrow  # noqa: F401
+
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+SWEEP_DIRNAME = "sweeps"  # under settings.save_location
+PARAMETERS = ("window", "entry_z", "exit_z", "stop_z")
+
+# Per-worker memory-mapped inputs, set by _attach_memmaps.
+_shared = {}
+
+
+def _sweep_root(root) -> Path:
+    return Path(root) if root else settings.save_location / SWEEP_DIRNAME
+
+
+def _input_arrays(timestamps, prices, spread) -> tuple:
+    """The inputs exactly as they are saved to, and hashed from, the sweep directory."""
+    return (np.asarray(timestamps, dtype="datetime64[ns]"), np.ascontiguousarray(prices, dtype=np.float64),
+            np.ascontiguousarray(spread, dtype=np.float64))
+
+
+def _digest(arrays) -> str:
+    """blake2b over the raw bytes of each array, so same-shaped inputs with different values differ."""
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        digest.update(np.ascontiguousarray(array).view(np.uint8))
+    return digest.hexdigest()
+
+
+def _attach_memmaps(directory: str, pairs: list[str], block_bars: int) -> None:
+    directory = Path(directory)
+    _shared["timestamps"] = np.load(directory / "timestamps.npy", mmap_mode="r")
+    _shared["prices"] = np.load(directory / "prices.npy", mmap_mode="r")
+    _shared["spread"] = np.load(directory / "spread.npy", mmap_mode="r")
+    _shared["pairs"] = pairs
+    _shared["block_bars"] = block_bars
+
+
+def _run_cell(config: BacktestConfig) -> dict:
+    """Backtests one parameter cell over every pair; returns (pairs, blocks) aggregates by exit block."""
+    backtest = VectorBacktest(_shared["pairs"], _shared["timestamps"], _shared["prices"], _shared["spread"], config)
+    result = backtest.run()
+
+    n_pairs = len(_shared["pairs"])
+    n_blocks = -(-len(_shared["timestamps"]) // _shared["block_bars"])
+    closed = result.closed
+    pnl = result.pnl[closed]
+    flat = result.pair_index[closed] * n_blocks + result.exit_step[closed] // _shared["block_bars"]
+
+    def per_block(weights=None):
+        return np.bincount(flat, weights=weights, minlength=n_pairs * n_blocks).reshape(n_pairs, n_blocks)
+
+    return {"pnl": per_block(pnl), "trades": per_block(), "wins": per_block((pnl > 0).astype(float))}
+
+
+def parameter_grid(grid: dict) -> list[BacktestConfig]:
+    """Expands {parameter: values} into configs, dropping cells with exit_z >= entry_z or stop_z <= entry_z."""
+    unknown = set(grid) - set(PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters {sorted(unknown)}; expected a subset of {PARAMETERS}.")
+
+    names = list(grid)
+    configs = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        config = BacktestConfig(**dict(zip(names, values)))
+        if config.exit_z >= config.entry_z:
+            continue
+        if config.stop_z is not None and config.stop_z <= config.entry_z:
+            continue
+        configs.append(config)
+    return configs
+
+
+class WalkForwardSweep:
+    """
+    Runs a parameter grid over every pair on a process pool and scores it walk-forward.
+
+    Each cell backtests the full history once for all pairs, and realised PnL is bucketed by the
+    block of `block_bars` bars in which each trade exits. Because the rolling z-score only looks
+    back, fold k can then pick each pair's best cell on the `train_blocks` blocks before it and
+    score that choice out of sample on block k without re-running anything.
+
+    Price and spread matrices are written once as .npy files in the sweep directory and workers
+    memory-map them, so tasks carry only a config. Every finished cell is checkpointed to its own
+    file; rerunning a sweep with the same name, grid and input data skips them. The manifest keeps
+    a digest of the timestamps, prices and spread, so a rerun on different data is refused.
+    """
+
+    def __init__(self, name: str, pairs: list[str], timestamps: np.ndarray, prices: np.ndarray, spread: np.ndarray,
+                 grid: dict, block_bars: int, train_blocks: int = 4, workers: int = None, root: Path = None):
+        if prices.shape != spread.shape or prices.shape != (len(timestamps), len(pairs)):
+            raise ValueError("prices and spread must both be (len(timestamps), len(pairs)).")
+
+        self.name = name
+        self.pairs = list(pairs)
+        self.configs = parameter_grid(grid)
+        self.block_bars = block_bars
+        self.train_blocks = train_blocks
+        self.workers = workers or os.cpu_count() or 1
+        self.directory = _sweep_root(root) / name
+        self.cell_directory = self.directory / "cells"
+        self._prepare(timestamps, prices, spread, grid)
+
+    def _prepare(self, timestamps, prices, spread, grid) -> None:
+        """Writes the memory-mapped inputs and manifest, or checks them against an existing sweep."""
+        arrays = _input_arrays(timestamps, prices, spread)
+        manifest = {
+            "pairs": self.pairs,
+            "bars": len(timestamps),
+            "block_bars": self.block_bars,
+            "grid": {k: list(v) for k, v in grid.items()},
+            "digest": _digest(arrays),
+        }
+        manifest_path = self.directory / "manifest.json"
+
+        if manifest_path.exists():
+            # The saved .npy files are what the cells were computed from, so check them as well.
+            saved = _digest(np.load(self.directory / f"{name}.npy", mmap_mode="r")
+                            for name in ("timestamps", "prices", "spread"))
+            if json.loads(manifest_path.read_text()) != manifest or saved != manifest["digest"]:
+                raise ValueError(f"Sweep '{self.name}' already exists with different inputs; pick a new name "
+                                 f"or delete {self.directory}.")
+            logger.info(f"Resuming sweep '{self.name}'.")
+            return
+
+        self.cell_directory.mkdir(parents=True, exist_ok=True)
+        for name, array in zip(("timestamps", "prices", "spread"), arrays):
+            np.save(self.directory / f"{name}.npy", array)
+        manifest_path.write_text(json.dumps(manifest, indent=2))
+
+    def _cell_path(self, index: int) -> Path:
+        return self.cell_directory / f"cell-{index:05d}.npz"
+
+    def pending(self) -> list[int]:
+        return [i for i in range(len(self.configs)) if not self._cell_path(i).exists()]
+
+    def run(self) -> None:
+        """Runs every cell without a checkpoint; safe to interrupt and call again."""
+        pending = self.pending()
+        logger.info(f"Sweep '{self.name}': {len(pending)} of {len(self.configs)} cells to run "
+                    f"on {self.workers} worker(s).")
+        if not pending:
+            return
+
+        initargs = (str(self.directory), self.pairs, self.block_bars)
+        if self.workers <= 1:
+            _attach_memmaps(*initargs)
+            try:
+                for i in pending:
+                    self._checkpoint(i, _run_cell(self.configs[i]))
+            finally:
+                _shared.clear()
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_attach_memmaps, initargs=initargs) as pool:
+            futures = {pool.submit(_run_cell, self.configs[i]): i for i in pending}
+            for done, future in enumerate(as_completed(futures), start=1):
+                self._checkpoint(futures[future], future.result())
+                if done % 50 == 0 or done == len(futures):
+                    logger.info(f"Sweep '{self.name}': {done}/{len(futures)} cells done.")
+
+    def _checkpoint(self, index: int, arrays: dict) -> None:
+        path = self._cell_path(index)
+        tmp = path.with_name(path.stem + ".tmp.npz")
+        np.savez(tmp, **arrays)
+        os.replace(tmp, path)
+
+    def _load_cells(self) -> dict:
+        missing = self.pending()
+        if missing:
+            raise RuntimeError(f"Sweep '{self.name}' has {len(missing)} unfinished cells; call run() first.")
+        cells = [np.load(self._cell_path(i)) for i in range(len(self.configs))]
+        return {key: np.stack([c[key] for c in cells]) for key in ("pnl", "trades", "wins")}  # (cells, pairs, blocks)
+
+    def _block_starts(self, n_blocks: int) -> np.ndarray:
+        timestamps = np.load(self.directory / "timestamps.npy", mmap_mode="r")
+        return np.asarray(timestamps[np.arange(n_blocks) * self.block_bars])
+
+    def cell_results(self) -> pd.DataFrame:
+        """One row per (cell, pair, block): parameters, realised PnL, closed trades and wins."""
+        cells = self._load_cells()
+        n_cells, n_pairs, n_blocks = cells["pnl"].shape
+        cell, pair, block = (a.ravel() for a in np.indices((n_cells, n_pairs, n_blocks)))
+
+        frame = pd.DataFrame({"cell": cell})
+        for name in PARAMETERS:
+            frame[name] = np.array([getattr(c, name) for c in self.configs], dtype=float)[cell]
+        frame["pair"] = np.array(self.pairs, dtype=object)[pair]
+        frame["block"] = block
+        frame["block_start"] = self._block_starts(n_blocks)[block]
+        for key in ("pnl", "trades", "wins"):
+            frame[key] = cells[key].ravel()
+        return frame
+
+    def walk_forward(self) -> pd.DataFrame:
+        """
+        One row per (fold, pair): the cell with the best PnL over the preceding `train_blocks`
+        blocks and its out-of-sample PnL on the fold's block.
+        """
+        cells = self._load_cells()
+        n_cells, n_pairs, n_blocks = cells["pnl"].shape
+        if n_blocks <= self.train_blocks:
+            raise ValueError(f"Need more than {self.train_blocks} blocks for a walk-forward; have {n_blocks}.")
+
+        # Trailing train_blocks sum ending just before each fold, from one cumulative sum: (cells, pairs, folds).
+        cumulative = np.concatenate([np.zeros((n_cells, n_pairs, 1)), np.cumsum(cells["pnl"], axis=2)], axis=2)
+        folds = np.arange(self.train_blocks, n_blocks)
+        train = cumulative[:, :, folds] - cumulative[:, :, folds - self.train_blocks]
+
+        best = np.argmax(train, axis=0)  # (pairs, folds)
+        pair_idx = np.arange(n_pairs)[:, None]
+        fold_blocks = folds[None, :]
+
+        frame = pd.DataFrame({
+            "fold": np.broadcast_to(folds, best.shape).ravel(),
+            "block_start": self._block_starts(n_blocks)[np.broadcast_to(folds, best.shape).ravel()],
+            "pair": np.array(self.pairs, dtype=object)[np.broadcast_to(pair_idx, best.shape).ravel()],
+            "cell": best.ravel(),
+        })
+        for name in PARAMETERS:
+            frame[name] = np.array([getattr(c, name) for c in self.configs], dtype=float)[best.ravel()]
+        frame["train_pnl"] = np.take_along_axis(train, best[None], axis=0)[0].ravel()
+        frame["test_pnl"] = cells["pnl"][best, pair_idx, fold_blocks].ravel()
+        frame["test_trades"] = cells["trades"][best, pair_idx, fold_blocks].ravel().astype(np.int64)
+        return frame
+
+    def save_results(self) -> list[Path]:
+        """Writes cell_results and walk_forward as Parquet (or CSV without pyarrow) next to the checkpoints."""
+        written = []
+        for table, frame in (("cell_results", self.cell_results()), ("walk_forward", self.walk_forward())):
+            if PARQUET_AVAILABLE:
+                path = self.directory / f"{table}.parquet"
+                frame.to_parquet(path, index=False)
+            else:
+                path = self.directory / f"{table}.csv"
+                frame.to_csv(path, index=False)
+            written.append(path)
+        logger.info(f"Saved sweep '{self.name}' results to {self.directory}.")
+        return written
+
+
+def list_sweeps(root: Path = None) -> list[str]:
+    """Names of sweeps with saved results, newest first."""
+    root = _sweep_root(root)
+    if not root.exists():
+        return []
+    done = [d for d in root.iterdir() if any(d.glob("walk_forward.*"))]
+    return [d.name for d in sorted(done, key=lambda d: d.stat().st_mtime, reverse=True)]
+
+
+def load_sweep_results(name: str, table: str = "walk_forward", root: Path = None) -> pd.DataFrame:
+    """Loads a saved results table ("walk_forward" or "cell_results") for the dashboard."""
+    directory = _sweep_root(root) / name
+    parquet, csv = directory / f"{table}.parquet", directory / f"{table}.csv"
+    if parquet.exists():
+        return pd.read_parquet(parquet)
+    if csv.exists():
+        return pd.read_csv(csv, parse_dates=["block_start"])
+    raise FileNotFoundError(f"No {table} results for sweep '{name}' in {directory}.")
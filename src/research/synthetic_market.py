@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Vectorized synthetic market for many cointegrated pairs at once.
+"""
+
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.core.database_models import Signal, Order, Position
+from src.research.backtest import rolling_zscore, position_state, match_round_trips
+from src.strategy.spread_engine import signal_confidence
+from src.utils.enums import SignalType, OrderType, OrderSide, StatusType, PositionType
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Regime:
+    """Spread dynamics for one market regime: OU mean-reversion speed and volatility per step."""
+    name: str
+    theta: float
+    sigma: float
+    spread_multiplier: float = 1.0  # widens bid/ask in stressed regimes
+
+
+DEFAULT_REGIMES = (
+    Regime("calm", theta=0.05, sigma=0.002),
+    Regime("volatile", theta=0.02, sigma=0.006, spread_multiplier=2.5),
+    Regime("trending", theta=0.005, sigma=0.004, spread_multiplier=1.5),
+)
+
+
+@dataclass(frozen=True)
+class MarketConfig:
+    num_pairs: int = 100
+    num_steps: int = 50_000
+    interval_minutes: int = 15
+    start: str = "2024-07-01T00:00"
+    seed: int = 42
+    regimes: tuple[Regime, ...] = DEFAULT_REGIMES
+    regime_persistence: float = 0.999  # probability of staying in the current regime each step
+    leg_drift: float = 0.0
+    leg_sigma: float = 0.003
+    base_price_range: tuple[float, float] = (1.0, 60_000.0)
+    hedge_ratio_range: tuple[float, float] = (0.6, 1.4)
+    half_spread_bps_range: tuple[float, float] = (0.5, 5.0)
+
+
+@dataclass
+class MarketPaths:
+    """Price paths with shape (num_steps, num_pairs); per-pair constants have shape (num_pairs,)."""
+    timestamps: np.ndarray
+    pairs: list[str]
+    regime: np.ndarray
+    mid_a: np.ndarray
+    mid_b: np.ndarray
+    bid_a: np.ndarray
+    ask_a: np.ndarray
+    bid_b: np.ndarray
+    ask_b: np.ndarray
+    log_spread: np.ndarray
+    hedge_ratio: np.ndarray
+    intercept: np.ndarray
+
+    @property
+    def ratio(self) -> np.ndarray:
+        """Mid price of the A/B ratio, the instrument recorded on signals, orders and positions."""
+        return self.mid_a / self.mid_b
+
+    def save(self, path) -> None:
+        """Writes every array (and the pair names) to one .npz file."""
+        np.savez(path, **{k: np.asarray(v) for k, v in self.__dict__.items()})
+
+
+@dataclass
+class TradeEvents:
+    """Entry/exit events from the vectorized z-score state machine, one entry per array element."""
+    pair_index: np.ndarray
+    entry_step: np.ndarray
+    exit_step: np.ndarray  # -1 while the position is still open at the end of the path
+    direction: np.ndarray  # +1 long spread, -1 short spread
+    entry_z: np.ndarray
+    exit_z: np.ndarray  # NaN while still open
+
+
+class SyntheticMarket:
+    """
+    Generates cointegrated pairs as log A = intercept + hedge_ratio * log B + s, where log B is a
+    random walk and the spread s is an Ornstein-Uhlenbeck process whose speed and volatility follow
+    a shared Markov regime sequence.
+
+    Every step updates all pairs with one array operation; nothing branches per pair or per row.
+    """
+
+    def __init__(self, config: MarketConfig = MarketConfig()):
+        self.config = config
+        self.rng = np.random.default_rng(config.seed)
+
+    def _regime_path(self) -> np.ndarray:
+        cfg = self.config
+        n = len(cfg.regimes)
+        switches = self.rng.random(cfg.num_steps) > cfg.regime_persistence
+        jumps = self.rng.integers(1, max(n, 2), size=cfg.num_steps) * switches
+        return np.cumsum(jumps) % n
+
+    def generate(self) -> MarketPaths:
+        cfg = self.config
+        T, P = cfg.num_steps, cfg.num_pairs
+        rng = self.rng
+
+        regime = self._regime_path()
+        theta = np.array([r.theta for r in cfg.regimes])[regime][:, None]
+        sigma = np.array([r.sigma for r in cfg.regimes])[regime][:, None]
+        spread_mult = np.array([r.spread_multiplier for r in cfg.regimes])[regime][:, None]
+
+        # Leg B: geometric random walk from a log-uniform starting price.
+        lo, hi = np.log(cfg.base_price_range)
+        log_b0 = rng.uniform(lo, hi, size=P)
+        log_b = log_b0 + np.cumsum(cfg.leg_drift + cfg.leg_sigma * rng.standard_normal((T, P)), axis=0)
+
+        # Spread: OU recursion, vectorized across pairs (the recursion itself is inherently sequential).
+        shocks = sigma * rng.standard_normal((T, P))
+        keep = 1.0 - theta
+        spread = np.empty((T, P))
+        spread[0] = shocks[0]
+        for t in range(1, T):
+            spread[t] = keep[t] * spread[t - 1] + shocks[t]
+
+        hedge_ratio = rng.uniform(*cfg.hedge_ratio_range, size=P)
+        intercept = rng.uniform(-0.5, 0.5, size=P)
+        log_a = intercept + hedge_ratio * log_b + spread
+
+        mid_a, mid_b = np.exp(log_a), np.exp(log_b)
+        half_spread = rng.uniform(*cfg.half_spread_bps_range, size=(2, P)) * 1e-4
+        hs_a, hs_b = half_spread[0] * spread_mult, half_spread[1] * spread_mult
+
+        timestamps = (np.datetime64(cfg.start, "m") +
+                      np.arange(T) * np.timedelta64(cfg.interval_minutes, "m")).astype("datetime64[ns]")
+
+        logger.info(f"Generated {T} steps for {P} pairs.")
+        return MarketPaths(
+            timestamps=timestamps,
+            pairs=[f"PAIR{i:04d}" for i in range(P)],
+            regime=regime,
+            mid_a=mid_a,
+            mid_b=mid_b,
+            bid_a=mid_a * (1 - hs_a),
+            ask_a=mid_a * (1 + hs_a),
+            bid_b=mid_b * (1 - hs_b),
+            ask_b=mid_b * (1 + hs_b),
+            log_spread=spread,
+            hedge_ratio=hedge_ratio,
+            intercept=intercept,
+        )
+
+    @staticmethod
+    def trade_events(paths: MarketPaths, window: int = 96, entry_z: float = 2.0, exit_z: float = 0.5) -> TradeEvents:
+        """
+        Runs the z-score entry/exit rules over every pair at once.
+
+        A pair enters long (short) the spread when z < -entry_z (z > entry_z) and exits once
+        |z| < exit_z; in between the previous state is carried forward, which is a forward-fill.
+        """
+        z = rolling_zscore(paths.log_spread, window)
+        state = position_state(z, entry_z, exit_z)
+        en_pair, en_step, exit_step = match_round_trips(state)
+        closed = exit_step >= 0
+
+        exit_z_values = np.full(len(en_pair), np.nan)
+        exit_z_values[closed] = z[exit_step[closed], en_pair[closed]]
+
+        return TradeEvents(
+            pair_index=en_pair,
+            entry_step=en_step,
+            exit_step=exit_step,
+            direction=state[en_step, en_pair].astype(np.int8),
+            entry_z=z[en_step, en_pair],
+            exit_z=exit_z_values,
+        )
+
+    def to_database(self, paths: MarketPaths, events: TradeEvents, loader, quantity_range=(0.5, 2.5)) -> int:
+        """
+        Writes one signal + order per entry and per exit, and one position per entry, through a BulkLoader.
+
+        The traded instrument is the A/B ratio, filled at the touch (ask to buy, bid to sell). Short
+        spread positions carry a negative quantity so (exit_price - entry_price) * quantity stays the
+        realised PnL used by TradingDatabase.
+        """
+        n = len(events.pair_index)
+        if n == 0:
+            return 0
+
+        pairs = np.array(paths.pairs, dtype=object)
+        ratio_bid = paths.bid_a / paths.ask_b
+        ratio_ask = paths.ask_a / paths.bid_b
+        quantity = np.round(self.rng.uniform(*quantity_range, size=n), 3)
+        closed = events.exit_step >= 0
+        long = events.direction > 0
+
+        written = 0
+        entry_order_ids = np.empty(n, dtype=np.int64)
+        exit_order_ids = np.full(n, -1, dtype=np.int64)
+        prices = {}
+
+        for side, mask, steps, is_buy, z in (
+            ("entry", np.ones(n, dtype=bool), events.entry_step, long, events.entry_z),
+            ("exit", closed, events.exit_step[closed], ~long[closed], events.exit_z[closed]),
+        ):
+            at = steps, events.pair_index[mask]
+            price = np.where(is_buy, ratio_ask[at], ratio_bid[at])
+            when = paths.timestamps[steps]
+            confidence = signal_confidence(z)
+
+            signal_ids = loader.reserve_ids(Signal, len(steps))
+            order_ids = loader.reserve_ids(Order, len(steps))
+            symbols = pairs[events.pair_index[mask]]
+
+            loader.add_columns(Signal, {
+                "id": signal_ids,
+                "stock_symbol": symbols,
+                "signal_type": np.where(is_buy, SignalType.BUY, SignalType.SELL),
+                "confidence": np.round(confidence, 3),
+                "signal_datetime": when,
+            })
+            loader.add_columns(Order, {
+                "id": order_ids,
+                "signal_id": signal_ids,
+                "stock_symbol": symbols,
+                "order_type": [OrderType.MARKET] * len(steps),
+                "side": np.where(is_buy, OrderSide.BUY, OrderSide.SELL),
+                "quantity": quantity[mask],
+                "price": price,
+                "status": [StatusType.FILLED] * len(steps),
+                "submission_datetime": when,
+                "filled_datetime": when + np.timedelta64(2, "s"),
+            })
+
+            if side == "entry":
+                entry_order_ids[:] = order_ids
+            else:
+                exit_order_ids[closed] = order_ids
+            prices[side] = (price, when + np.timedelta64(2, "s"))
+            written += 2 * len(steps)
+
+        exit_price = np.full(n, np.nan)
+        exit_time = np.full(n, np.datetime64("NaT"), dtype="datetime64[ns]")
+        exit_price[closed], exit_time[closed] = prices["exit"]
+
+        loader.add_columns(Position, {
+            "id": loader.reserve_ids(Position, n),
+            "stock_symbol": pairs[events.pair_index],
+            "entry_order_id": entry_order_ids,
+            "exit_order_id": [int(i) if i >= 0 else None for i in exit_order_ids],
+            "quantity": np.where(long, quantity, -quantity),
+            "entry_price": prices["entry"][0],
+            "exit_price": exit_price,
+            "entry_datetime": prices["entry"][1],
+            "exit_datetime": exit_time,
+            "status": np.where(closed, PositionType.CLOSED, PositionType.OPEN),
+        })
+        loader.flush()
+        return written + n
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Batched Kalman-filter estimate of dynamic hedge ratios for many pairs.
+"""
+
+import logging
+from pathlib import Path
+
+import numpy as np
+
+from src.core.application_constants import settings
+
+logger = logging.getLogger(__name__)
+
+STATE_FILENAME = Path("state") / "kalman_hedge.npz"  # under settings.save_location
+
+
+class KalmanHedgeRatio:
+    """
+    Tracks (hedge_ratio, intercept) per pair for log A = hedge_ratio * log B + intercept + noise,
+    with both coefficients following a random walk.
+
+    All pairs live in stacked arrays, state (N, 2) and covariance (N, 2, 2), and one update runs the
+    predict/correct step for every ticking pair as a few broadcast operations. `hedge_ratios` and
+    `intercepts` always hold the estimate *before* the latest observation, which is what a spread
+    should be computed with to avoid look-ahead.
+    """
+
+    def __init__(self, pairs: list[str], hedge_ratios=None, intercepts=None, delta: float = 1e-5,
+                 observation_var: float = 1e-3, initial_var: float = 1.0):
+        n = len(pairs)
+        self.pairs = list(pairs)
+        self.delta = delta
+        self.observation_var = observation_var
+        self.initial_var = initial_var
+
+        self.state = np.zeros((n, 2))
+        self.state[:, 0] = 1.0 if hedge_ratios is None else hedge_ratios
+        self.state[:, 1] = 0.0 if intercepts is None else intercepts
+        self.covariance = np.tile(np.eye(2) * initial_var, (n, 1, 1))
+        self.updates = np.zeros(n, dtype=np.int64)
+
+    @property
+    def hedge_ratios(self) -> np.ndarray:
+        return self.state[:, 0]
+
+    @property
+    def intercepts(self) -> np.ndarray:
+        return self.state[:, 1]
+
+    def update(self, log_a: np.ndarray, log_b: np.ndarray, idx: np.ndarray = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        One predict/correct step for the pairs in `idx` (all when None; indices must be unique).
+
+        Returns (innovation, innovation_std): the one-step forecast error of log A and its standard
+        deviation, whose ratio is itself a z-score of the spread.
+        """
+        idx = np.arange(len(self.pairs)) if idx is None else np.asarray(idx, dtype=np.int64)
+        theta = self.state[idx]
+        cov = self.covariance[idx] + (self.delta / (1.0 - self.delta)) * np.eye(2)
+
+        h = np.stack([log_b, np.ones_like(log_b)], axis=1)  # (m, 2) observation row per pair
+        innovation = log_a - np.einsum("mk,mk->m", h, theta)
+        ph = np.einsum("mkl,ml->mk", cov, h)  # P H'
+        s = np.einsum("mk,mk->m", h, ph) + self.observation_var
+        gain = ph / s[:, None]
+
+        self.state[idx] = theta + gain * innovation[:, None]
+        self.covariance[idx] = cov - gain[:, :, None] * ph[:, None, :]  # P - K (H P), P symmetric
+        self.updates[idx] += 1
+
+        return innovation, np.sqrt(s)
+
+    def save_state(self, path: Path = None) -> None:
+        """Persists the filter so a restart resumes without replaying price history."""
+        path = Path(path) if path else settings.save_location / STATE_FILENAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.stem + ".tmp.npz")
+        np.savez(tmp, pairs=np.array(self.pairs), state=self.state, covariance=self.covariance,
+                 updates=self.updates, params=np.array([self.delta, self.observation_var, self.initial_var]))
+        tmp.replace(path)
+
+    @classmethod
+    def load_state(cls, pairs: list[str], path: Path = None, hedge_ratios=None,
+                   intercepts=None, **kwargs) -> "KalmanHedgeRatio":
+        """
+        Warm-starts a filter for `pairs` from saved state; pairs absent from the file start cold
+        from `hedge_ratios`/`intercepts` (or 1/0). A missing file gives a fully cold filter.
+        """
+        path = Path(path) if path else settings.save_location / STATE_FILENAME
+        if not path.exists():
+            logger.info(f"No Kalman state at {path}; starting cold.")
+            return cls(pairs, hedge_ratios, intercepts, **kwargs)
+
+        saved = np.load(path)
+        delta, observation_var, initial_var = saved["params"]
+        kwargs = {"delta": delta, "observation_var": observation_var, "initial_var": initial_var, **kwargs}
+        kf = cls(pairs, hedge_ratios, intercepts, **kwargs)
+
+        saved_index = {str(p): i for i, p in enumerate(saved["pairs"])}
+        found = [(i, saved_index[p]) for i, p in enumerate(pairs) if p in saved_index]
+        if found:
+            dst, src = map(np.array, zip(*found))
+            kf.state[dst] = saved["state"][src]
+            kf.covariance[dst] = saved["covariance"][src]
+            kf.updates[dst] = saved["updates"][src]
+
+        logger.info(f"Warm-started {len(found)} of {len(pairs)} pairs from {path}.")
+        return kf
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Streaming rolling spread statistics and z-score signals for many pairs.
+"""
+
+import logging
+import datetime
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.core.database_models import Signal
+from src.utils.enums import SignalType
+
+logger = logging.getLogger(__name__)
+
+# Sliding updates accumulate rounding error; rebuild a pair's moments from its ring this often.
+RECOMPUTE_EVERY = 10_000
+
+
+def signal_confidence(z: np.ndarray) -> np.ndarray:
+    """Maps |z| onto a 0.5-0.99 confidence score, shared with the synthetic market generator."""
+    return np.clip(np.abs(z) / 4.0, 0.5, 0.99)
+
+
+@dataclass
+class SpreadSnapshot:
+    """Per-pair state after an update, each array shaped (num_pairs,)."""
+    spread: np.ndarray
+    mean: np.ndarray
+    std: np.ndarray
+    zscore: np.ndarray  # NaN until the pair has a full window
+    state: np.ndarray  # +1 long spread, -1 short spread, 0 flat
+
+
+class SpreadEngine:
+    """
+    Keeps a fixed-length window of log spreads per pair, log A - hedge_ratio * log B - intercept,
+    in a ring buffer and maintains the window mean and variance with sliding Welford updates.
+
+    Each tick costs O(1) per pair regardless of window length, and a batch of ticks for many pairs
+    is a handful of array operations. Entry/exit thresholds are applied with hysteresis, and a
+    Signal is emitted only when a pair's state changes: BUY/SELL on entry, HOLD on exit to flat.
+
+    With a `hedge_estimator` (e.g. KalmanHedgeRatio over the same pairs) the hedge ratios and
+    intercepts are dynamic: each tick's spread uses the estimator's prior estimate, after which the
+    estimator is advanced with that tick's prices.
+    """
+
+    def __init__(self, pairs: list[str], hedge_ratios=None, intercepts=None, window: int = 96,
+                 entry_z: float = 2.0, exit_z: float = 0.5, hedge_estimator=None):
+        if exit_z >= entry_z:
+            raise ValueError("exit_z must be below entry_z.")
+        if hedge_ratios is None and hedge_estimator is None:
+            raise ValueError("Either hedge_ratios or a hedge_estimator is required.")
+        if hedge_estimator is not None and list(hedge_estimator.pairs) != list(pairs):
+            raise ValueError("hedge_estimator must track the same pairs, in the same order.")
+
+        n = len(pairs)
+        self.pairs = list(pairs)
+        self.index = {pair: i for i, pair in enumerate(self.pairs)}
+        self.hedge_estimator = hedge_estimator
+        if hedge_estimator is not None:
+            hedge_ratios, intercepts = hedge_estimator.hedge_ratios, hedge_estimator.intercepts
+        self.hedge_ratios = np.asarray(hedge_ratios, dtype=np.float64).copy()
+        self.intercepts = np.zeros(n) if intercepts is None else np.asarray(intercepts, dtype=np.float64).copy()
+        self.window = window
+        self.entry_z = entry_z
+        self.exit_z = exit_z
+
+        self._ring = np.zeros((n, window))
+        self._head = np.zeros(n, dtype=np.int64)  # next slot to write
+        self._count = np.zeros(n, dtype=np.int64)  # values seen, saturating at window
+        self._updates = np.zeros(n, dtype=np.int64)
+        self._mean = np.zeros(n)
+        self._m2 = np.zeros(n)
+        self._last_spread = np.full(n, np.nan)
+        self.state = np.zeros(n, dtype=np.int8)
+
+    def _push(self, idx: np.ndarray, x: np.ndarray) -> None:
+        """Adds x[k] to the window of pair idx[k] (indices must be unique), evicting the oldest when full."""
+        full = self._count[idx] >= self.window
+        old = self._ring[idx, self._head[idx]]
+        self._ring[idx, self._head[idx]] = x
+        self._head[idx] = (self._head[idx] + 1) % self.window
+
+        # Growing window: standard Welford insert.
+        grow = idx[~full]
+        if grow.size:
+            xg = x[~full]
+            self._count[grow] += 1
+            delta = xg - self._mean[grow]
+            self._mean[grow] += delta / self._count[grow]
+            self._m2[grow] += delta * (xg - self._mean[grow])
+
+        # Full window: replace the evicted value in one step.
+        slide = idx[full]
+        if slide.size:
+            xs, xo = x[full], old[full]
+            prev_mean = self._mean[slide]
+            self._mean[slide] = prev_mean + (xs - xo) / self.window
+            self._m2[slide] += (xs - xo) * (xs - self._mean[slide] + xo - prev_mean)
+
+        self._updates[idx] += 1
+        stale = idx[self._updates[idx] % RECOMPUTE_EVERY == 0]
+        if stale.size:
+            self._recompute(stale)
+
+    def _recompute(self, idx: np.ndarray) -> None:
+        """Rebuilds mean and M2 from the ring buffer to shed accumulated rounding error."""
+        for i in idx:
+            values = self._ring[i, :self._count[i]] if self._count[i] < self.window else self._ring[i]
+            self._mean[i] = values.mean()
+            self._m2[i] = ((values - self._mean[i]) ** 2).sum()
+
+    def update(self, price_a: np.ndarray, price_b: np.ndarray, idx: np.ndarray = None) -> SpreadSnapshot:
+        """Applies one tick for the pairs in `idx` (all pairs when None); prices align with `idx`."""
+        idx = np.arange(len(self.pairs)) if idx is None else np.asarray(idx, dtype=np.int64)
+        log_a, log_b = np.log(price_a), np.log(price_b)
+
+        if self.hedge_estimator is not None:
+            self.hedge_ratios[idx] = self.hedge_estimator.hedge_ratios[idx]
+            self.intercepts[idx] = self.hedge_estimator.intercepts[idx]
+        spread = log_a - self.hedge_ratios[idx] * log_b - self.intercepts[idx]
+        if self.hedge_estimator is not None:
+            self.hedge_estimator.update(log_a, log_b, idx)
+
+        self._push(idx, spread)
+        self._last_spread[idx] = spread
+        return self.snapshot()
+
+    def update_pair(self, pair: str, price_a: float, price_b: float) -> float:
+        """Single-pair tick; returns the pair's new z-score (NaN while warming up)."""
+        i = self.index[pair]
+        self.update(np.array([price_a]), np.array([price_b]), idx=np.array([i]))
+        return float(self.zscore()[i])
+
+    def zscore(self) -> np.ndarray:
+        ready = self._count >= self.window
+        std = np.sqrt(np.maximum(self._m2, 0.0) / self.window)
+        z = np.full(len(self.pairs), np.nan)
+        ok = ready & (std > 0)
+        z[ok] = (self._last_spread[ok] - self._mean[ok]) / std[ok]
+        return z
+
+    def snapshot(self) -> SpreadSnapshot:
+        std = np.sqrt(np.maximum(self._m2, 0.0) / np.maximum(self._count, 1))
+        return SpreadSnapshot(spread=self._last_spread.copy(), mean=self._mean.copy(), std=std,
+                              zscore=self.zscore(), state=self.state.copy())
+
+    def signals(self, timestamp: datetime.datetime = None) -> list[Signal]:
+        """
+        Advances every pair's entry/exit state from the current z-scores and returns a Signal for
+        each pair whose state changed: BUY/SELL to enter long/short the spread, HOLD to go flat.
+        """
+        z = self.zscore()
+        target = self.state.copy()
+        with np.errstate(invalid="ignore"):
+            target[z < -self.entry_z] = 1
+            target[z > self.entry_z] = -1
+            target[np.abs(z) < self.exit_z] = 0
+
+        changed = np.flatnonzero(target != self.state)
+        self.state = target
+        if changed.size == 0:
+            return []
+
+        timestamp = timestamp or datetime.datetime.utcnow()
+        signal_types = {1: SignalType.BUY, -1: SignalType.SELL, 0: SignalType.HOLD}
+        confidence = np.round(signal_confidence(z[changed]), 3)
+
+        return [
+            Signal(stock_symbol=self.pairs[i], signal_type=signal_types[int(target[i])],
+                   confidence=float(c), signal_datetime=timestamp)
+            for i, c in zip(changed, confidence)
+        ]
@@ -0,0 +1,319 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: In-memory book of open positions and working orders on NumPy structured arrays.
+"""
+
+import logging
+import datetime
+
+import numpy as np
+from sqlalchemy import select, insert, update, bindparam
+
+from src.core.database import BaseDatabase
+from src.core.database_models import Order, Position
+from src.utils.enums import OrderSide, OrderType, PositionType, StatusType
+
+logger = logging.getLogger(__name__)
+
+POSITION_DTYPE = np.dtype([
+    ("id", np.int64),
+    ("symbol", np.int32),  # code into the book's symbol table
+    ("entry_order_id", np.int64),
+    ("quantity", np.float64),
+    ("entry_price", np.float64),
+    ("entry_datetime", "datetime64[us]"),
+    ("mark", np.float64),
+])
+
+ORDER_DTYPE = np.dtype([
+    ("id", np.int64),
+    ("signal_id", np.int64),  # -1 when the order has no signal
+    ("symbol", np.int32),
+    ("side", np.int8),  # index into SIDES
+    ("order_type", np.int8),  # index into ORDER_TYPES
+    ("quantity", np.float64),
+    ("price", np.float64),
+    ("submission_datetime", "datetime64[us]"),
+])
+
+SIDES = tuple(OrderSide)
+ORDER_TYPES = tuple(OrderType)
+
+
+def _datetime64(value) -> np.datetime64:
+    if value is None:
+        return np.datetime64("NaT", "us")
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return np.datetime64(value, "us")
+
+
+class _RecordTable:
+    """
+    Rows of one structured array with O(1) lookup by id and by symbol.
+
+    Live rows occupy the first len(self) slots; removal moves the last row into the hole so the
+    live region stays dense and every column can be used directly in vector operations. Symbols are
+    interned to int32 codes, so per-symbol results are bincounts over `symbols`.
+    """
+
+    dtype = None
+
+    def __init__(self, capacity: int = 1024):
+        self._data = np.zeros(max(capacity, 1), dtype=self.dtype)
+        self._size = 0
+        self._rows = {}  # id -> row
+        self._by_symbol = {}  # symbol code -> {row, ...}
+        self.symbols = []
+        self._codes = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, record_id: int) -> bool:
+        return record_id in self._rows
+
+    @property
+    def records(self) -> np.ndarray:
+        """Live rows as a view; columns can be read and written in place."""
+        return self._data[:self._size]
+
+    def symbol_code(self, symbol: str) -> int:
+        code = self._codes.get(symbol)
+        if code is None:
+            code = self._codes[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+        return code
+
+    def get(self, record_id: int) -> np.void:
+        """The row for `record_id` (a view into the book); KeyError if absent."""
+        return self._data[self._rows[record_id]]
+
+    def ids_for(self, symbol: str) -> np.ndarray:
+        rows = self._by_symbol.get(self._codes.get(symbol), ())
+        return self._data["id"][list(rows)]
+
+    def _insert(self, record_id: int, symbol: str, values: tuple) -> np.void:
+        if record_id in self._rows:
+            raise KeyError(f"{type(self).__name__} already holds id {record_id}.")
+        if self._size == len(self._data):
+            self._data = np.concatenate([self._data, np.zeros(len(self._data), dtype=self.dtype)])
+
+        row, code = self._size, self.symbol_code(symbol)
+        self._data[row] = self._row_tuple(record_id, code, values)
+        self._rows[record_id] = row
+        self._by_symbol.setdefault(code, set()).add(row)
+        self._size += 1
+        return self._data[row]
+
+    def _row_tuple(self, record_id: int, code: int, values: tuple) -> tuple:
+        raise NotImplementedError
+
+    def _remove(self, record_id: int) -> np.void:
+        row = self._rows.pop(record_id)
+        record = self._data[row].copy()
+        self._by_symbol[int(record["symbol"])].discard(row)
+
+        last = self._size - 1
+        if row != last:
+            moved = self._data[last]
+            self._data[row] = moved
+            self._rows[int(moved["id"])] = row
+            rows = self._by_symbol[int(moved["symbol"])]
+            rows.discard(last)
+            rows.add(row)
+        self._size = last
+        return record
+
+    def _load(self, columns: dict, symbols: np.ndarray) -> None:
+        """Replaces the contents with column arrays (as from fetch_columnar), symbols as strings."""
+        n = len(symbols)
+        self._data = np.zeros(max(n * 2, 1024), dtype=self.dtype)
+        self._size = n
+        self.symbols, codes = [], np.zeros(n, dtype=np.int32)
+        if n:
+            unique, codes = np.unique(symbols.astype(str), return_inverse=True)
+            self.symbols = unique.tolist()
+        self._codes = {s: k for k, s in enumerate(self.symbols)}
+
+        records = self._data[:n]
+        records["symbol"] = codes
+        for name, column in columns.items():
+            records[name] = column
+        self._reindex()
+
+    def _reindex(self) -> None:
+        records = self.records
+        self._rows = dict(zip(records["id"].tolist(), range(self._size)))
+        self._by_symbol = {}
+        for row, code in enumerate(records["symbol"].tolist()):
+            self._by_symbol.setdefault(code, set()).add(row)
+
+    def snapshot(self) -> tuple[np.ndarray, list]:
+        """A copy of the live rows and the symbol table; one memcpy regardless of book size."""
+        return self.records.copy(), list(self.symbols)
+
+    def restore(self, snapshot: tuple[np.ndarray, list]) -> None:
+        records, symbols = snapshot
+        self._data = np.zeros(max(len(records) * 2, 1024), dtype=self.dtype)
+        self._data[:len(records)] = records
+        self._size = len(records)
+        self.symbols = list(symbols)
+        self._codes = {s: k for k, s in enumerate(self.symbols)}
+        self._reindex()
+
+
+class PositionBook(_RecordTable):
+    """
+    Open positions, marked to market in one vector operation.
+
+    Quantities are signed like Position.quantity: PnL is (price - entry_price) * quantity.
+    """
+
+    dtype = POSITION_DTYPE
+
+    def _row_tuple(self, record_id, code, values):
+        entry_order_id, quantity, entry_price, entry_datetime = values
+        return record_id, code, entry_order_id, quantity, entry_price, _datetime64(entry_datetime), entry_price
+
+    def open(self, position_id: int, symbol: str, entry_order_id: int, quantity: float, entry_price: float,
+             entry_datetime: datetime.datetime = None) -> np.void:
+        return self._insert(position_id, symbol, (entry_order_id, quantity, entry_price, entry_datetime))
+
+    def close(self, position_id: int) -> np.void:
+        """Removes the position and returns its final row (mark included)."""
+        return self._remove(position_id)
+
+    def mark(self, prices) -> np.ndarray:
+        """
+        Marks every open position and returns unrealised PnL per row.
+
+        `prices` is an array aligned with `symbols` or a {symbol: price} dict; NaN or missing prices
+        keep the previous mark.
+        """
+        if isinstance(prices, dict):
+            prices = np.fromiter((prices.get(s, np.nan) for s in self.symbols), dtype=np.float64,
+                                 count=len(self.symbols))
+        records = self.records
+        if len(prices) < len(self.symbols):
+            prices = np.concatenate([prices, np.full(len(self.symbols) - len(prices), np.nan)])
+        new = np.asarray(prices, dtype=np.float64)[records["symbol"]]
+        records["mark"] = np.where(np.isnan(new), records["mark"], new)
+        return self.unrealised_pnl
+
+    @property
+    def unrealised_pnl(self) -> np.ndarray:
+        records = self.records
+        return (records["mark"] - records["entry_price"]) * records["quantity"]
+
+    def exposure(self) -> np.ndarray:
+        """Net marked notional per symbol, aligned with `symbols`."""
+        records = self.records
+        return np.bincount(records["symbol"], weights=records["quantity"] * records["mark"],
+                           minlength=len(self.symbols))
+
+    @classmethod
+    def from_database(cls, db: BaseDatabase) -> "PositionBook":
+        """Loads every OPEN position column-wise, without building ORM instances."""
+        columns = db.fetch_columnar(
+            select(Position.id, Position.stock_symbol, Position.entry_order_id, Position.quantity,
+                   Position.entry_price, Position.entry_datetime)
+            .where(Position.status == PositionType.OPEN)
+        )
+        book = cls()
+        symbols = columns.pop("stock_symbol")
+        columns["entry_datetime"] = columns["entry_datetime"].astype("datetime64[us]")
+        columns["mark"] = columns["entry_price"]
+        book._load(columns, symbols)
+        logger.info(f"Loaded {len(book)} open positions across {len(book.symbols)} symbols.")
+        return book
+
+    def to_database(self, db: BaseDatabase) -> None:
+        """
+        Writes the book back as OPEN positions: one executemany UPDATE for rows the table already
+        has and one INSERT for the rest, in a single transaction. Positions closed in the book are
+        left alone: their close carries exit data and is recorded through the journal.
+        """
+        records = self.records
+        symbols = np.asarray(self.symbols, dtype=object)[records["symbol"]] if len(records) else []
+        rows = [
+            {"_id": i, "stock_symbol": s, "entry_order_id": o, "quantity": q, "entry_price": p,
+             "entry_datetime": None if t is None else t.replace(tzinfo=datetime.timezone.utc)}
+            for i, s, o, q, p, t in zip(records["id"].tolist(), list(symbols), records["entry_order_id"].tolist(),
+                                        records["quantity"].tolist(), records["entry_price"].tolist(),
+                                        records["entry_datetime"].tolist())
+        ]
+        if not rows:
+            return
+
+        with db.engine.begin() as conn:
+            existing = set()
+            ids = [r["_id"] for r in rows]
+            for start in range(0, len(ids), 10_000):
+                existing.update(conn.execute(select(Position.id).where(
+                    Position.id.in_(ids[start:start + 10_000]))).scalars())
+
+            updates = [r for r in rows if r["_id"] in existing]
+            inserts = [{"id": r.pop("_id"), **r, "status": PositionType.OPEN}
+                       for r in rows if r["_id"] not in existing]
+            if updates:
+                table = Position.__table__
+                conn.execute(update(table).where(table.c.id == bindparam("_id")).values(
+                    {name: bindparam(name) for name in ("stock_symbol", "entry_order_id", "quantity",
+                                                        "entry_price", "entry_datetime")}), updates)
+            if inserts:
+                conn.execute(insert(Position), inserts)
+
+
+class OrderBook(_RecordTable):
+    """Working (PENDING) orders, removed from the book when they fill or are cancelled."""
+
+    dtype = ORDER_DTYPE
+
+    def _row_tuple(self, record_id, code, values):
+        signal_id, side, order_type, quantity, price, submitted = values
+        return (record_id, -1 if signal_id is None else signal_id, code, SIDES.index(side),
+                ORDER_TYPES.index(order_type), quantity, np.nan if price is None else price, _datetime64(submitted))
+
+    def add(self, order_id: int, symbol: str, side: OrderSide, quantity: float, price: float = None,
+            order_type: OrderType = OrderType.MARKET, signal_id: int = None,
+            submission_datetime: datetime.datetime = None) -> np.void:
+        return self._insert(order_id, symbol, (signal_id, side, order_type, quantity, price, submission_datetime))
+
+    def remove(self, order_id: int) -> np.void:
+        """Takes a filled, cancelled or rejected order out of the book and returns its row."""
+        return self._remove(order_id)
+
+    def side(self, order_id: int) -> OrderSide:
+        return SIDES[int(self.get(order_id)["side"])]
+
+    def open_quantity(self) -> np.ndarray:
+        """Signed working quantity per symbol (buys positive), aligned with `symbols`."""
+        records = self.records
+        signed = np.where(records["side"] == SIDES.index(OrderSide.BUY), 1.0, -1.0) * records["quantity"]
+        return np.bincount(records["symbol"], weights=signed, minlength=len(self.symbols))
+
+    @classmethod
+    def from_database(cls, db: BaseDatabase) -> "OrderBook":
+        """Loads every PENDING order column-wise."""
+        columns = db.fetch_columnar(
+            select(Order.id, Order.signal_id, Order.stock_symbol, Order.side, Order.order_type, Order.quantity,
+                   Order.price, Order.submission_datetime)
+            .where(Order.status == StatusType.PENDING)
+        )
+        book = cls()
+        symbols = columns.pop("stock_symbol")
+        signal_id = columns["signal_id"]
+        columns["signal_id"] = np.where(np.isnan(signal_id), -1, signal_id).astype(np.int64) \
+            if signal_id.dtype.kind == "f" else signal_id
+        for name, members in (("side", SIDES), ("order_type", ORDER_TYPES)):
+            codes = {member.value: k for k, member in enumerate(members)}
+            columns[name] = np.array([codes[v] for v in columns[name]], dtype=np.int8)
+        columns["submission_datetime"] = columns["submission_datetime"].astype("datetime64[us]")
+        book._load(columns, symbols)
+        logger.info(f"Loaded {len(book)} working orders.")
+        return book
@@ -0,0 +1,363 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Asyncio market-data ingestion: kline/bookTicker streams, micro-batching, replay for offline load tests.
+"""
+
+import gzip
+import time
+import asyncio
+import logging
+from pathlib import Path
+from collections import deque
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import orjson
+
+from src.utils.instrumentation import TICK_TO_SIGNAL
+
+logger = logging.getLogger(__name__)
+
+# How many distinct bar open times to keep while waiting for the other leg of a pair to close.
+PENDING_BARS = 16
+
+# Batch latency samples kept for IngestionStats percentiles; the tick_to_signal histogram covers all of them.
+LATENCY_WINDOW = 100_000
+
+
+@dataclass(slots=True)
+class KlineEvent:
+    symbol: str
+    interval: str
+    open_time: int  # epoch ms
+    close_time: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    quote_volume: float
+    trades: int
+    taker_buy_base_volume: float
+    taker_buy_quote_volume: float
+    closed: bool
+    received: float  # time.perf_counter() when normalized
+
+
+@dataclass(slots=True)
+class BookTickerEvent:
+    symbol: str
+    update_id: int
+    bid: float
+    bid_qty: float
+    ask: float
+    ask_qty: float
+    received: float
+
+    @property
+    def mid(self) -> float:
+        return 0.5 * (self.bid + self.ask)
+
+
+def normalize(message: dict):
+    """
+    Turns a raw Binance stream payload (plain or combined-stream wrapped) into a KlineEvent or
+    BookTickerEvent; anything else returns None.
+    """
+    data = message.get("data", message)
+    received = time.perf_counter()
+
+    if data.get("e") == "kline":
+        k = data["k"]
+        return KlineEvent(k["s"], k["i"], int(k["t"]), int(k["T"]), float(k["o"]), float(k["h"]), float(k["l"]),
+                          float(k["c"]), float(k["v"]), float(k["q"]), int(k["n"]), float(k["V"]), float(k["Q"]),
+                          bool(k["x"]), received)
+
+    if "u" in data and "b" in data and "a" in data:
+        return BookTickerEvent(data["s"], int(data["u"]), float(data["b"]), float(data["B"]), float(data["a"]),
+                               float(data["A"]), received)
+    return None
+
+
+class ReplaySource:
+    """
+    Replays raw stream messages recorded one JSON object per line (optionally gzipped).
+
+    `rate` paces playback in messages per second; None replays as fast as the consumer accepts,
+    which together with the service's bounded queue makes it a throughput test.
+    """
+
+    def __init__(self, path, rate: float = None, repeat: int = 1):
+        self.path = Path(path)
+        self.rate = rate
+        self.repeat = repeat
+
+    def _open(self):
+        return gzip.open(self.path, "rb") if self.path.suffix == ".gz" else open(self.path, "rb")
+
+    async def messages(self):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        sent = 0
+        for _ in range(self.repeat):
+            with self._open() as handle:
+                for line in handle:
+                    if not line.strip():
+                        continue
+                    yield orjson.loads(line)
+                    sent += 1
+
+                    if self.rate is not None:
+                        ahead = start + sent / self.rate - loop.time()
+                        if ahead > 0.001:
+                            await asyncio.sleep(ahead)
+                    if sent % 1024 == 0:
+                        await asyncio.sleep(0)  # let the batcher run between bursts
+
+
+class BinanceStreamSource:
+    """Live kline and bookTicker messages over one multiplexed Binance websocket; no API key needed."""
+
+    def __init__(self, symbols: list[str], interval: str = "1m", book_ticker: bool = True, testnet: bool = False):
+        self.streams = [f"{s.lower()}@kline_{interval}" for s in symbols]
+        if book_ticker:
+            self.streams += [f"{s.lower()}@bookTicker" for s in symbols]
+        self.testnet = testnet
+
+    async def messages(self):
+        from binance import AsyncClient, BinanceSocketManager
+
+        client = await AsyncClient.create(testnet=self.testnet)
+        try:
+            socket_manager = BinanceSocketManager(client)
+            async with socket_manager.multiplex_socket(self.streams) as stream:
+                while True:
+                    message = await stream.recv()
+                    if message.get("e") == "error":
+                        logger.warning(f"Market data stream error: {message.get('m')}")
+                        continue
+                    yield message
+        finally:
+            await client.close_connection()
+
+
+async def record(source, path, limit: int = None) -> int:
+    """Writes a source's raw messages to a JSON-lines file that ReplaySource can play back."""
+    written = 0
+    with open(path, "ab") as handle:
+        async for message in source.messages():
+            handle.write(orjson.dumps(message) + b"\n")
+            written += 1
+            if limit is not None and written >= limit:
+                break
+    return written
+
+
+@dataclass
+class IngestionStats:
+    messages: int = 0
+    ignored: int = 0
+    batches: int = 0
+    largest_batch: int = 0
+    max_queue_depth: int = 0
+    engine_updates: int = 0
+    signals: int = 0
+    bars_stored: int = 0
+    # seconds, receive -> processed, one sample per batch; only the most recent are kept
+    latencies: deque = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW), repr=False)
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def messages_per_second(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return self.messages / elapsed if elapsed > 0 else 0.0
+
+    def latency_percentiles(self, q=(50, 99)) -> dict:
+        if not self.latencies:
+            return {p: float("nan") for p in q}
+        values = np.percentile(np.asarray(self.latencies), q)
+        return dict(zip(q, values.tolist()))
+
+
+class IngestionService:
+    """
+    Normalizes stream messages, coalesces them into micro-batches and fans each batch out to a
+    SpreadEngine and a KlineStore without blocking the event loop.
+
+    A reader task pushes events into a bounded queue (so a slow consumer throttles the source
+    instead of growing memory); a batcher drains it every `batch_interval` seconds or `max_batch`
+    events. Per batch, book tickers collapse to the latest quote per symbol, and each pair updates
+    the engine once per closed bar (kline feed) or once per batch (book feed) in one vectorized
+    call. Closed bars go to a separate writer task whose KlineStore appends (fsync included) run on
+    a worker thread.
+    """
+
+    def __init__(self, source, pairs: dict, engine=None, store=None, on_signals=None, price_feed: str = "kline",
+                 batch_interval: float = 0.01, max_batch: int = 5_000, queue_size: int = 100_000):
+        if price_feed not in ("kline", "book"):
+            raise ValueError("price_feed must be 'kline' or 'book'.")
+
+        self.source = source
+        self.engine = engine
+        self.store = store
+        self.on_signals = on_signals
+        self.price_feed = price_feed
+        self.batch_interval = batch_interval
+        self.max_batch = max_batch
+        self.stats = IngestionStats()
+
+        self.pairs = list(pairs)
+        if engine is not None and list(engine.pairs) != self.pairs:
+            raise ValueError("pairs must match engine.pairs, in the same order.")
+        symbols = sorted({s for legs in pairs.values() for s in legs})
+        self.symbol_index = {s: i for i, s in enumerate(symbols)}
+        self._leg_a = np.array([self.symbol_index[pairs[p][0]] for p in self.pairs], dtype=np.int64)
+        self._leg_b = np.array([self.symbol_index[pairs[p][1]] for p in self.pairs], dtype=np.int64)
+
+        self._queue = asyncio.Queue(maxsize=queue_size)
+        self._store_queue = asyncio.Queue(maxsize=64)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kline-store")
+
+        self._book = np.full((len(symbols), 2), np.nan)  # latest bid, ask per symbol
+        self._pending = {}  # open_time -> close per symbol, for bars still waiting on a leg
+        self._last_bar = np.full(len(self.pairs), -1, dtype=np.int64)  # open_time of each pair's last update
+
+    async def _read(self) -> None:
+        async for message in self.source.messages():
+            self.stats.messages += 1
+            event = normalize(message)
+            if event is None:
+                self.stats.ignored += 1
+                continue
+            await self._queue.put(event)
+
+    async def _batches(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_interval
+            while len(batch) < self.max_batch:
+                self.stats.max_queue_depth = max(self.stats.max_queue_depth, self._queue.qsize())
+                while not self._queue.empty() and len(batch) < self.max_batch:
+                    batch.append(self._queue.get_nowait())
+                remaining = deadline - loop.time()
+                if remaining <= 0 or len(batch) >= self.max_batch:
+                    break
+                await asyncio.sleep(min(remaining, 0.002))
+
+            try:
+                await self._process(batch)
+            except Exception:
+                logger.exception(f"Failed to process a batch of {len(batch)} market data events.")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _process(self, batch: list) -> None:
+        self._batch_received = batch[0].received
+        touched = np.zeros(len(self.symbol_index), dtype=bool)
+        bars = {}  # symbol -> closed KlineEvents, in arrival order
+
+        for event in batch:
+            i = self.symbol_index.get(event.symbol)
+            if i is None:
+                continue
+            if isinstance(event, BookTickerEvent):
+                self._book[i] = event.bid, event.ask
+                touched[i] = True
+            elif event.closed:
+                bars.setdefault(event.symbol, []).append(event)
+                self._pending.setdefault(event.open_time, {})[i] = event.close
+
+        if self.engine is not None:
+            if self.price_feed == "book":
+                self._update_from_book(touched)
+            elif bars:
+                self._update_from_bars()
+
+        if self.store is not None and bars:
+            await self._store_queue.put(bars)
+
+        now = time.perf_counter()
+        self.stats.batches += 1
+        self.stats.largest_batch = max(self.stats.largest_batch, len(batch))
+        self.stats.latencies.append(now - batch[0].received)
+
+    def _update_from_book(self, touched: np.ndarray) -> None:
+        mid = self._book.mean(axis=1)
+        ready = (touched[self._leg_a] | touched[self._leg_b]) & ~np.isnan(mid[self._leg_a]) & ~np.isnan(mid[self._leg_b])
+        idx = np.flatnonzero(ready)
+        if idx.size:
+            self.engine.update(mid[self._leg_a[idx]], mid[self._leg_b[idx]], idx=idx)
+            self.stats.engine_updates += int(idx.size)
+            self._emit(self.engine.signals())
+
+    def _update_from_bars(self) -> None:
+        """Updates each pair once per bar, as soon as both legs have closed it, oldest bar first."""
+        for open_time in sorted(self._pending):
+            closes = np.full(len(self.symbol_index), np.nan)
+            for i, close in self._pending[open_time].items():
+                closes[i] = close
+            a, b = closes[self._leg_a], closes[self._leg_b]
+            idx = np.flatnonzero(~np.isnan(a) & ~np.isnan(b) & (self._last_bar < open_time))
+            if idx.size:
+                self.engine.update(a[idx], b[idx], idx=idx)
+                self._last_bar[idx] = open_time
+                self.stats.engine_updates += int(idx.size)
+                self._emit(self.engine.signals(np.datetime64(open_time, "ms").astype(object)))
+
+        for open_time in sorted(self._pending)[:-PENDING_BARS]:
+            del self._pending[open_time]
+
+    def _emit(self, signals: list) -> None:
+        if signals:
+            TICK_TO_SIGNAL.observe(time.perf_counter() - self._batch_received)
+            self.stats.signals += len(signals)
+            if self.on_signals is not None:
+                self.on_signals(signals)
+
+    async def _write(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            bars, taken = await self._store_queue.get(), 1
+            while not self._store_queue.empty():  # coalesce whatever queued up behind a slow write
+                for symbol, events in self._store_queue.get_nowait().items():
+                    bars.setdefault(symbol, []).extend(events)
+                taken += 1
+            try:
+                self.stats.bars_stored += await loop.run_in_executor(self._executor, self._append_bars, bars)
+            except Exception:
+                logger.exception(f"Failed to store bars for {len(bars)} symbols.")
+            finally:
+                for _ in range(taken):
+                    self._store_queue.task_done()
+
+    def _append_bars(self, bars: dict) -> int:
+        written = 0
+        for symbol, events in bars.items():
+            events = sorted({e.open_time: e for e in events}.values(), key=lambda e: e.open_time)
+            columns = {name: np.array([getattr(e, name) for e in events])
+                       for name in ("open_time", "open", "high", "low", "close", "volume", "close_time",
+                                    "quote_volume", "trades", "taker_buy_base_volume", "taker_buy_quote_volume")}
+            written += self.store.append(symbol, events[0].interval, columns)
+        return written
+
+    async def run(self) -> IngestionStats:
+        """Ingests until the source is exhausted (or the task is cancelled), then drains and returns stats."""
+        self.stats = IngestionStats()
+        workers = [asyncio.create_task(self._batches()), asyncio.create_task(self._write())]
+        try:
+            await self._read()
+            await self._queue.join()
+            await self._store_queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self._executor.shutdown(wait=True)
+        return self.stats
@@ -0,0 +1,472 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Async order gateway: concurrent two-leg submission, client-side rate limits and unwinds.
+"""
+
+import math
+import time
+import uuid
+import random
+import asyncio
+import logging
+import datetime
+from collections import deque
+from dataclasses import dataclass, field
+
+from src.core.database_models import Order
+from src.utils.enums import OrderType, OrderSide, StatusType, ExecutionStatus
+from src.utils.instrumentation import ORDER_ACK, SIGNAL_TO_SUBMIT
+
+logger = logging.getLogger(__name__)
+
+# Spot API weights and limits (GET /api/v3/exchangeInfo rateLimits); override per account if they differ.
+ORDER_WEIGHT = 1
+QUERY_ORDER_WEIGHT = 4
+REQUEST_WEIGHT_LIMITS = ((6_000, 60.0),)
+ORDER_LIMITS = ((50, 10.0), (160_000, 86_400.0))
+
+
+class OrderRejected(Exception):
+    """The exchange refused the order outright, so nothing was executed."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(f"{code}: {message}")
+        self.code = code
+
+
+class SlidingWindowLimit:
+    """At most `limit` units in any trailing `period` seconds, which also satisfies Binance's fixed windows."""
+
+    def __init__(self, limit: int, period: float):
+        self.limit = limit
+        self.period = period
+        self._events = deque()
+        self._used = 0
+
+    def _expire(self, now: float) -> None:
+        while self._events and self._events[0][0] <= now - self.period:
+            self._used -= self._events.popleft()[1]
+
+    def wait_time(self, amount: int, now: float) -> float:
+        self._expire(now)
+        excess = self._used + amount - self.limit
+        if excess <= 0:
+            return 0.0
+        freed = 0
+        for stamp, units in self._events:
+            freed += units
+            if freed >= excess:
+                return stamp + self.period - now
+        return self.period
+
+    def record(self, amount: int, now: float) -> None:
+        self._events.append((now, amount))
+        self._used += amount
+
+
+class RateLimiter:
+    """
+    Client-side request-weight and order-count limits; acquire() waits until every window has room.
+
+    The exchange counts requests when they arrive, so each window is stretched by `guard` seconds
+    to absorb network jitter between our send time and its receive time.
+    """
+
+    def __init__(self, weight_limits=REQUEST_WEIGHT_LIMITS, order_limits=ORDER_LIMITS, guard: float = 0.25):
+        self.weight = [SlidingWindowLimit(limit, period + guard) for limit, period in weight_limits]
+        self.orders = [SlidingWindowLimit(limit, period + guard) for limit, period in order_limits]
+        self._lock = asyncio.Lock()
+        self.waited = 0.0
+
+    async def acquire(self, weight: int, orders: int = 0) -> None:
+        async with self._lock:  # FIFO, and a pair's legs are admitted together
+            while True:
+                now = time.monotonic()
+                wait = max([w.wait_time(weight, now) for w in self.weight] +
+                           [o.wait_time(orders, now) for o in self.orders if orders])
+                if wait <= 0:
+                    for w in self.weight:
+                        w.record(weight, now)
+                    if orders:
+                        for o in self.orders:
+                            o.record(orders, now)
+                    return
+                self.waited += wait
+                await asyncio.sleep(wait)
+
+    def observe_used_weight(self, used: int) -> None:
+        """Aligns the first weight window with the X-MBX-USED-WEIGHT header when the server counts more."""
+        window = self.weight[0]
+        now = time.monotonic()
+        window._expire(now)
+        if used > window._used:
+            window.record(used - window._used, now)
+
+
+@dataclass(frozen=True)
+class LegOrder:
+    symbol: str
+    side: OrderSide
+    quantity: float
+
+
+@dataclass
+class LegFill:
+    symbol: str
+    side: OrderSide
+    requested: float
+    filled: float
+    avg_price: float  # NaN when nothing filled
+    status: str  # exchange order status, or REJECTED / UNKNOWN
+    client_order_id: str
+    order_id: int = None
+    latency: float = 0.0  # seconds from send to acknowledgement
+    acked_at: float = 0.0  # time.perf_counter() of the acknowledgement
+    error: str = None
+
+    @property
+    def fill_ratio(self) -> float:
+        return self.filled / self.requested if self.requested else 0.0
+
+    @property
+    def complete(self) -> bool:
+        return self.filled >= self.requested * (1 - 1e-9)
+
+
+@dataclass
+class PairExecution:
+    pair_id: str
+    legs: tuple
+    status: ExecutionStatus
+    unwinds: list = field(default_factory=list)
+    submitted_at: datetime.datetime = None
+    latency: float = 0.0  # seconds from submission to the last acknowledgement, unwinds included
+
+    @property
+    def leg_gap(self) -> float:
+        """Seconds between the two legs' acknowledgements: the window of one-legged exposure."""
+        return abs(self.legs[0].acked_at - self.legs[1].acked_at)
+
+    def to_orders(self, signal_id: int = None) -> list[Order]:
+        """Order rows for every leg and unwind sent, filled quantity and average price included."""
+        orders = []
+        for fill in (*self.legs, *self.unwinds):
+            filled = fill.filled > 0
+            orders.append(Order(
+                signal_id=signal_id,
+                stock_symbol=fill.symbol,
+                order_type=OrderType.MARKET,
+                side=fill.side,
+                quantity=fill.filled if filled else fill.requested,
+                price=fill.avg_price if filled else None,
+                status=StatusType.FILLED if filled else StatusType.REJECTED,
+                submission_datetime=self.submitted_at,
+                filled_datetime=self.submitted_at + datetime.timedelta(seconds=fill.latency) if filled else None,
+            ))
+        return orders
+
+
+class BinanceExchange:
+    """Exchange adapter over python-binance's AsyncClient, which keeps one pooled aiohttp session."""
+
+    def __init__(self, client):
+        self.client = client
+        self.last_used_weight = None
+
+    @classmethod
+    async def create(cls, api_key: str, api_secret: str, testnet: bool) -> "BinanceExchange":
+        from binance import AsyncClient
+
+        return cls(await AsyncClient.create(api_key, api_secret, testnet=testnet))
+
+    async def _call(self, method, **params) -> dict:
+        from binance.exceptions import BinanceAPIException
+
+        try:
+            return await method(**params)
+        except BinanceAPIException as e:
+            if 400 <= e.status_code < 500:  # validated and refused; 5xx leaves the order state unknown
+                raise OrderRejected(e.code, e.message) from e
+            raise
+        finally:
+            response = getattr(self.client, "response", None)
+            if response is not None and "x-mbx-used-weight-1m" in response.headers:
+                self.last_used_weight = int(response.headers["x-mbx-used-weight-1m"])
+
+    async def create_order(self, symbol: str, side: str, quantity: float, client_order_id: str) -> dict:
+        return await self._call(self.client.create_order, symbol=symbol, side=side, type="MARKET",
+                                quantity=quantity, newClientOrderId=client_order_id, newOrderRespType="FULL")
+
+    async def get_order(self, symbol: str, client_order_id: str) -> dict:
+        return await self._call(self.client.get_order, symbol=symbol, origClientOrderId=client_order_id)
+
+    async def lot_sizes(self) -> dict:
+        """{symbol: LOT_SIZE stepSize} from exchangeInfo; order quantities must be multiples of it."""
+        info = await self._call(self.client.get_exchange_info)
+        return {market["symbol"]: float(f["stepSize"]) for market in info["symbols"]
+                for f in market["filters"] if f["filterType"] == "LOT_SIZE"}
+
+    async def close(self) -> None:
+        await self.client.close_connection()
+
+
+class MockExchange:
+    """
+    In-process stand-in for latency and throughput tests: market orders fill at a fixed price after
+    a random delay, with configurable rejection and partial-fill rates. It enforces its own order
+    limit and rejects with -1015 like Binance, so a missing client-side limiter shows up, and rejects
+    quantities off the `step` grid with -1111, so does missing rounding.
+    """
+
+    def __init__(self, prices: dict, latency: float = 0.02, jitter: float = 0.005, reject_rate: float = 0.0,
+                 partial_rate: float = 0.0, order_limit: tuple = ORDER_LIMITS[0], seed: int = None,
+                 step: float = 1e-6):
+        self.prices = prices
+        self.latency = latency
+        self.jitter = jitter
+        self.reject_rate = reject_rate
+        self.partial_rate = partial_rate
+        self.fail_symbols = set()  # every order for these symbols is rejected
+        self.quantity_steps = dict.fromkeys(prices, step)
+        self.orders = {}
+        self.last_used_weight = None
+        self._limit = SlidingWindowLimit(*order_limit)
+        self._rng = random.Random(seed)
+        self._next_id = 1
+
+    async def create_order(self, symbol: str, side: str, quantity: float, client_order_id: str) -> dict:
+        await asyncio.sleep(max(0.0, self._rng.gauss(self.latency, self.jitter)))
+        now = time.monotonic()
+        if self._limit.wait_time(1, now) > 0:
+            raise OrderRejected(-1015, "Too many new orders.")
+        self._limit.record(1, now)
+        steps = quantity / self.quantity_steps[symbol]
+        if abs(steps - round(steps)) > 1e-6:
+            raise OrderRejected(-1111, "Parameter 'quantity' has too much precision.")
+        if symbol in self.fail_symbols or self._rng.random() < self.reject_rate:
+            raise OrderRejected(-2010, "Account has insufficient balance for requested action.")
+
+        filled = quantity
+        if self._rng.random() < self.partial_rate:
+            step = self.quantity_steps[symbol]
+            filled = round(math.floor(quantity * self._rng.uniform(0.1, 0.9) / step) * step, 12)
+        price = self.prices[symbol]
+        order = {
+            "symbol": symbol, "orderId": self._next_id, "clientOrderId": client_order_id, "side": side,
+            "type": "MARKET", "origQty": str(quantity), "executedQty": str(filled),
+            "cummulativeQuoteQty": str(filled * price), "status": "FILLED" if filled == quantity else "EXPIRED",
+            "transactTime": int(time.time() * 1000),
+        }
+        self._next_id += 1
+        self.orders[client_order_id] = order
+        return order
+
+    async def get_order(self, symbol: str, client_order_id: str) -> dict:
+        await asyncio.sleep(max(0.0, self._rng.gauss(self.latency, self.jitter)))
+        if client_order_id not in self.orders:
+            raise OrderRejected(-2013, "Order does not exist.")
+        return self.orders[client_order_id]
+
+    async def lot_sizes(self) -> dict:
+        return dict(self.quantity_steps)
+
+    async def close(self) -> None:
+        pass
+
+
+class OrderGateway:
+    """
+    Submits both legs of a pair trade concurrently so one-legged exposure lasts one round trip
+    rather than two, then repairs any imbalance.
+
+    Both legs are admitted by the rate limiter together and sent with asyncio.gather. If one leg
+    fails, whatever the other filled is reversed; if both fill partially, the leg with the higher
+    fill ratio is trimmed back to the lower one. A send that errors without a definite rejection
+    (timeout, 5xx) is reconciled by client order id before anything is unwound. If a leg's state
+    stays unknown nothing is unwound at all, and an unknown unwind stops further retries; either
+    way the pair is marked NEEDS_ATTENTION.
+
+    Every quantity sent is rounded down to the symbol's LOT_SIZE step, so `quantity_steps` must
+    cover every symbol traded; connect() loads it from the exchange.
+    """
+
+    def __init__(self, exchange, quantity_steps: dict, limiter: RateLimiter = None, timeout: float = 5.0,
+                 unwind_retries: int = 3, reconcile_retries: int = 4, reconcile_delay: float = 0.25):
+        self.exchange = exchange
+        self.quantity_steps = quantity_steps
+        self.limiter = limiter or RateLimiter()
+        self.timeout = timeout
+        self.unwind_retries = unwind_retries
+        self.reconcile_retries = reconcile_retries
+        self.reconcile_delay = reconcile_delay
+
+    @classmethod
+    async def connect(cls, exchange, **kwargs) -> "OrderGateway":
+        """Gateway over `exchange` with quantity steps from its exchange info (unless given)."""
+        if kwargs.get("quantity_steps") is None:
+            kwargs["quantity_steps"] = await exchange.lot_sizes()
+        return cls(exchange, **kwargs)
+
+    @classmethod
+    async def for_binance(cls, api_key: str, api_secret: str, testnet: bool, **kwargs) -> "OrderGateway":
+        return await cls.connect(await BinanceExchange.create(api_key, api_secret, testnet), **kwargs)
+
+    def _round_down(self, symbol: str, quantity: float) -> float:
+        step = self.quantity_steps.get(symbol)
+        if not step:
+            raise KeyError(f"No LOT_SIZE step for {symbol}; build the gateway with connect() or pass quantity_steps.")
+        decimals = max(0, -int(math.floor(math.log10(step))))
+        return round(math.floor(quantity / step + 1e-9) * step, decimals)
+
+    def _observe_weight(self) -> None:
+        used = getattr(self.exchange, "last_used_weight", None)
+        if used is not None:
+            self.limiter.observe_used_weight(used)
+
+    async def _place(self, leg: LegOrder, client_order_id: str) -> LegFill:
+        quantity = self._round_down(leg.symbol, leg.quantity)
+        sent = time.perf_counter()
+        fill = LegFill(leg.symbol, leg.side, quantity, 0.0, math.nan, "REJECTED", client_order_id)
+        try:
+            response = await asyncio.wait_for(
+                self.exchange.create_order(leg.symbol, leg.side.value, quantity, client_order_id), self.timeout)
+        except OrderRejected as e:
+            fill.error = str(e)
+            response = None
+        except Exception as e:
+            logger.warning(f"Order {client_order_id} state unknown after {type(e).__name__}: {e}; reconciling.")
+            response = await self._reconcile(leg, client_order_id, fill)
+        finally:
+            fill.acked_at = time.perf_counter()
+            fill.latency = fill.acked_at - sent
+            ORDER_ACK.observe(fill.latency)
+            self._observe_weight()
+
+        if response is not None:
+            fill.order_id = response.get("orderId")
+            fill.status = response["status"]
+            fill.filled = float(response["executedQty"])
+            quote = float(response["cummulativeQuoteQty"])
+            fill.avg_price = quote / fill.filled if fill.filled else math.nan
+        return fill
+
+    async def _reconcile(self, leg: LegOrder, client_order_id: str, fill: LegFill):
+        """
+        Looks an order up by client order id after a send with no definite answer.
+
+        Right after a timeout, -2013 (order does not exist) may only mean the order is not visible
+        yet, so the lookup is retried with backoff. The leg counts as unfilled only if the last of
+        reconcile_retries lookups still says -2013; any other outcome leaves it UNKNOWN.
+        """
+        for attempt in range(self.reconcile_retries):
+            if attempt:
+                await asyncio.sleep(self.reconcile_delay * 2 ** (attempt - 1))
+            try:
+                await self.limiter.acquire(QUERY_ORDER_WEIGHT)
+                return await asyncio.wait_for(self.exchange.get_order(leg.symbol, client_order_id), self.timeout)
+            except OrderRejected as e:
+                fill.status = "REJECTED" if e.code == -2013 else "UNKNOWN"
+                fill.error = str(e)
+                if e.code != -2013:
+                    break
+            except Exception as e:
+                fill.status = "UNKNOWN"
+                fill.error = f"{type(e).__name__}: {e}"
+
+        if fill.status == "UNKNOWN":
+            logger.error(f"Could not reconcile order {client_order_id}: {fill.error}")
+        return None
+
+    async def submit(self, leg: LegOrder, client_order_id: str = None) -> LegFill:
+        """Single market order, rate limited."""
+        await self.limiter.acquire(ORDER_WEIGHT, orders=1)
+        return await self._place(leg, client_order_id or uuid.uuid4().hex[:32])
+
+    async def _unwind(self, fill: LegFill, quantity: float, client_prefix: str) -> list[LegFill]:
+        """
+        Reverses `quantity` of a filled leg, retrying with backoff; returns every attempt.
+
+        Stops at an attempt whose state is UNKNOWN: it may have filled, and retrying could send a
+        second reversing order.
+        """
+        reverse = OrderSide.SELL if fill.side is OrderSide.BUY else OrderSide.BUY
+        attempts = []
+        remaining = quantity
+        for attempt in range(self.unwind_retries):
+            result = await self.submit(LegOrder(fill.symbol, reverse, remaining), f"{client_prefix}{attempt}")
+            attempts.append(result)
+            if result.status == "UNKNOWN":
+                logger.error(f"Unwind {result.client_order_id} state unknown; not retrying {fill.symbol}.")
+                break
+            remaining = self._round_down(fill.symbol, remaining - result.filled)
+            if remaining <= 0:
+                break
+            await asyncio.sleep(0.05 * 2 ** attempt)
+        return attempts
+
+    async def submit_pair(self, leg_a: LegOrder, leg_b: LegOrder, pair_id: str = None,
+                          signal_at: float = None) -> PairExecution:
+        """Both legs at once; `signal_at` (time.perf_counter() when the signal fired) feeds signal_to_submit."""
+        pair_id = pair_id or uuid.uuid4().hex[:16]
+        submitted_at = datetime.datetime.utcnow()
+        started = time.perf_counter()
+        if signal_at is not None:
+            SIGNAL_TO_SUBMIT.observe(started - signal_at)
+
+        await self.limiter.acquire(2 * ORDER_WEIGHT, orders=2)
+        legs = tuple(await asyncio.gather(self._place(leg_a, f"{pair_id}-a"), self._place(leg_b, f"{pair_id}-b")))
+
+        unwinds = []
+        if any(leg.status == "UNKNOWN" for leg in legs):
+            # An unknown leg may have filled; reversing the other one could leave it naked.
+            status = ExecutionStatus.NEEDS_ATTENTION
+        elif all(leg.complete for leg in legs):
+            status = ExecutionStatus.FILLED
+        elif all(leg.filled == 0 for leg in legs):
+            status = ExecutionStatus.FAILED
+        else:
+            status = ExecutionStatus.UNWOUND if min(leg.fill_ratio for leg in legs) == 0 else ExecutionStatus.PARTIAL
+            unwinds, balanced = await self._rebalance(legs, pair_id)
+            if not balanced:
+                status = ExecutionStatus.NEEDS_ATTENTION
+
+        if any(fill.status == "UNKNOWN" for fill in unwinds):
+            status = ExecutionStatus.NEEDS_ATTENTION
+
+        execution = PairExecution(pair_id, legs, status, unwinds, submitted_at, time.perf_counter() - started)
+        self._log(execution)
+        return execution
+
+    async def _rebalance(self, legs: tuple, pair_id: str) -> tuple[list, bool]:
+        """Trims each leg back to the lower fill ratio of the two; returns (unwind fills, fully trimmed)."""
+        target = min(leg.fill_ratio for leg in legs)
+        excess = [self._round_down(leg.symbol, leg.filled - target * leg.requested) for leg in legs]
+
+        results = await asyncio.gather(*(self._unwind(leg, qty, f"{pair_id}-u{name}")
+                                         for name, leg, qty in zip("ab", legs, excess) if qty > 0))
+        unwound = iter(results)
+        balanced = True
+        fills = []
+        for qty in excess:
+            if qty > 0:
+                attempts = next(unwound)
+                fills.extend(attempts)
+                balanced &= (self._round_down(attempts[0].symbol, qty - sum(a.filled for a in attempts)) <= 0
+                             and all(a.status != "UNKNOWN" for a in attempts))
+        return fills, balanced
+
+    def _log(self, execution: PairExecution) -> None:
+        if execution.status is ExecutionStatus.NEEDS_ATTENTION:
+            logger.critical(f"Pair execution {execution.pair_id} needs manual attention: "
+                            f"{[(leg.symbol, leg.filled, leg.status, leg.error) for leg in execution.legs]}, "
+                            f"unwinds {[(u.symbol, u.filled, u.status) for u in execution.unwinds]}.")
+        elif execution.status is not ExecutionStatus.FILLED:
+            logger.warning(f"Pair execution {execution.pair_id} {execution.status.value}: "
+                           f"{[(leg.symbol, leg.filled, leg.status, leg.error) for leg in execution.legs]}.")
+
+    async def close(self) -> None:
+        await self.exchange.close()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Per-tick risk across open pair positions as matrix operations over a pair x asset holdings matrix.
+"""
+
+import logging
+import datetime
+from dataclasses import dataclass
+
+import numpy as np
+from sqlalchemy import select
+
+from src.core.database import BaseDatabase
+from src.core.database_models import PairPosition, PositionLeg
+from src.utils.enums import PositionType
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RiskSnapshot:
+    pair_position_ids: np.ndarray
+    pairs: list[str]
+    assets: list[str]
+    net_exposure: np.ndarray  # signed marked notional per asset, aligned with `assets`
+    gross_exposure: float  # sum of |leg notional| over every leg
+    net_leverage: float  # sum of |net_exposure| / equity, after offsetting legs across pairs
+    gross_leverage: float  # gross_exposure / equity
+    pair_pnl: np.ndarray  # unrealised PnL per pair, aligned with `pairs`
+
+    @property
+    def total_pnl(self) -> float:
+        return float(self.pair_pnl.sum())
+
+    def largest_exposures(self, n: int = 10) -> list[tuple[str, float]]:
+        order = np.argsort(-np.abs(self.net_exposure))[:n]
+        return [(self.assets[k], float(self.net_exposure[k])) for k in order]
+
+
+class RiskAggregator:
+    """
+    Open pair positions held as a dense holdings matrix Q (pairs x assets) of signed leg quantities.
+
+    With a price vector p aligned with `assets`, one evaluation is
+        net exposure per asset = Q.sum(0) * p
+        gross exposure         = |Q| @ p, summed
+        pair PnL               = Q @ p - cost
+    where cost holds each pair's entry notional (sum of quantity * entry_price over its legs).
+    Legs of different pairs on the same asset net out in the first line, which is what the account
+    actually holds. Rows and columns are dense: removing a pair moves the last row into its slot.
+    """
+
+    def __init__(self, capacity: int = 256, asset_capacity: int = 256):
+        self._holdings = np.zeros((capacity, asset_capacity))
+        self._cost = np.zeros(capacity)
+        self._hedge_ratios = np.zeros(capacity)
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._size = 0
+        self._rows = {}  # pair_position_id -> row
+        self.pairs = []  # pair name per row
+        self.assets = []
+        self._codes = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, pair_position_id: int) -> bool:
+        return pair_position_id in self._rows
+
+    @property
+    def holdings(self) -> np.ndarray:
+        """Q restricted to live pairs and known assets (a view)."""
+        return self._holdings[:self._size, :len(self.assets)]
+
+    @property
+    def hedge_ratios(self) -> np.ndarray:
+        return self._hedge_ratios[:self._size]
+
+    def asset_code(self, symbol: str) -> int:
+        code = self._codes.get(symbol)
+        if code is None:
+            code = self._codes[symbol] = len(self.assets)
+            self.assets.append(symbol)
+            if code == self._holdings.shape[1]:
+                self._holdings = np.hstack([self._holdings, np.zeros_like(self._holdings)])
+        return code
+
+    def _grow_rows(self) -> None:
+        self._holdings = np.vstack([self._holdings, np.zeros_like(self._holdings)])
+        self._cost = np.concatenate([self._cost, np.zeros_like(self._cost)])
+        self._hedge_ratios = np.concatenate([self._hedge_ratios, np.zeros_like(self._hedge_ratios)])
+        self._ids = np.concatenate([self._ids, np.zeros_like(self._ids)])
+
+    def add(self, pair_position_id: int, pair: str, hedge_ratio: float, legs) -> None:
+        """Adds an open pair; `legs` is an iterable of (symbol, signed quantity, entry price)."""
+        if pair_position_id in self._rows:
+            raise KeyError(f"Pair position {pair_position_id} is already open.")
+        legs = [(self.asset_code(symbol), quantity, price) for symbol, quantity, price in legs]
+        if self._size == len(self._ids):
+            self._grow_rows()
+
+        row = self._size
+        self._holdings[row] = 0.0
+        for code, quantity, price in legs:
+            self._holdings[row, code] += quantity
+        self._cost[row] = sum(quantity * price for _, quantity, price in legs)
+        self._hedge_ratios[row] = hedge_ratio
+        self._ids[row] = pair_position_id
+        self._rows[pair_position_id] = row
+        self.pairs.append(pair)
+        self._size += 1
+
+    def remove(self, pair_position_id: int) -> None:
+        row = self._rows.pop(pair_position_id)
+        last = self._size - 1
+        if row != last:
+            for array in (self._holdings, self._cost, self._hedge_ratios, self._ids):
+                array[row] = array[last]
+            self.pairs[row] = self.pairs[last]
+            self._rows[int(self._ids[row])] = row
+        self.pairs.pop()
+        self._size = last
+
+    def _price_vector(self, prices) -> np.ndarray:
+        if isinstance(prices, dict):
+            return np.fromiter((prices.get(s, np.nan) for s in self.assets), dtype=np.float64, count=len(self.assets))
+        prices = np.asarray(prices, dtype=np.float64)
+        if len(prices) != len(self.assets):
+            raise ValueError(f"Expected {len(self.assets)} prices aligned with `assets`, got {len(prices)}.")
+        return prices
+
+    def evaluate(self, prices, equity: float = None) -> RiskSnapshot:
+        """
+        Marks every open pair at `prices` (array aligned with `assets`, or {symbol: price}).
+
+        Leverage is NaN without `equity`. A missing price makes the affected pairs' PnL and the
+        asset's exposure NaN rather than silently zero.
+        """
+        p = self._price_vector(prices)
+        q = self.holdings
+        missing = np.isnan(p)
+        p_known = np.where(missing, 0.0, p)  # 0 * NaN would poison every row of the products
+
+        net_exposure = q.sum(axis=0) * p
+        pair_pnl = q @ p_known - self._cost[:self._size]
+        gross_exposure = float((np.abs(q) @ p_known).sum())
+        if missing.any():
+            held = (q[:, missing] != 0).any(axis=1)
+            pair_pnl[held] = np.nan
+            gross_exposure = np.nan if held.any() else gross_exposure
+        equity = np.nan if not equity else float(equity)
+
+        return RiskSnapshot(
+            pair_position_ids=self._ids[:self._size].copy(),
+            pairs=list(self.pairs),
+            assets=list(self.assets),
+            net_exposure=net_exposure,
+            gross_exposure=gross_exposure,
+            net_leverage=float(np.abs(net_exposure).sum()) / equity,
+            gross_leverage=gross_exposure / equity,
+            pair_pnl=pair_pnl,
+        )
+
+    @classmethod
+    def from_database(cls, db: BaseDatabase) -> "RiskAggregator":
+        """Builds the matrix from every OPEN pair position and its legs, column-wise."""
+        columns = db.fetch_columnar(
+            select(PairPosition.id, PairPosition.pair, PairPosition.hedge_ratio, PositionLeg.stock_symbol,
+                   PositionLeg.quantity, PositionLeg.entry_price)
+            .join(PositionLeg, PositionLeg.pair_position_id == PairPosition.id)
+            .where(PairPosition.status == PositionType.OPEN)
+            .order_by(PairPosition.id, PositionLeg.leg)
+        )
+        ids = columns["id"]
+        unique_ids, first, rows = np.unique(ids, return_index=True, return_inverse=True)
+        assets, codes = np.unique(columns["stock_symbol"].astype(str), return_inverse=True)
+        n, m = len(unique_ids), len(assets)
+
+        risk = cls(capacity=max(n * 2, 256), asset_capacity=max(m * 2, 256))
+        risk.assets = assets.tolist()
+        risk._codes = {s: k for k, s in enumerate(risk.assets)}
+        np.add.at(risk._holdings, (rows, codes), columns["quantity"])
+        risk._cost[:n] = np.bincount(rows, weights=columns["quantity"] * np.nan_to_num(columns["entry_price"]),
+                                     minlength=n)
+        risk._hedge_ratios[:n] = columns["hedge_ratio"][first]
+        risk._ids[:n] = unique_ids
+        risk.pairs = columns["pair"][first].astype(str).tolist()
+        risk._rows = dict(zip(unique_ids.tolist(), range(n)))
+        risk._size = n
+        logger.info(f"Loaded {n} open pair positions over {m} assets.")
+        return risk
+
+
+def open_pair_position(session, pair: str, hedge_ratio: float, legs, signal_id: int = None,
+                       entry_datetime: datetime.datetime = None) -> PairPosition:
+    """
+    Adds an OPEN PairPosition and its legs to `session` (not committed).
+
+    `legs` is a sequence of (symbol, signed quantity, entry price, entry order id) in leg order.
+    """
+    position = PairPosition(pair=pair, hedge_ratio=hedge_ratio, signal_id=signal_id,
+                            entry_datetime=entry_datetime, status=PositionType.OPEN)
+    session.add(position)
+    session.flush()
+    session.add_all(PositionLeg(pair_position_id=position.id, leg=k, stock_symbol=symbol, quantity=quantity,
+                                entry_price=price, entry_order_id=order_id)
+                    for k, (symbol, quantity, price, order_id) in enumerate(legs))
+    return position
+
+
+def close_pair_position(session, pair_position_id: int, exit_prices, exit_order_ids=None,
+                        exit_datetime: datetime.datetime = None) -> PairPosition:
+    """Closes a pair at `exit_prices` (one per leg, in leg order) and stores its realised PnL."""
+    position = session.get(PairPosition, pair_position_id)
+    legs = session.scalars(select(PositionLeg).where(PositionLeg.pair_position_id == pair_position_id)
+                           .order_by(PositionLeg.leg)).all()
+    exit_order_ids = exit_order_ids or [None] * len(legs)
+    for leg, price, order_id in zip(legs, exit_prices, exit_order_ids):
+        leg.exit_price = price
+        leg.exit_order_id = order_id
+    position.realised_pnl = sum((leg.exit_price - leg.entry_price) * leg.quantity for leg in legs)
+    position.exit_datetime = exit_datetime
+    position.status = PositionType.CLOSED
+    return position
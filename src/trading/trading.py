@@ -7,14 +7,36 @@
 """
 from typing import Optional
 
-from binance.client import Client
-from src.core.application_constants import PAPER_BINANCE_API_KEY, PAPER_BINANCE_API_SECRET, PAPER_TRADE
+from src.core.application_constants import settings
 
 
 class BinanceBase:
+    """
+    Synchronous Binance client for one account.
+
+    Importing this module neither imports python-binance nor touches the network; the REST client
+    is created on first use of `client`.
+    """
+
     def __init__(self, api_key: str, api_secret: str, trading_type: bool):
         self.trading_type = trading_type
-        self.client = Client(api_key, api_secret, testnet=trading_type)
+        self._api_key = api_key
+        self._api_secret = api_secret
+        self._client = None
+
+    @classmethod
+    def from_settings(cls) -> "BinanceBase":
+        """The paper or live account, per PAPER_TRADE in config.ini."""
+        api_key, api_secret = settings.binance_credentials
+        return cls(api_key, api_secret, settings.paper_trade)
+
+    @property
+    def client(self):
+        if self._client is None:
+            from binance.client import Client
+
+            self._client = Client(self._api_key, self._api_secret, testnet=self.trading_type)
+        return self._client
 
     def generate_order(self, _symbol: str, _side: str, _order_type: str, _tim: Optional[str], _quantity: float,
                        _price: Optional[float]):
@@ -27,8 +49,11 @@ class BinanceBase:
             price=_price
         )
 
+    def get_asset_balance(self, asset: str = "USDT") -> dict:
+        return self.client.get_asset_balance(asset)
+
+    async def order_gateway(self, **kwargs):
+        """Async gateway on the same account for concurrent two-leg orders; see src/trading/order_gateway.py."""
+        from src.trading.order_gateway import OrderGateway
 
-test = BinanceBase(PAPER_BINANCE_API_KEY, PAPER_BINANCE_API_SECRET, PAPER_TRADE)
-#print(test.generate_order(_symbol="ETHUSDT", _side="SELL", _order_type="MARKET", _tim=None, _price=None, _quantity=2))
-x = test.client.get_asset_balance("USDT")
-print(x)
+        return await OrderGateway.for_binance(self._api_key, self._api_secret, self.trading_type, **kwargs)
@@ -41,3 +41,28 @@ class PositionType(Enum):
 class TradingType(Enum):
     LIVE = "Live Trading"
     PAPER = "Paper Trading"
+
+
+class QueryMode(Enum):
+    JOINED = "joined"
+    DENORMALIZED = "denormalized"
+    ROLLUP = "rollup"
+
+
+class ExportFormat(Enum):
+    PARQUET = "parquet"
+    CSV = "csv"
+
+
+class ExecutionStatus(Enum):
+    FILLED = "FILLED"  # both legs fully filled
+    PARTIAL = "PARTIAL"  # both legs partly filled, trimmed back to the same fill ratio
+    UNWOUND = "UNWOUND"  # one leg failed; whatever the other filled was reversed
+    FAILED = "FAILED"  # neither leg filled
+    NEEDS_ATTENTION = "NEEDS_ATTENTION"  # a leg's state is unknown or an unwind did not complete
+
+
+class LogOverflowPolicy(Enum):
+    BLOCK = "block"  # the logging call waits for room; nothing is lost
+    DROP_NEW = "drop_new"  # the incoming record is discarded
+    DROP_OLDEST = "drop_oldest"  # the oldest queued record is discarded to make room
@@ -0,0 +1,366 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Date: 17/10/2026
+    Author: Joshua David Golafshan
+    Description: Low-overhead latency histograms and counters with a Prometheus text endpoint.
+"""
+
+import time
+import logging
+import threading
+import functools
+import inspect
+import weakref
+import itertools
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+SUB_BUCKET_BITS = 4  # 16 sub-buckets per power of two: <= 6.25% relative error
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+NUM_BUCKETS = 40 * SUB_BUCKETS  # nanosecond values up to 2^39 ns (~9 minutes)
+EXPORT_BOUNDS = tuple(m * 10.0 ** e for e in range(-6, 2) for m in (1, 2.5, 5))  # seconds, 1us .. 50s
+DEFAULT_PORT = 9108
+
+
+def bucket_index(nanoseconds: int) -> int:
+    """HDR-style log-linear bucket: exact below 2*SUB_BUCKETS, then SUB_BUCKETS per power of two."""
+    if nanoseconds < 2 * SUB_BUCKETS:
+        return max(nanoseconds, 0)
+    shift = nanoseconds.bit_length() - SUB_BUCKET_BITS - 1
+    return min(shift * SUB_BUCKETS + (nanoseconds >> shift), NUM_BUCKETS - 1)
+
+
+def bucket_bounds(index: int) -> tuple[int, int]:
+    """[lower, upper) of a bucket in nanoseconds."""
+    if index < 2 * SUB_BUCKETS:
+        return index, index + 1
+    shift = index // SUB_BUCKETS - 1
+    lower = (index - shift * SUB_BUCKETS) << shift
+    return lower, lower + (1 << shift)
+
+
+class _ShardOwner:
+    """Lives in a thread's local storage, so it is collected when that thread exits."""
+    __slots__ = ("__weakref__",)
+
+
+class _Sharded:
+    """
+    Per-thread shards so the write path takes no lock: each thread only ever touches its own list,
+    and readers sum every shard. A lock is taken once per thread, when its shard is created, and
+    once more when the thread exits and its counts are folded into the shared base shard, so the
+    number of shards tracks live threads rather than every thread ever seen.
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._base = [0] * size
+        self._shards = {}
+        self._keys = itertools.count()
+        self._lock = threading.Lock()
+
+    def shard(self) -> list:
+        try:
+            return self._local.values
+        except AttributeError:
+            values = self._local.values = [0] * self._size
+            owner = self._local.owner = _ShardOwner()
+            with self._lock:
+                key = next(self._keys)
+                self._shards[key] = values
+            weakref.finalize(owner, self._retire, key)
+            return values
+
+    def _retire(self, key: int) -> None:
+        with self._lock:
+            values = self._shards.pop(key, None)
+            if values is not None:
+                self._base = [a + b for a, b in zip(self._base, values)]
+
+    def totals(self) -> list:
+        with self._lock:
+            shards = [self._base, *self._shards.values()]
+        return [sum(column) for column in zip(*shards)]
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str = "", labels: dict = None):
+        self.name, self.help, self.labels = name, help_text, labels or {}
+        self._values = _Sharded(1)
+
+    def inc(self, amount: float = 1) -> None:
+        self._values.shard()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._values.totals()[0]
+
+
+class Gauge:
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str = "", labels: dict = None):
+        self.name, self.help, self.labels = name, help_text, labels or {}
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Histogram:
+    """
+    Latency histogram in seconds with log-linear buckets over nanoseconds.
+
+    observe() is a bucket computation and two list increments on the calling thread's shard, in
+    the order of a microsecond, so it can stay on in production.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str = "", labels: dict = None):
+        self.name, self.help, self.labels = name, help_text, labels or {}
+        self._counts = _Sharded(NUM_BUCKETS + 1)  # last slot holds the sum in nanoseconds
+
+    def observe(self, seconds: float) -> None:
+        nanoseconds = int(seconds * 1e9)
+        shard = self._counts.shard()
+        shard[bucket_index(nanoseconds)] += 1
+        shard[NUM_BUCKETS] += nanoseconds
+
+    def time(self):
+        return _Timer(self)
+
+    def snapshot(self) -> tuple[list, float]:
+        """(bucket counts, sum in seconds)."""
+        totals = self._counts.totals()
+        return totals[:NUM_BUCKETS], totals[NUM_BUCKETS] / 1e9
+
+    @property
+    def count(self) -> int:
+        return sum(self.snapshot()[0])
+
+    def quantiles(self, q=(0.5, 0.9, 0.99, 0.999)) -> dict:
+        """Bucket-midpoint estimates in seconds; NaN when nothing has been observed."""
+        counts, _ = self.snapshot()
+        total = sum(counts)
+        if not total:
+            return {p: float("nan") for p in q}
+        results, cumulative, targets = {}, 0, sorted(q)
+        for index, count in enumerate(counts):
+            cumulative += count
+            while targets and cumulative >= targets[0] * total:
+                lower, upper = bucket_bounds(index)
+                results[targets.pop(0)] = (lower + upper) / 2e9
+            if not targets:
+                break
+        return {p: results[p] for p in q}
+
+
+class _Timer:
+    __slots__ = ("histogram", "started")
+
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started)
+
+
+class Registry:
+    """Metrics by (name, labels); asking twice for the same metric returns the same object."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name: str, help_text: str, labels: dict):
+        key = (name, tuple(sorted(labels.items())))
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.setdefault(key, cls(name, help_text, labels))
+        return metric
+
+    def counter(self, name: str, help_text: str = "", **labels) -> Counter:
+        return self._get(Counter, name, help_text, labels)
+
+    def gauge(self, name: str, help_text: str = "", **labels) -> Gauge:
+        return self._get(Gauge, name, help_text, labels)
+
+    def histogram(self, name: str, help_text: str = "", **labels) -> Histogram:
+        return self._get(Histogram, name, help_text, labels)
+
+    def metrics(self) -> list:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format 0.0.4; histograms are exported on EXPORT_BOUNDS."""
+        lines, described = [], set()
+        for metric in sorted(self.metrics(), key=lambda m: m.name):
+            if metric.name not in described:
+                described.add(metric.name)
+                lines.append(f"# HELP {metric.name} {metric.help or metric.name}")
+                lines.append(f"# TYPE {metric.name} {metric.kind}")
+            if isinstance(metric, Histogram):
+                counts, total = metric.snapshot()
+                cumulative, index = 0, 0
+                for bound in EXPORT_BOUNDS:
+                    while index < NUM_BUCKETS and bucket_bounds(index)[1] <= bound * 1e9:
+                        cumulative += counts[index]
+                        index += 1
+                    lines.append(f"{metric.name}_bucket{_labels(metric.labels, le=f'{bound:g}')} {cumulative}")
+                lines.append(f"{metric.name}_bucket{_labels(metric.labels, le='+Inf')} {sum(counts)}")
+                lines.append(f"{metric.name}_sum{_labels(metric.labels)} {total:.9f}")
+                lines.append(f"{metric.name}_count{_labels(metric.labels)} {sum(counts)}")
+            else:
+                lines.append(f"{metric.name}{_labels(metric.labels)} {metric.value:g}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels: dict, **extra) -> str:
+    merged = {**labels, **extra}
+    if not merged:
+        return ""
+    body = ",".join(f'{k}="{str(v)}"' for k, v in merged.items())
+    return "{" + body + "}"
+
+
+REGISTRY = Registry()
+
+TICK_TO_SIGNAL = REGISTRY.histogram("tick_to_signal_seconds", "Market data receipt to trading signal.")
+SIGNAL_TO_SUBMIT = REGISTRY.histogram("signal_to_submit_seconds", "Trading signal to order submission.")
+ORDER_ACK = REGISTRY.histogram("order_ack_seconds", "Order submission to exchange acknowledgement.")
+SUBMIT_TO_FILL = REGISTRY.histogram("submit_to_fill_seconds", "Order submission_datetime to filled_datetime.")
+DB_WRITE = REGISTRY.histogram("db_write_seconds", "One batched database write transaction.")
+
+
+def observe_fills(orders) -> None:
+    """Records submit -> fill latency for filled Order rows (anything with both datetimes)."""
+    for order in orders:
+        if order.submission_datetime is not None and order.filled_datetime is not None:
+            SUBMIT_TO_FILL.observe((order.filled_datetime - order.submission_datetime).total_seconds())
+
+
+def instrument_methods(target, names=None, metric: str = "call_seconds", registry: Registry = REGISTRY) -> list:
+    """
+    Wraps methods of a class (or one instance) so every call is timed into
+    `metric{class=..., method=...}`. Coroutine methods are timed until they complete.
+
+    `names` defaults to every public method defined on the class itself. Returns the names wrapped;
+    calling twice does not wrap twice.
+    """
+    cls = target if inspect.isclass(target) else type(target)
+    if names is None:
+        names = [n for n, v in vars(cls).items() if not n.startswith("_") and inspect.isfunction(v)]
+
+    wrapped = []
+    for name in names:
+        method = getattr(target, name)
+        if getattr(method, "__instrumented__", False):
+            continue
+        histogram = registry.histogram(metric, "Method call latency.", **{"class": cls.__name__, "method": name})
+        function = method.__func__ if inspect.ismethod(method) and not inspect.isclass(target) else method
+
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def timed(*args, _function=function, _histogram=histogram, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return await _function(*args, **kwargs)
+                finally:
+                    _histogram.observe(time.perf_counter() - started)
+        else:
+            @functools.wraps(function)
+            def timed(*args, _function=function, _histogram=histogram, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return _function(*args, **kwargs)
+                finally:
+                    _histogram.observe(time.perf_counter() - started)
+
+        timed.__instrumented__ = True
+        setattr(target, name, timed if inspect.isclass(target) else timed.__get__(target))
+        wrapped.append(name)
+    return wrapped
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.registry.to_prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+def start_http_server(port: int = DEFAULT_PORT, host: str = "127.0.0.1",
+                      registry: Registry = REGISTRY) -> ThreadingHTTPServer:
+    """Serves /metrics from a daemon thread; call .shutdown() on the result to stop it."""
+    handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    logger.info(f"Serving metrics on http://{host}:{server.server_address[1]}/metrics")
+    return server
+
+
+def parse_prometheus(text: str) -> dict:
+    """
+    Reads histograms back from the text format: {(name, labels): (bounds, cumulative counts, sum)},
+    labels as a sorted tuple without `le`. Used by the dashboard, which runs in another process.
+    """
+    series = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        head, value = line.rsplit(" ", 1)
+        name, _, raw = head.partition("{")
+        labels = dict(part.split("=", 1) for part in raw.rstrip("}").split(",") if part) if raw else {}
+        labels = {k: v.strip('"') for k, v in labels.items()}
+        le = labels.pop("le", None)
+        for suffix in ("_bucket", "_sum", "_count"):
+            if name.endswith(suffix):
+                base = name[:-len(suffix)]
+                entry = series.setdefault((base, tuple(sorted(labels.items()))), ([], [], 0.0))
+                if suffix == "_bucket":
+                    entry[0].append(float(le))
+                    entry[1].append(float(value))
+                elif suffix == "_sum":
+                    series[(base, tuple(sorted(labels.items())))] = (entry[0], entry[1], float(value))
+                break
+    return series
+
+
+def bucket_quantile(q: float, bounds: list, cumulative: list) -> float:
+    """Prometheus-style quantile from cumulative buckets, interpolating linearly within a bucket."""
+    total = cumulative[-1] if cumulative else 0
+    if not total:
+        return float("nan")
+    rank, previous_bound, previous_count = q * total, 0.0, 0.0
+    for bound, count in zip(bounds, cumulative):
+        if count >= rank:
+            if bound == float("inf"):
+                return previous_bound
+            width = count - previous_count
+            return previous_bound + (bound - previous_bound) * ((rank - previous_count) / width if width else 1.0)
+        previous_bound, previous_count = bound, count
+    return previous_bound
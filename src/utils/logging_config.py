@@ -7,10 +7,18 @@
 """
 
 import os
+import queue
+import atexit
 import logging
+import datetime
 import traceback
 from logging.config import dictConfig
-from src.core.application_constants import LOGGING_LEVEL, EMAIL_SECRET, EMAIL_ADDRESS, EMAIL_TO_ADDRESS
+from logging.handlers import QueueHandler, QueueListener
+
+import orjson
+
+from src.core.application_constants import settings
+from src.utils.enums import LogOverflowPolicy
 
 try:
     from pythonjsonlogger import jsonlogger
@@ -22,13 +30,111 @@ except ImportError:
 DEFAULT_LOG_FILENAME = 'app.log'
 DEFAULT_MAX_BYTES = 5 * 1024 * 1024  # 5 MB
 DEFAULT_BACKUP_COUNT = 5
+DEFAULT_QUEUE_SIZE = 10_000
 SUPPRESSED_LOGGERS = ['seleniumwire', 'imapclient', 'imapclient.imaplib', 'urllib3', 'WDM',
                       'undetected_chromedriver', 'selenium', 'faker.factory', 'hpack']
 
+# LogRecord attributes that are not user-supplied `extra` fields.
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_listener = None
+
 
-def get_log_config(log_dir, filename=DEFAULT_LOG_FILENAME, use_json=False, enable_email=False):
-    """Return the logging config dictionary."""
-    formatter_type = 'json' if use_json and JSON_LOGGING_AVAILABLE else 'default'
+class OrjsonFormatter(logging.Formatter):
+    """
+    One JSON object per record, serialised with orjson.
+
+    Emits timestamp, level, logger, function and message plus any `extra` fields; values orjson
+    cannot serialise natively are rendered with str().
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "function": record.funcName,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = record.stack_info
+        return orjson.dumps(entry, default=str).decode()
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler for a bounded queue that applies an overflow policy instead of raising queue.Full.
+
+    Only records below WARNING are ever dropped; warnings and errors wait for room, and DROP_OLDEST
+    evicts the oldest queued record below WARNING (dropping the new one if there is none). Dropped
+    records are counted, and the next record that gets through (or stop_logging) is preceded by a
+    WARNING saying how many were lost, so gaps are visible in every sink.
+    """
+
+    def __init__(self, log_queue: queue.Queue, overflow: LogOverflowPolicy = LogOverflowPolicy.DROP_NEW):
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.dropped = 0
+        self._reported = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.dropped > self._reported:
+            self._report_drops()
+        if self.overflow is LogOverflowPolicy.BLOCK or record.levelno >= logging.WARNING:
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow is LogOverflowPolicy.DROP_OLDEST:
+                self._replace_oldest(record)
+            with self.lock:  # handle() holds it too, but enqueue may be called directly
+                self.dropped += 1
+
+    def _replace_oldest(self, record: logging.LogRecord) -> bool:
+        """Swaps the oldest queued record below WARNING for `record`, under the queue's own mutex."""
+        with self.queue.mutex:
+            pending = self.queue.queue
+            for k, queued in enumerate(pending):
+                if queued.levelno < logging.WARNING:
+                    del pending[k]
+                    pending.append(record)
+                    self.queue.not_empty.notify()
+                    return True
+        return False
+
+    def _report_drops(self, block: bool = False) -> None:
+        with self.lock:
+            lost = self.dropped - self._reported
+            notice = logging.LogRecord(__name__, logging.WARNING, __file__, 0,
+                                       f"Log queue full: {lost} records dropped ({self.overflow.value}).", None, None)
+            try:
+                self.queue.put(notice, block=block)
+                self._reported += lost
+            except queue.Full:
+                pass
+
+
+def get_log_config(log_dir, filename=DEFAULT_LOG_FILENAME, use_json=False, enable_email=False,
+                   json_backend='python-json-logger'):
+    """
+    Return the logging config dictionary.
+
+    `json_backend` picks the use_json formatter: 'python-json-logger' or 'orjson'. The former falls
+    back to orjson when python-json-logger is not installed.
+    """
+    if use_json and (json_backend == 'orjson' or not JSON_LOGGING_AVAILABLE):
+        formatter_type = 'orjson'
+    else:
+        formatter_type = 'json' if use_json else 'default'
 
     config = {
         'version': 1,
@@ -53,7 +159,7 @@ def get_log_config(log_dir, filename=DEFAULT_LOG_FILENAME, use_json=False, enabl
             },
         },
         'root': {
-            'level': LOGGING_LEVEL,
+            'level': settings.get("LOGGING_LEVEL", default="INFO"),
             'handlers': ['file', 'stream']
         },
     }
@@ -64,15 +170,16 @@ def get_log_config(log_dir, filename=DEFAULT_LOG_FILENAME, use_json=False, enabl
             'format': '%(asctime)s | %(levelname)s | %(name)s | %(funcName)s | %(message)s',
             'datefmt': '%Y-%m-%d %H:%M:%S'
         }
+    config['formatters']['orjson'] = {'()': OrjsonFormatter}
 
     if enable_email:
         config['handlers']['email'] = {
             'class': 'logging.handlers.SMTPHandler',
             'mailhost': ('smtp.gmail.com', 587),
-            'fromaddr': EMAIL_ADDRESS,
-            'toaddrs': [EMAIL_TO_ADDRESS],
+            'fromaddr': settings.get("EMAIL_ADDRESS"),
+            'toaddrs': [settings.get("EMAIL_TO_ADDRESS")],
             'subject': 'Critical Error in Application',
-            'credentials': (EMAIL_ADDRESS, EMAIL_SECRET),
+            'credentials': (settings.get("EMAIL_ADDRESS"), settings.get("EMAIL_SECRET")),
             'secure': (),
             'level': 'CRITICAL',
             'formatter': 'default',
@@ -87,21 +194,58 @@ def suppress_noise_loggers(logger_names):
         logging.getLogger(name).setLevel(logging.ERROR)
 
 
-def init_logging(save_location='logs', use_json=False, enable_email=False):
-    """Setup application-wide logging."""
+def stop_logging():
+    """Stops the queue listener, if any, after it has written every queued record."""
+    global _listener
+    if _listener is not None:
+        for handler in logging.root.handlers:
+            if isinstance(handler, BoundedQueueHandler) and handler.dropped > handler._reported:
+                handler._report_drops(block=True)
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def _enable_queue(queue_size, overflow):
+    """Moves the root logger's handlers behind a bounded queue served by a background thread."""
+    global _listener
+    sinks = list(logging.root.handlers)
+    log_queue = queue.Queue(maxsize=queue_size)
+    logging.root.handlers.clear()
+    logging.root.addHandler(BoundedQueueHandler(log_queue, overflow))
+    _listener = QueueListener(log_queue, *sinks, respect_handler_level=True)
+    _listener.start()
+    atexit.unregister(stop_logging)
+    atexit.register(stop_logging)
+
+
+def init_logging(save_location='logs', use_json=False, enable_email=False, queued=False,
+                 queue_size=DEFAULT_QUEUE_SIZE, overflow=LogOverflowPolicy.DROP_NEW, json_backend='python-json-logger'):
+    """
+    Setup application-wide logging.
+
+    With `queued=True` the file, stream and email handlers run on a QueueListener thread and a log
+    call only enqueues the record, so hot paths never wait on disk or SMTP. The queue holds at most
+    `queue_size` records; `overflow` decides what happens when it is full.
+    """
     try:
         log_dir = os.path.join(save_location)
         os.makedirs(log_dir, exist_ok=True)
 
+        stop_logging()
         logging.root.handlers.clear()
 
         config = get_log_config(
             log_dir=log_dir,
             use_json=use_json,
-            enable_email=enable_email
+            enable_email=enable_email,
+            json_backend=json_backend,
         )
         dictConfig(config)
         suppress_noise_loggers(SUPPRESSED_LOGGERS)
+        if queued:
+            _enable_queue(queue_size, LogOverflowPolicy(overflow))
 
         logging.getLogger(__name__).info("Logging initialized successfully.")
 